@@ -4,12 +4,35 @@
 
 import sys
 import os
+import argparse
+# First, so that the profiler clock starts before PyQt6 and the rest of the application are imported
+from modules.core.profiler import profiler  # pylint: disable=wrong-import-order
 from loguru import logger
 from PyQt6.QtWidgets import QApplication
 
+from modules.core.startup_cache import StartupCache
+from modules.config.backends import DEFAULT_DATABASE_PATH, SqliteBackend
 from modules.config.config import Config
 from modules.core.main_window import MainWindow
 
+def parse_arguments(argv=None):
+    """
+    Parse the command-line options understood by the application.
+
+    Unknown options are ignored so that Qt options (e.g. -platform) still reach QApplication.
+    """
+    parser = argparse.ArgumentParser(description="PyQt6ify Pro")
+    parser.add_argument('--profile-startup', nargs='?', const='', default=None, metavar='PATH',
+                        help="write a Chrome trace of the startup phases (default: [Application] profile_output)")
+    parser.add_argument('--quit-after-startup', action='store_true',
+                        help="exit as soon as startup has completed, e.g. for benchmarks")
+    parser.add_argument('--config-store', choices=('ini', 'sqlite'), default='ini',
+                        help="keep the configuration in config/config.ini or in the settings table of the database")
+    parser.add_argument('--database', default=None, metavar='PATH',
+                        help="database file to use instead of modules/database/pyqt6ify.db, e.g. for benchmarks")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 def setup_logging():
     """Configure logging settings."""
     logger.add("logs/debug.log",
@@ -17,23 +40,50 @@ def setup_logging():
                retention="10 days",
                level="DEBUG")
 
+def setup_profiling(args, config):
+    """Enable the startup profiler from the command line or the [Application] section."""
+    enabled = args.profile_startup is not None or config.value('Application', 'profile_startup')
+    if enabled:
+        output_path = args.profile_startup or config.value('Application', 'profile_output')
+        profiler.enable(output_path)
+        logger.info(f"Startup profiling enabled, writing to {output_path}")
+
+def flush_config(config):
+    """Write the configuration changes still waiting for their delayed save, reporting any that were lost."""
+    if not config.flush():
+        logger.error(f"Configuration changes could not be saved: {config.last_write_error}")
+
 def main():
     """Main application entry point."""
     try:
+        args = parse_arguments(sys.argv[1:])
+
         # Initialize logging
-        setup_logging()
+        with profiler.span('main.setup_logging'):
+            setup_logging()
         logger.info("Starting PyQt6ify Pro")
 
-        # Load configuration first
-        config = Config()
+        # Load configuration first; parsed files are reused from the warm-start cache when unchanged
+        backend = SqliteBackend(args.database or DEFAULT_DATABASE_PATH) if args.config_store == 'sqlite' else None
+        config = Config(startup_cache=StartupCache(), backend=backend)
+        if config.created and backend is not None and os.path.exists('config/config.ini'):
+            # First run with the database store: carry over the existing settings
+            config.import_ini('config/config.ini')
+        setup_profiling(args, config)
 
         # Create application instance with dark theme style
         os.environ['QT_STYLE_OVERRIDE'] = 'Fusion'  # Use Fusion style which works well with custom themes
-        app = QApplication(sys.argv)
+        with profiler.span('QApplication'):
+            app = QApplication(sys.argv)
 
         # Create and show main window
-        window = MainWindow(config)
+        with profiler.span('MainWindow'):
+            window = MainWindow(config, database_path=args.database)
         window.show()  # Make sure to show the window
+        if args.quit_after_startup:
+            window.startupCompleted.connect(app.quit)
+        # Write configuration changes still waiting for their delayed save
+        app.aboutToQuit.connect(lambda: flush_config(config))
 
         # Start event loop
         sys.exit(app.exec())
@@ -1,3 +1,60 @@
 """
 PyQt6ify Pro modules package
+
+Subsystems are imported lazily (PEP 562): ``modules.menu`` or
+``from modules.menu import MenuBar`` only loads the menu code when it is first used.
 """
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+SUBPACKAGES = (
+    'about',
+    'config',
+    'core',
+    'dashboard',
+    'database',
+    'error_handling',
+    'menu',
+    'resources',
+    'status_bar',
+    'themes',
+    'toolbar',
+)
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Create module-level __getattr__ and __dir__ functions for a package.
+
+    Args:
+        package (str): Name of the package, usually ``__name__``
+        exports (Dict[str, str]): Maps each exported name to the relative module that defines it
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ functions to assign in the package
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # Cache the value so later lookups don't go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def __getattr__(name: str):
+    """Import a subsystem package the first time it is accessed as an attribute."""
+    if name in SUBPACKAGES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(SUBPACKAGES))
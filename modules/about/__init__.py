@@ -3,7 +3,10 @@
 
 Provides a streamlined interface for showing the About dialog.
 """
+from modules import lazy_exports
 
-from .about import show_about_dialog
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'show_about_dialog': '.about',
+})
 
 __all__ = ['show_about_dialog']
@@ -2,8 +2,11 @@
 Configuration module.
 Handles application configuration and settings management.
 """
+from modules import lazy_exports
 
-
-from modules.config.config import Config, ConfigError
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Config': '.config',
+    'ConfigError': '.config',
+})
 
 __all__ = ['Config', 'ConfigError']
@@ -0,0 +1,288 @@
+"""
+Storage backends for the configuration of PyQt6ify Pro.
+
+A backend loads the raw values of a Config and turns each save into a task for
+the background writer:
+
+    IniBackend     the configuration file; every save rewrites the whole file
+    SqliteBackend  a key/value table such as the settings table of the application
+                   database; a save upserts only the changed keys, in one transaction
+"""
+
+import abc
+import configparser
+import hashlib
+import io
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from loguru import logger
+from modules.core.startup_cache import StartupCache
+from modules.config.writer import DURABILITY_FULL, DURABILITY_NONE, DURABILITY_NORMAL, WriteTask, write_atomic
+
+RawState = Dict[str, Dict[str, str]]
+
+# Application database, next to modules/database/database.py whatever the working directory;
+# Database uses it too, so settings and application data share one file
+DEFAULT_DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     'database', 'pyqt6ify.db')
+
+
+def parse_ini(content: str, source: str = '<string>') -> RawState:
+    """Parse INI text to raw values by section and option, without interpolation."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(content, source=source)
+    return {section: dict(parser.items(section, raw=True)) for section in parser.sections()}
+
+
+def format_ini(state: RawState) -> str:
+    """Format raw values by section and option as INI text."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_dict(state)
+    buffer = io.StringIO()
+    parser.write(buffer)
+    return buffer.getvalue()
+
+
+class ConfigBackend(abc.ABC):
+    """Base class of the places a Config is stored."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): File holding the configuration, watched by Config.watch_file()
+        """
+        self.path = path
+
+    @property
+    def target(self) -> str:
+        """Name under which the writer merges the writes of this backend."""
+        return self.path
+
+    @property
+    def watched_paths(self) -> List[str]:
+        """Files changed when another program changes the stored values."""
+        return [self.path]
+
+    @abc.abstractmethod
+    def load(self) -> Optional[RawState]:
+        """Read the stored values, or return None if nothing is stored yet."""
+
+    @abc.abstractmethod
+    def changes(self) -> Optional[RawState]:
+        """Read the stored values if another program changed them since the last load or write.
+
+        Returns:
+            dict: All stored values, or None if they did not change or cannot be read.
+        """
+
+    @abc.abstractmethod
+    def write_task(self, state: RawState, changed: Set[Tuple[str, str]], durability: str) -> WriteTask:
+        """
+        Capture a save and return the task that writes it on the writer thread.
+
+        Args:
+            state (dict): All raw values of the configuration
+            changed (set): (section, option) pairs changed since the last save
+            durability (str): One of DURABILITY_LEVELS
+
+        Returns:
+            Callable: Task to queue on the ConfigWriter
+        """
+
+    def close(self) -> None:
+        """Release the resources of the backend."""
+
+
+class IniBackend(ConfigBackend):
+    """Stores the configuration in an INI file, replaced atomically on every save."""
+
+    def __init__(self, path: str, startup_cache: Optional[StartupCache] = None):
+        """
+        Args:
+            path (str): Configuration file
+            startup_cache (StartupCache, optional): Warm-start cache holding the parsed file
+        """
+        super().__init__(path)
+        self.startup_cache = startup_cache
+        self._digest: Optional[str] = None  # Digest of the content last read or written by us
+
+    def load(self) -> Optional[RawState]:
+        if not os.path.exists(self.path):
+            return None
+        if self.startup_cache is not None:
+            state = self.startup_cache.get('config', [self.path])
+            if state is not None:
+                return state
+        with open(self.path, 'rb') as f:
+            content = f.read()
+        state = parse_ini(content.decode('utf-8'), source=self.path)
+        self._digest = hashlib.sha256(content).hexdigest()
+        if self.startup_cache is not None:
+            self.startup_cache.put('config', [self.path], state)
+        return state
+
+    def changes(self) -> Optional[RawState]:
+        try:
+            with open(self.path, 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"Cannot reload configuration: {str(e)}")
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        if digest == self._digest:
+            return None
+        try:
+            state = parse_ini(content.decode('utf-8'), source=self.path)
+        except (configparser.Error, UnicodeDecodeError) as e:
+            logger.error(f"Ignoring unreadable configuration change: {str(e)}")
+            return None
+        self._digest = digest
+        if self.startup_cache is not None:
+            self.startup_cache.put('config', [self.path], state)
+        return state
+
+    def write_task(self, state: RawState, changed: Set[Tuple[str, str]], durability: str) -> WriteTask:
+        path = self.path
+        data = format_ini(state)
+
+        def write() -> None:
+            write_atomic(path, data, durability)
+            # Text mode wrote the newlines as os.linesep
+            self._digest = hashlib.sha256(data.replace('\n', os.linesep).encode('utf-8')).hexdigest()
+            if self.startup_cache is not None:
+                self.startup_cache.put('config', [path], state)
+
+        return write
+
+
+class SqliteBackend(ConfigBackend):
+    """
+    Stores the configuration in a key/value table of an SQLite database.
+
+    Each key is stored as 'section.option'. Saves queued before the writer runs
+    are merged, so a burst of changes becomes one transaction of upserts.
+    """
+
+    _SYNCHRONOUS = {DURABILITY_NONE: 'OFF', DURABILITY_NORMAL: 'NORMAL', DURABILITY_FULL: 'FULL'}
+
+    def __init__(self, path: str = DEFAULT_DATABASE_PATH, table: str = 'settings'):
+        """
+        Args:
+            path (str): Database file
+            table (str): Table with 'key' and 'value' text columns, created if missing
+        """
+        super().__init__(path)
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = None
+        self._data_version: Optional[int] = None
+        self._pending_rows: Dict[str, Optional[str]] = {}  # key -> value; None deletes the key
+        self._commit_listeners: List[Callable[[str], None]] = []
+
+    def add_commit_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Call a function after each write of the table is committed, e.g. to drop cached query results.
+
+        Args:
+            callback (Callable): Called with the table name, on the writer thread
+        """
+        with self._lock:
+            self._commit_listeners.append(callback)
+
+    def remove_commit_listener(self, callback: Callable[[str], None]) -> None:
+        """Stop calling a function given to add_commit_listener()."""
+        with self._lock:
+            if callback in self._commit_listeners:
+                self._commit_listeners.remove(callback)
+
+    @property
+    def target(self) -> str:
+        return f"{self.path}:{self.table}"
+
+    @property
+    def watched_paths(self) -> List[str]:
+        # In WAL mode, which Database sets on the application database, a commit only
+        # changes the -wal file until the next checkpoint
+        return [self.path, f"{self.path}-wal"]
+
+    def _connect(self):
+        """Open the connection on first use; the caller holds the lock."""
+        if self._connection is None:
+            import sqlite3  # Only needed by this backend; kept off the startup path
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Used from the GUI thread for reads and from the writer thread for writes
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, value TEXT)")
+        return self._connection
+
+    def _read_rows(self) -> RawState:
+        """Read the whole table and remember the data version it was read at."""
+        connection = self._connect()
+        state: RawState = {}
+        for key, value in connection.execute(f"SELECT key, value FROM {self.table}"):
+            section, separator, option = key.partition('.')
+            if separator and value is not None:
+                state.setdefault(section, {})[option] = value
+        self._data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        return state
+
+    def load(self) -> Optional[RawState]:
+        with self._lock:
+            state = self._read_rows()
+        return state or None
+
+    def changes(self) -> Optional[RawState]:
+        import sqlite3
+        try:
+            with self._lock:
+                # data_version only moves when another connection commits
+                version = self._connect().execute("PRAGMA data_version").fetchone()[0]
+                if version == self._data_version:
+                    return None
+                return self._read_rows()
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot reload configuration: {str(e)}")
+            return None
+
+    def write_task(self, state: RawState, changed: Set[Tuple[str, str]], durability: str) -> WriteTask:
+        with self._lock:
+            for section, option in changed:
+                self._pending_rows[f"{section}.{option}"] = state.get(section, {}).get(option)
+        return lambda: self._write_rows(durability)
+
+    def _write_rows(self, durability: str) -> None:
+        """Write every pending row in one transaction, on the writer thread."""
+        with self._lock:
+            rows = self._pending_rows
+            self._pending_rows = {}
+            if not rows:
+                return
+            connection = self._connect()
+            connection.execute(f"PRAGMA synchronous = {self._SYNCHRONOUS[durability]}")
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                    [(key, value) for key, value in rows.items() if value is not None])
+                connection.executemany(
+                    f"DELETE FROM {self.table} WHERE key = ?",
+                    [(key,) for key, value in rows.items() if value is None])
+            listeners = list(self._commit_listeners)
+        logger.debug(f"Wrote {len(rows)} configuration keys to {self.target}")
+        for callback in listeners:
+            try:
+                callback(self.table)
+            except Exception as e:
+                logger.error(f"Error in configuration commit listener: {str(e)}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
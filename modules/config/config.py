@@ -2,77 +2,215 @@
 Configuration management module for PyQt6ify Pro.
 """
 
+import atexit
 import configparser
-import os
-from typing import Any, Dict
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from loguru import logger
+from modules.core.profiler import profiler
+from modules.core.startup_cache import StartupCache
+from modules.config.backends import ConfigBackend, IniBackend, format_ini, parse_ini
+from modules.config.schema import SCHEMA, default_config, get_option
+from modules.config.schema import validate as validate_schema
+from modules.config.writer import ConfigWriter, flush_default_writer, get_default_writer, write_atomic
 
 
 class ConfigError(Exception):
     """Custom exception for configuration-related errors."""
 
 
+# Seconds to wait after a change before writing the file
+DEFAULT_SAVE_DELAY = 0.5
+
+# Retries of a failed write, each after twice the delay of the previous one
+MAX_SAVE_RETRIES = 5
+
+# Configurations with a delayed save that has not been written yet
+_pending_saves: 'weakref.WeakSet[Config]' = weakref.WeakSet()
+
+
+def flush_pending_saves() -> None:
+    """Write the delayed saves of every configuration. Runs automatically at exit."""
+    for config in list(_pending_saves):
+        try:
+            config.flush()
+        except ConfigError:
+            pass  # Already logged
+    flush_default_writer()
+
+
+atexit.register(flush_pending_saves)
+
+
 class Config:
     """Configuration class for PyQt6ify Pro."""
 
-    def __init__(self, config_file: str = "config/config.ini"):
+    def __init__(self, config_file: str = "config/config.ini", startup_cache: Optional[StartupCache] = None,
+                 save_delay: float = DEFAULT_SAVE_DELAY, writer: Optional[ConfigWriter] = None,
+                 backend: Optional[ConfigBackend] = None):
         """Initialize the configuration.
 
         Args:
             config_file (str): Path to the configuration file.
+            startup_cache (StartupCache, optional): Warm-start cache holding the parsed file.
+            save_delay (float): Seconds to wait after a change before writing the file, so that
+                changes made in quick succession are written once. 0 writes on every change.
+            writer (ConfigWriter, optional): Background writer for the file. Defaults to the shared writer.
+            backend (ConfigBackend, optional): Where the values are stored, e.g. a SqliteBackend.
+                Defaults to an IniBackend for config_file.
         """
-        self.config_file = config_file
+        self.backend = backend if backend is not None else IniBackend(config_file, startup_cache)
+        self.startup_cache = startup_cache
+        self.save_delay = save_delay
+        self.writer = writer if writer is not None else get_default_writer()
         self.config = configparser.ConfigParser()
-        self._last_saved_state = None  # Track the last saved state to avoid redundant writes
-
-        # Default settings
-        self.default_config = {
-            'Application': {
-                'Name': 'PyQt6ify Pro',
-                'Version': '1.0.0',
-                'Debug': 'False',
-            },
-            'About': {
-                'Author': 'PyQt6ify Team',
-                'Description': 'Feature-rich PyQt6 application template.',
-                'Website': 'https://github.com/elirancv/PyQt6ify-Pro',
-                'Icon': 'resources/icons/app.png',
-            },
-            'Modules': {
-                'logging': 'True',
-                'database': 'True',
-                'menu': 'True',
-                'toolbar': 'True',
-                'status_bar': 'True',
-            },
-            'Window': {
-                'start_maximized': 'True',
-                'screen_width': '1024',
-                'screen_height': '768',
-                'theme': 'light',
-            },
-        }
+        self._dirty: Set[Tuple[str, str]] = set()  # (section, option) changed since the last save
+        self.version = 0  # Incremented on every change of a value
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        self._failed_writes = 0  # Consecutive failed writes
+        self.last_write_error: Optional[Exception] = None  # Error of the last write, None once one succeeds
+
+        self._typed: Dict[tuple, Any] = {}  # Parsed values, dropped when their key is set
+        self.problems: List[str] = []  # Schema violations found at load
+        self._notifier = None  # Created by the first subscribe()
+        self._watcher = None  # Created by watch_file()
+        self.created = False  # True if load() found nothing stored and wrote the defaults
+
+        # Default settings, as declared in the schema
+        self.default_config = default_config()
 
         # Load the configuration file
         self.load()
 
+    @property
+    def config_file(self) -> str:
+        """File holding the configuration: the INI file, or the database of a SqliteBackend."""
+        return self.backend.path
+
+    @config_file.setter
+    def config_file(self, path: str) -> None:
+        self.backend.path = path
+
+    @profiler.profile('Config.load')
     def load(self) -> None:
-        """Load configuration from file and ensure defaults are applied."""
+        """Load configuration from the backend and ensure defaults are applied."""
         try:
-            if not os.path.exists(self.config_file):
+            state = self.backend.load()
+            if state is None:
                 logger.warning(f"Configuration file not found. Creating defaults: {self.config_file}")
+                self.created = True
                 self._apply_defaults()
+                self._parse_all()
                 self.save()
                 return
 
-            self.config.read(self.config_file, encoding='utf-8')
+            self.config.read_dict(state)
             self._apply_defaults()
+            # Defaults missing from the file are used in memory but not written until something changes
+            self._dirty.clear()
+            self._parse_all()
             logger.info("Configuration loaded successfully")
 
         except Exception as e:
             logger.error(f"Failed to load configuration: {str(e)}")
             raise ConfigError(f"Failed to load configuration: {str(e)}") from e
 
+    def _parse_all(self) -> None:
+        """Validate every value declared in the schema and cache its parsed form.
+
+        Invalid values are reported in self.problems and read as their default.
+        """
+        with self._lock:
+            self._typed.clear()
+            self.problems = []
+            for section, declared in SCHEMA.items():
+                options = [name.lower() for name in declared.options]
+                if declared.extra is not None and self.config.has_section(section):
+                    options += [name for name in self.config.options(section) if name not in options]
+                for option in options:
+                    self._parse_value(section, option)
+            for problem in self.problems:
+                logger.warning(f"Configuration problem: {problem}")
+
+    def _parse_value(self, section: str, option: str) -> Any:
+        """Parse one value according to the schema and cache it."""
+        key = (section, option.lower())
+        with self._lock:
+            if key in self._typed:
+                return self._typed[key]
+            declared = get_option(section, option)
+            if declared is None:
+                raise ConfigError(f"{section}.{option} is not declared in the configuration schema")
+            raw = self.get(section, option)
+            value = declared.default
+            if raw is not None:
+                try:
+                    value = declared.parse(raw)
+                except ValueError as e:
+                    self.problems.append(f"{section}.{option} {str(e)}")
+                    logger.debug(f"Using default for {section}.{option}: {declared.default!r}")
+            self._typed[key] = value
+            return value
+
+    def value(self, section: str, option: str) -> Any:
+        """Get a value parsed to the type declared in the schema.
+
+        Values are parsed once and cached until they are set again, so repeated
+        reads cost a dictionary lookup; use lower-case option names for the
+        fastest path. Missing or invalid values read as the declared default.
+
+        Raises:
+            ConfigError: If the option is not declared in the schema.
+        """
+        try:
+            return self._typed[section, option]
+        except KeyError:
+            return self._parse_value(section, option)
+
+    @property
+    def notifier(self):
+        """ConfigNotifier emitting keyChanged and sectionChanged, created on first use.
+
+        It delivers notifications on the thread that first asked for it, so ask from the GUI thread.
+        """
+        if self._notifier is None:
+            from modules.config.notifier import ConfigNotifier
+            self._notifier = ConfigNotifier(self)
+        return self._notifier
+
+    def subscribe(self, section: str, option: Optional[str], callback, owner=None) -> int:
+        """Call a function when a key, or any key of a section, changes.
+
+        Changes are coalesced: however many times the key is set, the callback runs
+        once per event-loop turn, with the value current at that time.
+
+        Args:
+            section (str): Section to watch.
+            option (str, optional): Key to watch, or None for the whole section.
+            callback (Callable): Called with the new (typed, if declared) value of the key,
+                or with the set of changed options when watching a section.
+            owner (QObject, optional): The subscription ends when this object is destroyed.
+
+        Returns:
+            int: Handle for unsubscribe().
+        """
+        return self.notifier.subscribe(section, option, callback, owner)
+
+    def unsubscribe(self, handle: int) -> None:
+        """End a subscription made with subscribe()."""
+        if self._notifier is not None:
+            self._notifier.unsubscribe(handle)
+
+    def _invalidate(self, section: str, option: str) -> None:
+        """Drop the parsed forms of a value."""
+        option = option.lower()
+        for key in ((section, option), (section, option, 'int'), (section, option, 'bool')):
+            self._typed.pop(key, None)
+
     def _apply_defaults(self) -> None:
         """Ensure all default sections and options exist in the configuration."""
         for section, options in self.default_config.items():
@@ -80,33 +218,311 @@ def _apply_defaults(self) -> None:
                 self.config.add_section(section)
             for option, value in options.items():
                 if not self.config.has_option(section, option):
-                    self.config.set(section, option, value)
+                    self._set_value(section, option, value)
+
+    def _set_value(self, section: str, option: str, value: str) -> bool:
+        """Store a raw string value, marking the key dirty if it changed.
+
+        All writes to the parser go through here so that save() knows what changed.
+
+        Returns:
+            bool: True if the stored value changed
+        """
+        option = self.config.optionxform(option)
+        with self._lock:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            elif self.config.get(section, option, raw=True, fallback=None) == value:
+                return False
+            self.config.set(section, option, value)
+            self._invalidate(section, option)
+            self._dirty.add((section, option))
+            self.version += 1
+            if self._notifier is not None:
+                self._notifier.notify(section, option)
+            return True
+
+    def is_dirty(self) -> bool:
+        """Return True if some values changed since the last save."""
+        return bool(self._dirty)
+
+    def dirty_keys(self) -> Set[Tuple[str, str]]:
+        """Get the (section, option) pairs changed since the last save."""
+        with self._lock:
+            return set(self._dirty)
+
+    def dirty_sections(self) -> Set[str]:
+        """Get the sections with values changed since the last save."""
+        with self._lock:
+            return {section for section, _ in self._dirty}
+
+    @property
+    def durability(self) -> str:
+        """Durability level of saves, from Application.save_durability."""
+        return self.value('Application', 'save_durability')
 
     def save(self) -> None:
-        """Save configuration to file, avoiding redundant writes."""
+        """Save configuration to the backend, avoiding redundant writes.
+
+        The content is captured here and written by the background writer: an INI
+        file is replaced atomically, so a crash never leaves it truncated, and a
+        SqliteBackend writes the changed keys in one transaction. Use flush() to
+        wait until they are on disk.
+        """
+        with self._lock:
+            self._cancel_scheduled_save()
+            try:
+                if not self._dirty:
+                    logger.debug("No changes detected; skipping save")
+                    return
+                changed = set(self._dirty)
+                task = self.backend.write_task(self._raw_state(), changed, self.durability)
+                self.writer.submit_task(self.backend.target, task,
+                                        lambda error: self._on_written(changed, error))
+                self._dirty.clear()
+                logger.debug(f"Configuration queued for saving (changed: "
+                             f"{', '.join(sorted({section for section, _ in changed}))})")
+            except Exception as e:
+                logger.error(f"Error saving configuration: {str(e)}")
+                raise ConfigError(f"Failed to save configuration: {str(e)}") from e
+
+    def _on_written(self, changed: Set[Tuple[str, str]], error: Optional[Exception]) -> None:
+        """Handle the end of a background write, on the writer thread."""
+        with self._lock:
+            self.last_write_error = error
+            if error is None:
+                self._failed_writes = 0
+            else:
+                # Keep the keys dirty and try again later; the next change, flush() and the exit hook also retry
+                self._dirty |= changed
+                self._failed_writes += 1
+                if self._failed_writes <= MAX_SAVE_RETRIES:
+                    self.schedule_save(max(self.save_delay, DEFAULT_SAVE_DELAY) * 2 ** (self._failed_writes - 1))
+                elif self._failed_writes == MAX_SAVE_RETRIES + 1:
+                    logger.error(f"Giving up saving configuration after {self._failed_writes} failed writes; "
+                                 f"changes are kept until the next change or flush()")
+                return
+        logger.info("Configuration saved successfully")
+
+    def reload_from_file(self) -> Set[Tuple[str, str]]:
+        """Apply changes made to the stored configuration by another program.
+
+        The stored values are compared with the values in memory; only the keys
+        that differ are updated and announced to subscribers. Keys changed here
+        and not saved yet keep their local value. Storage that still holds what
+        this configuration last wrote is not parsed at all.
+
+        Returns:
+            Set[Tuple[str, str]]: The (section, option) pairs that were updated.
+        """
+        with self._lock:
+            new_state = self.backend.changes()
+            if new_state is None:
+                return set()
+            for section, options in self.default_config.items():
+                for option, value in options.items():
+                    new_state.setdefault(section, {}).setdefault(self.config.optionxform(option), value)
+            current_state = self._raw_state()
+
+            changed = set()
+            for section in set(current_state) | set(new_state):
+                old_values = current_state.get(section, {})
+                new_values = new_state.get(section, {})
+                for option in set(old_values) | set(new_values):
+                    if (section, option) in self._dirty or old_values.get(option) == new_values.get(option):
+                        continue
+                    self._apply_external(section, option, new_values.get(option))
+                    changed.add((section, option))
+        if changed:
+            logger.info(f"Configuration reloaded: {', '.join(f'{s}.{o}' for s, o in sorted(changed))}")
+        return changed
+
+    def _apply_external(self, section: str, option: str, value: Optional[str]) -> None:
+        """Store a value read from the file without marking it dirty; None removes the key."""
+        if value is None:
+            self.config.remove_option(section, option)
+        else:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            self.config.set(section, option, value)
+        self._invalidate(section, option)
+        self.version += 1
+        if self._notifier is not None:
+            self._notifier.notify(section, option)
+
+    def watch_file(self, debounce_ms: int = 100):
+        """Reload changes made to the stored configuration by other programs while the application runs.
+
+        Must be called from a thread with a Qt event loop, normally the GUI thread.
+
+        Returns:
+            ConfigFileWatcher: The watcher, whose reloaded signal reports each reload.
+        """
+        if self._watcher is None:
+            from modules.config.watcher import ConfigFileWatcher
+            self._watcher = ConfigFileWatcher(self, debounce_ms)
+        return self._watcher
+
+    def export_ini(self, path: str) -> None:
+        """Write all current values to an INI file, whatever the backend.
+
+        Args:
+            path (str): File to write; it is replaced atomically.
+        """
+        with self._lock:
+            data = format_ini(self._raw_state())
+        try:
+            write_atomic(path, data, self.durability)
+        except OSError as e:
+            logger.error(f"Error exporting configuration to {path}: {str(e)}")
+            raise ConfigError(f"Failed to export configuration: {str(e)}") from e
+        logger.info(f"Configuration exported to {path}")
+
+    def import_ini(self, path: str) -> None:
+        """Set every value found in an INI file, e.g. to move an existing config.ini to a SqliteBackend.
+
+        The values are set in one batch, so they are saved together.
+
+        Args:
+            path (str): File to read.
+        """
         try:
-            current_state = self._current_state()
-            if current_state == self._last_saved_state:
-                logger.debug("No changes detected; skipping save")
+            with open(path, encoding='utf-8') as f:
+                state = parse_ini(f.read(), source=path)
+        except (OSError, configparser.Error, UnicodeDecodeError) as e:
+            logger.error(f"Error importing configuration from {path}: {str(e)}")
+            raise ConfigError(f"Failed to import configuration: {str(e)}") from e
+        with self.batch():
+            for section, options in state.items():
+                for option, value in options.items():
+                    self.set(section, option, value)
+        logger.info(f"Configuration imported from {path}")
+
+    def _cancel_scheduled_save(self) -> None:
+        """Stop the pending delayed save, if any."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+            _pending_saves.discard(self)
+
+    def _scheduled_save(self) -> None:
+        """Run a delayed save on the timer thread."""
+        try:
+            self.save()
+        except ConfigError:
+            pass  # Already logged; the next change or flush() tries again
+
+    def schedule_save(self, delay: Optional[float] = None) -> None:
+        """Save after the save delay, merging the changes made in the meantime into one write.
+
+        Inside a batch() block the save is postponed until the outermost block ends.
+
+        Args:
+            delay (float, optional): Seconds to wait instead of the save delay.
+        """
+        if delay is None:
+            delay = self.save_delay
+        with self._lock:
+            if self._batch_depth:
+                return
+            if delay <= 0:
+                self.save()
                 return
+            self._cancel_scheduled_save()
+            self._save_timer = threading.Timer(delay, self._scheduled_save)
+            self._save_timer.name = 'config-save'
+            # flush_pending_saves() writes it at exit, so the timer must not keep the process alive
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            _pending_saves.add(self)
 
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+    def has_pending_save(self) -> bool:
+        """Return True if a delayed save has not been handed to the writer yet."""
+        return self._save_timer is not None
 
-            self._last_saved_state = current_state
-            logger.info("Configuration saved successfully")
-        except Exception as e:
-            logger.error(f"Error saving configuration: {str(e)}")
-            raise ConfigError(f"Failed to save configuration: {str(e)}") from e
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Save pending changes now and wait until they are on disk. Call this before the application exits.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait for the writer.
+
+        Returns:
+            bool: False if the timeout expired before the file was written, or if the write
+            failed; the changes then stay dirty and last_write_error tells why.
+        """
+        with self._lock:
+            # Also covers keys put back by a failed write
+            if self._dirty and not self._batch_depth:
+                self.save()
+        if not self.writer.flush(timeout):
+            return False
+        with self._lock:
+            return not (self._dirty and self.last_write_error is not None)
+
+    @contextmanager
+    def batch(self) -> Iterator['Config']:
+        """Group changes so that they are saved together.
+
+        Nothing is written while the block runs. When the outermost block ends the
+        changes are saved once; if it raises, they are rolled back instead.
+
+        Example:
+            with config.batch():
+                config.set('Window', 'screen_width', 1280)
+                config.set('Window', 'screen_height', 720)
+        """
+        with self._lock:
+            outermost = self._batch_depth == 0
+            previous_state = self._raw_state() if outermost else None
+            previous_dirty = set(self._dirty)
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                if outermost:
+                    for section in self.config.sections():
+                        self.config.remove_section(section)
+                    self.config.read_dict(previous_state)
+                    self._dirty = previous_dirty
+                    self._typed.clear()
+                    self.version += 1
+                    # Keys set in the batch were already reported; they are delivered with the restored values
+                    logger.warning("Configuration batch failed; changes rolled back")
+                raise
+            finally:
+                self._batch_depth -= 1
+            if outermost:
+                self.schedule_save()
 
     def _current_state(self) -> Dict[str, Dict[str, Any]]:
-        """Get the current state of the configuration for comparison."""
+        """Get the current values of all sections, with interpolation applied."""
         state = {}
         for section in self.config.sections():
             state[section] = dict(self.config.items(section))
         return state
 
+    def _raw_state(self) -> Dict[str, Dict[str, str]]:
+        """Get all sections and options without interpolation, as stored in the file."""
+        return {section: dict(self.config.items(section, raw=True)) for section in self.config.sections()}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of all sections and options that is safe to hand to another thread."""
+        return self._current_state()
+
+    @staticmethod
+    def validate(state: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Check a configuration snapshot against the schema.
+
+        This only reads the given snapshot, so it can run on a worker thread.
+
+        Args:
+            state (Dict[str, Dict[str, Any]]): Snapshot returned by snapshot().
+
+        Returns:
+            List[str]: A description of each problem found; empty if the configuration is valid.
+        """
+        return validate_schema(state)
+
     def get(self, section: str, option: str, fallback: Any = None) -> Any:
         """Get a value from the configuration."""
         try:
@@ -115,29 +531,44 @@ def get(self, section: str, option: str, fallback: Any = None) -> Any:
             logger.error(f"Error retrieving config value for {section}.{option}: {str(e)}")
             return fallback
 
-    def getboolean(self, section: str, option: str) -> bool:
-        """Get a boolean value from the configuration."""
+    def _get_converted(self, section: str, option: str, kind: str, label: str, convert) -> Any:
+        """Get a value converted by a ConfigParser getter, cached until it is set.
+
+        Declared options that are missing or invalid read as their schema default.
+        """
+        key = (section, option.lower(), kind)
         try:
-            return self.config.getboolean(section, option)
+            return self._typed[key]
+        except KeyError:
+            pass
+        try:
+            with self._lock:
+                self._typed[key] = value = convert(section, option)
+            return value
         except (configparser.NoSectionError, configparser.NoOptionError, ValueError) as e:
-            logger.error(f"Error getting boolean value: {section}.{option}: {str(e)}")
-            raise ConfigError(f"Invalid boolean value for {section}.{option}: {str(e)}") from e
+            declared = get_option(section, option)
+            if declared is None:
+                logger.error(f"Error getting {label} value: {section}.{option}: {str(e)}")
+                raise ConfigError(f"Invalid {label} value for {section}.{option}: {str(e)}") from e
+            logger.warning(f"Using default for {section}.{option}: {str(e)}")
+            with self._lock:
+                self._typed[key] = declared.default
+            return declared.default
+
+    def getboolean(self, section: str, option: str) -> bool:
+        """Get a boolean value from the configuration. The parsed value is cached until it is set."""
+        return self._get_converted(section, option, 'bool', 'boolean', self.config.getboolean)
 
     def getint(self, section: str, option: str) -> int:
-        """Get an integer value from the configuration."""
-        try:
-            return self.config.getint(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError) as e:
-            logger.error(f"Error getting integer value: {section}.{option}: {str(e)}")
-            raise ConfigError(f"Invalid integer value for {section}.{option}: {str(e)}") from e
+        """Get an integer value from the configuration. The parsed value is cached until it is set."""
+        return self._get_converted(section, option, 'int', 'integer', self.config.getint)
 
     def set(self, section: str, option: str, value: Any) -> None:
-        """Set a value in the configuration."""
+        """Set a value in the configuration. The file is written after the save delay."""
         try:
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            self.config.set(section, option, str(value))
-            self.save()
+            with self._lock:
+                if self._set_value(section, option, str(value)):
+                    self.schedule_save()
         except configparser.Error as e:
             logger.error(f"Error setting value: {section}.{option} = {value}: {str(e)}")
             raise ConfigError(f"Failed to set value: {str(e)}") from e
@@ -145,7 +576,8 @@ def set(self, section: str, option: str, value: Any) -> None:
     def get_modules_enabled(self) -> Dict[str, bool]:
         """Get enabled/disabled status of modules."""
         try:
-            return {name: self.getboolean('Modules', name) for name, _ in self.config.items('Modules')}
+            # Invalid switches read as their schema default instead of failing the whole dict
+            return {name: self.value('Modules', name) for name, _ in self.config.items('Modules')}
         except configparser.Error as e:
             logger.error(f"Error retrieving module statuses: {str(e)}")
             raise ConfigError(f"Error retrieving module statuses: {str(e)}") from e
@@ -153,11 +585,9 @@ def get_modules_enabled(self) -> Dict[str, bool]:
     def set_modules_enabled(self, modules: Dict[str, bool]) -> None:
         """Set enabled/disabled status of modules."""
         try:
-            if not self.config.has_section('Modules'):
-                self.config.add_section('Modules')
-            for name, enabled in modules.items():
-                self.config.set('Modules', name, str(enabled))
-            self.save()
+            with self.batch():
+                for name, enabled in modules.items():
+                    self.set('Modules', name, enabled)
         except configparser.Error as e:
             logger.error(f"Error setting modules: {str(e)}")
             raise ConfigError(f"Error setting modules: {str(e)}") from e
@@ -169,11 +599,9 @@ def get_window_settings(self) -> Dict[str, Any]:
     def set_window_settings(self, settings: Dict[str, Any]) -> None:
         """Set window settings."""
         try:
-            if not self.config.has_section('Window'):
-                self.config.add_section('Window')
-            for key, value in settings.items():
-                self.config.set('Window', key, str(value))
-            self.save()
+            with self.batch():
+                for key, value in settings.items():
+                    self.set('Window', key, value)
         except configparser.Error as e:
             logger.error(f"Error updating window settings: {str(e)}")
             raise ConfigError(f"Failed to update window settings: {str(e)}") from e
@@ -0,0 +1,107 @@
+"""
+Configuration change notifications for PyQt6ify Pro.
+
+Changes are collected as they happen, from any thread, and delivered on the
+notifier's thread at the next turn of its event loop. A burst of set() calls
+therefore reaches each subscriber once, with the values current at delivery.
+"""
+
+import itertools
+import threading
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from loguru import logger
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from modules.config.schema import get_option
+
+
+class ConfigNotifier(QObject):
+    """Emits coalesced change signals for a Config and calls its subscribers."""
+
+    keyChanged = pyqtSignal(str, str, object)  # section, option, new value
+    sectionChanged = pyqtSignal(str, object)  # section, set of changed options
+    _pendingChanges = pyqtSignal()
+
+    def __init__(self, config, parent=None):
+        """
+        Initialize the notifier.
+
+        Args:
+            config (Config): Configuration whose changes are reported
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self.config = config
+        self._lock = threading.Lock()
+        self._changed: Set[Tuple[str, str]] = set()
+        self._scheduled = False
+        self._handles = itertools.count(1)
+        self._subscribers: Dict[int, Tuple[str, Optional[str], Callable]] = {}
+        self._pendingChanges.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def notify(self, section: str, option: str) -> None:
+        """Record a changed key; safe to call from any thread."""
+        with self._lock:
+            self._changed.add((section, option.lower()))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._pendingChanges.emit()
+
+    def subscribe(self, section: str, option: Optional[str], callback: Callable,
+                  owner: Optional[QObject] = None) -> int:
+        """
+        Call a function when a key or a section changes.
+
+        Args:
+            section (str): Section to watch
+            option (str, optional): Key to watch; None watches the whole section
+            callback (Callable): Called with the new value of the key, or with the set of
+                changed options of the section, at most once per event-loop turn
+            owner (QObject, optional): The subscription ends when this object is destroyed
+
+        Returns:
+            int: Handle for unsubscribe()
+        """
+        handle = next(self._handles)
+        self._subscribers[handle] = (section, option.lower() if option is not None else None, callback)
+        if owner is not None:
+            owner.destroyed.connect(lambda *_, handle=handle: self.unsubscribe(handle))
+        return handle
+
+    def unsubscribe(self, handle: int) -> None:
+        """End a subscription."""
+        self._subscribers.pop(handle, None)
+
+    def _current_value(self, section: str, option: str) -> Any:
+        """Get the value to report for a key: typed if declared in the schema, raw otherwise."""
+        if get_option(section, option) is not None:
+            return self.config.value(section, option)
+        return self.config.get(section, option)
+
+    def _deliver(self) -> None:
+        """Emit the signals and call the subscribers for the changes since the last turn."""
+        with self._lock:
+            changed = self._changed
+            self._changed = set()
+            self._scheduled = False
+        if not changed:
+            return
+
+        by_section: Dict[str, Set[str]] = {}
+        values = {}
+        for section, option in sorted(changed):
+            by_section.setdefault(section, set()).add(option)
+            values[section, option] = self._current_value(section, option)
+            self.keyChanged.emit(section, option, values[section, option])
+        for section, options in by_section.items():
+            self.sectionChanged.emit(section, options)
+
+        for section, option, callback in list(self._subscribers.values()):
+            try:
+                if option is None:
+                    if section in by_section:
+                        callback(by_section[section])
+                elif (section, option) in values:
+                    callback(values[section, option])
+            except Exception as e:
+                logger.error(f"Error in configuration subscriber for {section}.{option or '*'}: {str(e)}")
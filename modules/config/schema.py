@@ -0,0 +1,234 @@
+"""
+Configuration schema for PyQt6ify Pro.
+
+Declares the type, default and constraints of each known option. Config uses
+it to build its defaults, to validate the file once at load and to return
+parsed values from its typed accessors.
+"""
+
+import configparser
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from modules.config.writer import DURABILITY_LEVELS, DURABILITY_NORMAL
+
+
+class Option:
+    """A string option. Subclasses convert the stored string to other types."""
+
+    type_name = 'string'
+
+    def __init__(self, default: Any = None):
+        """
+        Args:
+            default (Any): Typed value used when the option is missing or invalid.
+                None means the option has no default and is not written to new files.
+        """
+        self.default = default
+
+    def parse(self, raw: str) -> Any:
+        """Convert a stored string to a typed value, raising ValueError if it is invalid."""
+        return raw
+
+    def format(self, value: Any) -> str:
+        """Convert a typed value to the string stored in the file."""
+        return str(value)
+
+
+class BoolOption(Option):
+    """A boolean option accepting the same spellings as ConfigParser.getboolean."""
+
+    type_name = 'boolean'
+
+    def parse(self, raw: str) -> bool:
+        try:
+            return configparser.ConfigParser.BOOLEAN_STATES[raw.strip().lower()]
+        except KeyError:
+            raise ValueError(f"is not a boolean: {raw!r}") from None
+
+
+class IntOption(Option):
+    """An integer option with optional bounds."""
+
+    type_name = 'integer'
+
+    def __init__(self, default: Optional[int] = None, min_value: Optional[int] = None,
+                 max_value: Optional[int] = None):
+        super().__init__(default)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def parse(self, raw: str) -> int:
+        try:
+            value = int(raw.strip())
+        except ValueError:
+            raise ValueError(f"is not an integer: {raw!r}") from None
+        if self.min_value is not None and value < self.min_value:
+            raise ValueError(f"must be at least {self.min_value}: {raw!r}")
+        if self.max_value is not None and value > self.max_value:
+            raise ValueError(f"must be at most {self.max_value}: {raw!r}")
+        return value
+
+
+class FloatOption(Option):
+    """A floating point option."""
+
+    type_name = 'number'
+
+    def parse(self, raw: str) -> float:
+        try:
+            return float(raw.strip())
+        except ValueError:
+            raise ValueError(f"is not a number: {raw!r}") from None
+
+
+class ListOption(Option):
+    """A list of strings separated by commas."""
+
+    type_name = 'list'
+
+    def parse(self, raw: str) -> List[str]:
+        return [item.strip() for item in raw.split(',') if item.strip()]
+
+    def format(self, value: Any) -> str:
+        return ', '.join(value)
+
+
+class ChoiceOption(Option):
+    """A string option restricted to a set of values, compared case-insensitively."""
+
+    type_name = 'choice'
+
+    def __init__(self, choices: Sequence[str], default: Optional[str] = None):
+        super().__init__(default)
+        self.choices = tuple(choices)
+
+    def parse(self, raw: str) -> str:
+        value = raw.strip().lower()
+        if value not in self.choices:
+            raise ValueError(f"must be one of {', '.join(self.choices)}: {raw!r}")
+        return value
+
+
+class SizeOption(Option):
+    """A size in WIDTHxHEIGHT format, parsed to a (width, height) tuple."""
+
+    type_name = 'size'
+
+    def parse(self, raw: str) -> Tuple[int, int]:
+        parts = raw.lower().split('x')
+        if len(parts) != 2 or not all(part.strip().isdigit() for part in parts):
+            raise ValueError(f"is not in WIDTHxHEIGHT format: {raw!r}")
+        return int(parts[0]), int(parts[1])
+
+    def format(self, value: Any) -> str:
+        return f"{value[0]}x{value[1]}"
+
+
+class Section:
+    """The options of one configuration section."""
+
+    def __init__(self, options: Dict[str, Option], extra: Optional[Option] = None, write_defaults: bool = True):
+        """
+        Args:
+            options (Dict[str, Option]): Declared options, in the order they are written to new files
+            extra (Option, optional): Type of options not declared here, e.g. module switches
+            write_defaults (bool): If False, defaults are used when reading but not added to the file
+        """
+        self.options = options
+        self.extra = extra
+        self.write_defaults = write_defaults
+        self._by_key = {name.lower(): option for name, option in options.items()}
+
+    def get(self, option: str) -> Optional[Option]:
+        """Get the declaration of an option, by its case-insensitive name."""
+        return self._by_key.get(option.lower(), self.extra)
+
+
+SCHEMA: Dict[str, Section] = {
+    'Application': Section({
+        'Name': Option('PyQt6ify Pro'),
+        'Version': Option('1.0.0'),
+        'Debug': BoolOption(False),
+        'profile_startup': BoolOption(False),
+        'profile_output': Option('logs/startup_profile.json'),
+        'save_durability': ChoiceOption(DURABILITY_LEVELS, DURABILITY_NORMAL),
+    }),
+    'About': Section({
+        'Author': Option('PyQt6ify Team'),
+        'Description': Option('Feature-rich PyQt6 application template.'),
+        'Website': Option('https://github.com/elirancv/PyQt6ify-Pro'),
+        'Icon': Option('resources/icons/app.png'),
+    }),
+    'Modules': Section({
+        'logging': BoolOption(True),
+        'database': BoolOption(True),
+        'menu': BoolOption(True),
+        'toolbar': BoolOption(True),
+        'status_bar': BoolOption(True),
+        'dashboard': BoolOption(True),
+    }, extra=BoolOption(True)),
+    'Window': Section({
+        'start_maximized': BoolOption(True),
+        'screen_width': IntOption(1024, min_value=1),
+        'screen_height': IntOption(768, min_value=1),
+        'theme': Option('light'),
+        'show_toolbar': BoolOption(True),
+        'show_status_bar': BoolOption(True),
+        'size': SizeOption(),
+    }),
+    # SQLite tuning applied by modules.database.pool to every connection
+    'Database': Section({
+        'journal_mode': ChoiceOption(('wal', 'delete', 'truncate', 'persist'), 'wal'),
+        'synchronous': ChoiceOption(('off', 'normal', 'full', 'extra'), 'normal'),
+        'cache_size': IntOption(-8000),  # Pages, or KiB when negative
+        'mmap_size': IntOption(67108864, min_value=0),  # Bytes; 0 disables memory mapping
+        'busy_timeout': IntOption(5000, min_value=0),  # Milliseconds to wait for a lock
+        'commit_window_ms': IntOption(2, min_value=0),  # Grouping delay of the database writer
+        'statement_cache': IntOption(256, min_value=0),  # Prepared statements kept per connection
+        'query_cache_size': IntOption(256, min_value=0),  # Cached query results; 0 disables the cache
+    }),
+    # Geometry and theme as stored by MainWindow and ThemeManager
+    'window': Section({
+        'theme': Option(),
+        'size': SizeOption((800, 600)),
+        'position': Option('center'),
+        'start_maximized': BoolOption(True),
+    }, write_defaults=False),
+}
+
+
+def get_option(section: str, option: str) -> Optional[Option]:
+    """Get the declaration of an option, or None if it is not part of the schema."""
+    declared = SCHEMA.get(section)
+    return declared.get(option) if declared is not None else None
+
+
+def default_config() -> Dict[str, Dict[str, str]]:
+    """Get the defaults written to new configuration files, as strings."""
+    return {
+        name: {option: declared.format(declared.default)
+               for option, declared in section.options.items() if declared.default is not None}
+        for name, section in SCHEMA.items() if section.write_defaults
+    }
+
+
+def validate(state: Dict[str, Dict[str, str]]) -> List[str]:
+    """
+    Check configuration values against the schema.
+
+    Args:
+        state (Dict[str, Dict[str, str]]): Raw values by section and option
+
+    Returns:
+        List[str]: A description of each problem found; empty if the configuration is valid
+    """
+    problems = []
+    for section, values in state.items():
+        for option, raw in values.items():
+            declared = get_option(section, option)
+            if declared is None or raw is None:
+                continue
+            try:
+                declared.parse(raw)
+            except ValueError as e:
+                problems.append(f"{section}.{option} {str(e)}")
+    return problems
@@ -0,0 +1,68 @@
+"""
+Configuration file watching for PyQt6ify Pro.
+
+Reloads a Config when another program changes its file. Editors and our own
+writer replace the file with a rename, which makes QFileSystemWatcher drop
+it, so the directory is watched too and the file is added back when it
+reappears. Every file of the backend is watched, e.g. the -wal file of an
+SQLite database in WAL mode.
+"""
+
+import os
+from loguru import logger
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class ConfigFileWatcher(QObject):
+    """Watches the file of a Config and applies external changes incrementally."""
+
+    reloaded = pyqtSignal(object)  # set of (section, option) pairs that changed
+
+    def __init__(self, config, debounce_ms: int = 100, parent=None):
+        """
+        Initialize the watcher.
+
+        Args:
+            config (Config): Configuration to keep in sync with its file
+            debounce_ms (int): Delay that groups the notifications of one external write
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self.config = config
+        self.path = os.path.abspath(config.config_file)
+        self.paths = [os.path.abspath(path) for path in config.backend.watched_paths]
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_changed)
+        self.watcher.directoryChanged.connect(self._on_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.reload)
+        self.watcher.addPaths(sorted({os.path.dirname(path) for path in self.paths}))
+        self._watch_file()
+        logger.debug(f"Watching configuration file {self.path}")
+
+    def _watch_file(self) -> None:
+        """Add the files that exist and are not watched to the watcher."""
+        watched = self.watcher.files()
+        for path in self.paths:
+            if os.path.exists(path) and path not in watched:
+                self.watcher.addPath(path)
+
+    def _on_changed(self, _path: str) -> None:
+        """Restart the debounce timer on any change of the file or its directory."""
+        self._timer.start()
+
+    def reload(self) -> None:
+        """Apply the current content of the file."""
+        self._watch_file()
+        changed = self.config.reload_from_file()
+        if changed:
+            self.reloaded.emit(changed)
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._timer.stop()
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
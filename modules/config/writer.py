@@ -0,0 +1,181 @@
+"""
+Background writer for configuration files of PyQt6ify Pro.
+
+Files are written on a dedicated thread so that slow disks don't stall the
+GUI. Each write goes to a temporary file that is renamed over the target, so
+a crash leaves either the old or the new file, never a truncated one. Other
+storage, such as the SQLite settings table, queues its own write tasks on the
+same thread.
+
+Durability levels:
+    none    rename only; a power loss may lose the latest change
+    normal  fsync the data before the rename (default)
+    full    also fsync the directory, so the rename itself survives a power loss
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from loguru import logger
+
+DURABILITY_NONE = 'none'
+DURABILITY_NORMAL = 'normal'
+DURABILITY_FULL = 'full'
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_NORMAL, DURABILITY_FULL)
+
+WriteCallback = Callable[[Optional[Exception]], None]
+WriteTask = Callable[[], None]
+
+
+def write_atomic(path: str, data: str, durability: str = DURABILITY_NORMAL) -> None:
+    """
+    Replace a file with new text content atomically.
+
+    Args:
+        path (str): File to write
+        data (str): New content
+        durability (str): One of DURABILITY_LEVELS
+    """
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"Unknown durability level: {durability!r}")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+            if durability != DURABILITY_NONE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if durability == DURABILITY_FULL and hasattr(os, 'O_DIRECTORY'):
+        # Windows cannot open directories; its rename is already journaled by NTFS
+        fd = os.open(directory or os.curdir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class ConfigWriter:
+    """
+    Writes files on a dedicated thread.
+
+    Writes submitted for a target that is still waiting are merged: only the latest
+    task runs, and the callbacks of every merged write run, in order, once it is done.
+    """
+
+    def __init__(self):
+        """Initialize the writer. The thread starts on the first write."""
+        self._condition = threading.Condition()
+        self._pending: Dict[str, Tuple[WriteTask, List[WriteCallback]]] = {}
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+
+    def submit(self, path: str, data: str, durability: str = DURABILITY_NORMAL,
+               callback: Optional[WriteCallback] = None) -> None:
+        """
+        Queue a file write.
+
+        Args:
+            path (str): File to write
+            data (str): New content
+            durability (str): One of DURABILITY_LEVELS
+            callback (Callable, optional): Called on the writer thread with None once the
+                content is on disk, or with the exception if the write failed
+        """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {durability!r}")
+        self.submit_task(path, lambda: write_atomic(path, data, durability), callback)
+
+    def submit_task(self, target: str, task: WriteTask, callback: Optional[WriteCallback] = None) -> None:
+        """
+        Queue a write task, replacing the task still waiting for the same target.
+
+        Args:
+            target (str): Name of what the task writes, e.g. a file path
+            task (Callable): Performs the write on the writer thread
+            callback (Callable, optional): Called on the writer thread with None once the
+                task has run, or with the exception it raised
+        """
+        with self._condition:
+            callbacks = self._pending[target][1] if target in self._pending else []
+            if callback is not None:
+                callbacks.append(callback)
+            self._pending[target] = (task, callbacks)
+            if self._thread is None or not self._thread.is_alive():
+                # Daemon so it never blocks exit; flush_pending_saves() waits for it at exit
+                self._thread = threading.Thread(target=self._run, name='config-writer', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write is on disk.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def has_pending_writes(self) -> bool:
+        """Return True while some writes are queued or in progress."""
+        with self._condition:
+            return bool(self._pending) or self._busy
+
+    def _run(self) -> None:
+        """Write queued files until the queue stays empty."""
+        while True:
+            with self._condition:
+                if not self._condition.wait_for(lambda: self._pending, timeout=5.0):
+                    # Idle: let the thread end; the next submit() starts a new one
+                    self._thread = None
+                    return
+                pending = self._pending
+                self._pending = {}
+                self._busy = True
+            try:
+                for target, (task, callbacks) in pending.items():
+                    error = None
+                    try:
+                        task()
+                        self.writes += 1
+                    except Exception as e:
+                        logger.error(f"Error writing {target}: {str(e)}")
+                        error = e
+                    for callback in callbacks:
+                        try:
+                            callback(error)
+                        except Exception as e:
+                            logger.error(f"Error in write callback for {target}: {str(e)}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+_default_writer: Optional[ConfigWriter] = None
+_default_writer_lock = threading.Lock()
+
+
+def get_default_writer() -> ConfigWriter:
+    """Get the writer shared by all configurations, creating it on first use."""
+    global _default_writer  # pylint: disable=global-statement
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = ConfigWriter()
+        return _default_writer
+
+
+def flush_default_writer(timeout: Optional[float] = None) -> bool:
+    """Wait for the writes of the shared writer, if it was ever used."""
+    with _default_writer_lock:
+        writer = _default_writer
+    return writer.flush(timeout) if writer is not None else True
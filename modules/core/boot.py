@@ -0,0 +1,144 @@
+"""
+Background boot tasks for PyQt6ify Pro.
+
+Runs startup work that doesn't touch widgets (file parsing, database setup,
+validation) on a thread pool and reports the results back to the GUI thread
+through Qt signals.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from modules.core.profiler import profiler
+
+
+class BootTaskSignals(QObject):
+    """Signals emitted by a boot task from its worker thread."""
+
+    finished = pyqtSignal(str, object)  # task name, result
+    failed = pyqtSignal(str, str)  # task name, error message
+
+
+class BootTask(QRunnable):
+    """A single unit of startup work executed on the thread pool."""
+
+    def __init__(self, name: str, func: Callable, *args, **kwargs):
+        """
+        Initialize the boot task.
+
+        Args:
+            name (str): Name of the task, used in signals and the startup profile
+            func (Callable): Function to run on the worker thread; must not touch widgets
+        """
+        super().__init__()
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = BootTaskSignals()
+
+    def run(self):
+        """Run the task and emit its result."""
+        try:
+            with profiler.span(f'boot.{self.name}'):
+                result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Boot task '{self.name}' failed: {str(e)}")
+            self.signals.failed.emit(self.name, str(e))
+        else:
+            self.signals.finished.emit(self.name, result)
+
+
+class BootSequence(QObject):
+    """
+    Runs a group of boot tasks in parallel and collects their results on the GUI thread.
+
+    Callbacks registered with add() are invoked on the thread that owns the
+    sequence, so they may safely update widgets.
+    """
+
+    taskFinished = pyqtSignal(str, object)
+    taskFailed = pyqtSignal(str, str)
+    completed = pyqtSignal()
+
+    def __init__(self, thread_pool: Optional[QThreadPool] = None, parent=None):
+        """
+        Initialize the boot sequence.
+
+        Args:
+            thread_pool (QThreadPool, optional): Pool to run tasks on. Defaults to the global pool.
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._tasks: Dict[str, BootTask] = {}
+        self._callbacks: Dict[str, Callable[[Any], None]] = {}
+        self._pending = set()
+        self._started = False
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+
+    def add(self, name: str, func: Callable, *args, on_finished: Optional[Callable[[Any], None]] = None,
+            **kwargs) -> None:
+        """
+        Register a task to run when the sequence starts.
+
+        Args:
+            name (str): Unique name of the task
+            func (Callable): Function to run on a worker thread
+            on_finished (Callable, optional): Called on the GUI thread with the task result
+        """
+        if self._started:
+            raise RuntimeError("Cannot add tasks to a boot sequence that has already started")
+        task = BootTask(name, func, *args, **kwargs)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        self._tasks[name] = task
+        if on_finished is not None:
+            self._callbacks[name] = on_finished
+
+    def start(self) -> None:
+        """Submit all registered tasks to the thread pool."""
+        self._started = True
+        self._pending = set(self._tasks)
+        if not self._pending:
+            self.completed.emit()
+            return
+        for task in self._tasks.values():
+            self.thread_pool.start(task)
+
+    def is_running(self) -> bool:
+        """Return True while some tasks have not reported back yet."""
+        return bool(self._pending)
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """Block until the thread pool has finished running the tasks."""
+        return self.thread_pool.waitForDone(timeout_ms)
+
+    def _on_task_finished(self, name: str, result: Any) -> None:
+        """Store a task result and run its callback on the GUI thread."""
+        self.results[name] = result
+        callback = self._callbacks.get(name)
+        if callback is not None:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Error handling result of boot task '{name}': {str(e)}")
+                self.errors[name] = str(e)
+        self.taskFinished.emit(name, result)
+        self._task_done(name)
+
+    def _on_task_failed(self, name: str, error: str) -> None:
+        """Record a failed task."""
+        self.errors[name] = error
+        self.taskFailed.emit(name, error)
+        self._task_done(name)
+
+    def _task_done(self, name: str) -> None:
+        """Emit completed once every task has reported back."""
+        self._pending.discard(name)
+        if not self._pending:
+            profiler.mark('boot.completed', once=True)
+            logger.info("Background initialization completed")
+            self.completed.emit()
@@ -0,0 +1,243 @@
+"""
+Hot reload of plugins for PyQt6ify Pro.
+
+Watches the files of the modules loaded by a ModuleLoader and, when one
+changes, reloads only that module and the loaded modules that import it.
+A module imports another if its source has an import statement naming it,
+including 'from plugin import CONSTANT', or if one of its globals is that
+module or was defined in it, e.g. a module fetched from sys.modules.
+
+Plugins can keep state across a reload by declaring:
+
+    KEEP_ON_RELOAD = ('cache', 'counter')  # globals carried over to the new code
+
+    def before_reload():                   # returns any state to hand over
+        ...
+
+    def after_reload(state):               # receives what before_reload returned
+        ...
+"""
+
+import ast
+import importlib.util
+import os
+import types
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class ModuleReloader(QObject):
+    """Reloads changed plugin modules and their dependents without restarting the application."""
+
+    moduleReloaded = pyqtSignal(str)  # module name
+    reloadFailed = pyqtSignal(str, str)  # module name, error message
+
+    def __init__(self, module_loader, debounce_ms: int = 200, parent=None):
+        """
+        Initialize the reloader.
+
+        Args:
+            module_loader (ModuleLoader): Loader whose modules are watched
+            debounce_ms (int): Delay that groups the change notifications of one save
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self.module_loader = module_loader
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self._changed_paths: Set[str] = set()
+        self._source_imports: Dict[str, Tuple[Optional[int], Set[str]]] = {}  # path -> (mtime, imported names)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._reload_changed)
+
+    def watch_loaded_modules(self) -> None:
+        """Start watching the files of all modules loaded so far."""
+        paths = [path for name, path in self.module_loader.module_files.items()
+                 if name in self.module_loader.loaded_modules and path not in self.watcher.files()]
+        if paths:
+            self.watcher.addPaths(paths)
+            logger.debug(f"Watching {len(paths)} module files for changes")
+
+    def _on_file_changed(self, path: str) -> None:
+        """Collect a changed file and restart the debounce timer."""
+        self._changed_paths.add(path)
+        self._timer.start()
+
+    def _reload_changed(self) -> None:
+        """Reload the modules whose files changed."""
+        by_path = {path: name for name, path in self.module_loader.module_files.items()}
+        names = [by_path[path] for path in sorted(self._changed_paths) if path in by_path]
+        for path in self._changed_paths:
+            # Editors that save by replacing the file make the watcher drop it
+            if path not in self.watcher.files():
+                self.watcher.addPath(path)
+        self._changed_paths.clear()
+        if names:
+            self.reload_modules(names)
+
+    def _is_active(self, name: str) -> bool:
+        """Return True if a loaded module was loaded from a source file and its body has executed."""
+        return (name in self.module_loader.loaded_modules and name in self.module_loader.module_files
+                and self.module_loader.is_touched(name))
+
+    def _imported_names(self, name: str) -> Set[str]:
+        """
+        Get the names of the modules imported by the source of a module, parsed again when it changes.
+
+        For 'from package import name', both package and package.name are included.
+        """
+        path = self.module_loader.module_files.get(name)
+        if path is None:
+            return set()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return set()
+        cached = self._source_imports.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        names: Set[str] = set()
+        try:
+            with open(path, 'rb') as f:
+                tree = ast.parse(importlib.util.decode_source(f.read()), filename=path)
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+            logger.debug(f"Cannot parse the imports of {name}: {str(e)}")
+            tree = None
+        package = name.rpartition('.')[0]
+        for node in ast.walk(tree) if tree is not None else ():
+            if isinstance(node, ast.Import):
+                names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                try:
+                    base = importlib.util.resolve_name('.' * node.level + (node.module or ''), package)
+                except (ImportError, ValueError):
+                    continue
+                names.add(base)
+                names.update(f"{base}.{alias.name}" for alias in node.names if alias.name != '*')
+        self._source_imports[path] = (mtime, names)
+        return names
+
+    def _imports(self, name: str) -> Set[str]:
+        """Get the loaded modules that a module imports in its source or refers to through its globals."""
+        module = self.module_loader.loaded_modules[name]
+        loaded = self.module_loader.loaded_modules
+        result = {target for target in self._imported_names(name) if target != name and target in loaded}
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                target = value.__name__
+            else:
+                target = getattr(value, '__module__', None)
+            if target != name and target in loaded:
+                result.add(target)
+        return result
+
+    def get_dependents(self, name: str) -> Set[str]:
+        """
+        Get the loaded modules that import a module, directly or indirectly.
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            Set[str]: Names of the dependent modules
+        """
+        imports = {other: self._imports(other) for other in self.module_loader.loaded_modules
+                   if self._is_active(other)}
+        dependents: Set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for other, imported in imports.items():
+                if current in imported and other not in dependents and other != name:
+                    dependents.add(other)
+                    pending.append(other)
+        return dependents
+
+    def _reload_order(self, names: List[str]) -> List[str]:
+        """Order modules so that each one is reloaded after the affected modules it imports."""
+        affected = set(names)
+        for name in names:
+            affected |= self.get_dependents(name)
+        order: List[str] = []
+
+        def visit(name, visiting):
+            if name in order or name in visiting:
+                return
+            visiting.add(name)
+            for imported in sorted(self._imports(name) & affected):
+                visit(imported, visiting)
+            order.append(name)
+
+        for name in sorted(affected):
+            visit(name, set())
+        return order
+
+    def reload_modules(self, names: List[str]) -> Dict[str, bool]:
+        """
+        Reload modules and the loaded modules that depend on them.
+
+        Args:
+            names (List[str]): Names of the changed modules
+
+        Returns:
+            Dict[str, bool]: Whether each reloaded module succeeded
+        """
+        names = [name for name in names if self._is_active(name)]
+        results: Dict[str, bool] = {}
+        failed: Set[str] = set()
+        for name in self._reload_order(names):
+            if self._imports(name) & failed:
+                logger.warning(f"Not reloading {name}: a module it imports failed to reload")
+                failed.add(name)
+                results[name] = False
+                continue
+            results[name] = self.reload_module(name)
+            if not results[name]:
+                failed.add(name)
+        return results
+
+    def reload_module(self, name: str) -> bool:
+        """
+        Re-execute a single module in place, keeping the state it asks to keep.
+
+        The module object stays the same, so references held elsewhere see the
+        new code. If the new code fails, the previous namespace is restored.
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            bool: True if the module was reloaded
+        """
+        module = self.module_loader.loaded_modules[name]
+        path = self.module_loader.module_files[name]
+        namespace = vars(module)
+        previous = dict(namespace)
+        try:
+            state = module.before_reload() if callable(namespace.get('before_reload')) else None
+            kept = {key: namespace[key] for key in namespace.get('KEEP_ON_RELOAD', ()) if key in namespace}
+
+            spec = importlib.util.spec_from_file_location(name, path)
+            if spec is None:
+                raise ImportError(f"Cannot create module spec for {path}")
+            module.__spec__ = spec
+            module.__loader__ = spec.loader
+            spec.loader.exec_module(module)
+
+            namespace.update(kept)
+            if callable(namespace.get('after_reload')):
+                module.after_reload(state)
+        except Exception as e:
+            namespace.clear()
+            namespace.update(previous)
+            logger.error(f"Error reloading module {name}: {str(e)}")
+            self.reloadFailed.emit(name, str(e))
+            return False
+
+        logger.info(f"Reloaded module: {name}")
+        self.moduleReloaded.emit(name)
+        return True
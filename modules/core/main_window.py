@@ -8,24 +8,34 @@
 from loguru import logger
 from PyQt6.QtWidgets import QMainWindow, QApplication
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
-from modules.about import show_about_dialog
-from modules.themes.theme_dialog import ThemeDialog
+from PyQt6.QtCore import Qt, pyqtSignal
 from modules.themes.theme_manager import ThemeManager
-from modules.menu.menu import MenuBar
-from modules.toolbar.toolbar import ToolBar
-from modules.status_bar.status_bar import StatusBar
-from modules.dashboard.dashboard import Dashboard
-from modules.database.database import Database
+from modules.core.boot import BootSequence
+from modules.core.profiler import profiler
 
 class MainWindow(QMainWindow):
     """
     MainWindow class responsible for setting up the main UI window
     and initializing the application based on configuration settings.
+
+    The window is shown as soon as its widgets exist. Parsing the themes file
+    and setting up the database run afterwards on a thread pool; bootCompleted
+    is emitted when both have finished, and startupCompleted once the first
+    frame has also been painted.
     """
-    def __init__(self, config):
+
+    bootCompleted = pyqtSignal()
+    startupCompleted = pyqtSignal()
+
+    def __init__(self, config, database_path=None):
+        """
+        Args:
+            config (Config): Configuration manager instance
+            database_path (str, optional): Database file; defaults to the application database
+        """
         super().__init__()
         self.config = config
+        self.database_path = database_path
         self.db_connection = None
         self.menu_bar = None
         self.tool_bar = None
@@ -33,6 +43,10 @@ def __init__(self, config):
         self.dashboard = None
         self.database = None
         self.theme_manager = None
+        self._first_frame_painted = False
+        self._startup_completed = False
+        self.boot = BootSequence(parent=self)
+        self.boot.completed.connect(self._on_boot_completed)
 
         # Get the base path (project root)
         self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -41,32 +55,36 @@ def __init__(self, config):
         if self.base_path not in sys.path:
             sys.path.insert(0, self.base_path)
 
-        # Initialize theme manager
-        self.theme_manager = ThemeManager(QApplication.instance(), self.config)
+        # Initialize theme manager with the built-in themes; the themes file is read in the background
+        self.theme_manager = ThemeManager(QApplication.instance(), self.config, defer_loading=True)
 
         # Initialize UI
         self.init_ui()
 
+    @profiler.profile('MainWindow.init_ui')
     def init_ui(self):
         """Initialize the main user interface elements of the window."""
         try:
             self.setup_window_properties()
             self.init_components()
+            self.init_background_tasks()
             self.init_database()
             self.show()
+            self.boot.start()
         except Exception as e:
             logger.error(f"Error initializing UI: {str(e)}")
             traceback.print_exc()
 
+    @profiler.profile('MainWindow.setup_window_properties')
     def setup_window_properties(self):
         """Set up basic window properties like title, icon, and size."""
         try:
-            app_name = self.config.get('application', 'name', 'PyQt6ify Pro')
-            app_version = self.config.get('application', 'version', '1.0.0')
+            app_name = self.config.value('Application', 'name')
+            app_version = self.config.value('Application', 'version')
             self.setWindowTitle(f"{app_name} {app_version}")
 
             # Set window icon
-            icon_path = self.config.get('about', 'icon', 'resources\\icons\\app.png')
+            icon_path = self.config.value('About', 'icon')
             if icon_path:
                 # If path is relative, make it absolute
                 if not os.path.isabs(icon_path):
@@ -78,11 +96,11 @@ def setup_window_properties(self):
                     logger.warning(f"Icon not found at path: {icon_path}")
 
             # Set window size
-            size = self.config.get('window', 'size', '800x600').split('x')
-            self.resize(int(size[0]), int(size[1]))
+            width, height = self.config.value('window', 'size')
+            self.resize(width, height)
 
             # Set window position
-            position = self.config.get('window', 'position', 'center')
+            position = self.config.value('window', 'position')
             if position == 'center':
                 screen = QApplication.primaryScreen().geometry()
                 x = (screen.width() - self.width()) // 2
@@ -90,50 +108,134 @@ def setup_window_properties(self):
                 self.move(x, y)
 
             # Set maximized state
-            if self.config.get('window', 'start_maximized', 'True').lower() == 'true':
+            if self.config.value('window', 'start_maximized'):
                 self.setWindowState(Qt.WindowState.WindowMaximized)
         except Exception as e:
             logger.error(f"Error setting window properties: {str(e)}")
             traceback.print_exc()
 
+    @profiler.profile('MainWindow.init_components')
     def init_components(self):
-        """Initialize UI components based on configuration."""
+        """
+        Initialize UI components based on configuration.
+
+        Components disabled in the [Modules] section are never imported or
+        instantiated. Enabled components that start hidden are built the first
+        time they are shown (see ensure_tool_bar and ensure_status_bar).
+        """
         try:
+            modules = self.config.get_modules_enabled()
+
             # Initialize menu bar
-            self.menu_bar = MenuBar(self)
-            self.setMenuBar(self.menu_bar)
+            if modules.get('menu', True):
+                from modules.menu.menu import MenuBar
+                self.menu_bar = MenuBar(self)
+                self.setMenuBar(self.menu_bar)
 
             # Initialize toolbar
-            self.tool_bar = ToolBar(self)
-            self.addToolBar(self.tool_bar)
+            if modules.get('toolbar', True) and self._is_shown_at_startup('show_toolbar'):
+                self.ensure_tool_bar()
 
             # Initialize status bar
-            self.status_bar = StatusBar(self)
-            self.setStatusBar(self.status_bar)
+            if modules.get('status_bar', True) and self._is_shown_at_startup('show_status_bar'):
+                self.ensure_status_bar()
 
             # Initialize dashboard
-            self.dashboard = Dashboard(self)
-            self.setCentralWidget(self.dashboard)
-
-            # Initialize database
-            self.database = Database(self)
+            if modules.get('dashboard', True):
+                from modules.dashboard.dashboard import Dashboard
+                self.dashboard = Dashboard(self)
+                self.setCentralWidget(self.dashboard)
 
         except Exception as e:
             logger.error(f"Error initializing components: {str(e)}")
             traceback.print_exc()
 
+    def _is_shown_at_startup(self, option):
+        """Return whether a component should be visible when the window opens."""
+        return self.config.value('Window', option)
+
+    def ensure_tool_bar(self):
+        """
+        Build the toolbar on first use.
+
+        Returns:
+            ToolBar: The toolbar, or None if it is disabled in the configuration
+        """
+        if self.tool_bar is None:
+            if not self.config.get_modules_enabled().get('toolbar', True):
+                return None
+            from modules.toolbar.toolbar import ToolBar
+            self.tool_bar = ToolBar(self)
+            self.addToolBar(self.tool_bar)
+            logger.debug("Toolbar created")
+        return self.tool_bar
+
+    def ensure_status_bar(self):
+        """
+        Build the status bar on first use.
+
+        Returns:
+            StatusBar: The status bar, or None if it is disabled in the configuration
+        """
+        if self.status_bar is None:
+            if not self.config.get_modules_enabled().get('status_bar', True):
+                return None
+            from modules.status_bar.status_bar import StatusBar
+            self.status_bar = StatusBar(self)
+            self.setStatusBar(self.status_bar)
+            logger.debug("Status bar created")
+        return self.status_bar
+
+    @profiler.profile('MainWindow.init_background_tasks')
+    def init_background_tasks(self):
+        """Queue the theme file parsing for the boot thread pool."""
+        try:
+            self.boot.add('themes', self.theme_manager.load_theme_data, self.theme_manager.themes_file,
+                          self.config.startup_cache, on_finished=lambda data: self.theme_manager.add_themes(**data))
+        except Exception as e:
+            logger.error(f"Error queuing background tasks: {str(e)}")
+            traceback.print_exc()
+
+    @profiler.profile('MainWindow.init_database')
     def init_database(self):
-        """Initialize database."""
+        """Queue the database setup for the boot thread pool."""
         try:
-            # Database is already initialized in init_components
-            pass
+            if self.config.get_modules_enabled().get('database', True):
+                from modules.database.database import Database
+                database = Database(self.config, auto_init=False, db_path=self.database_path)
+                self.boot.add('database', database.init_db,
+                              on_finished=lambda _: self._on_database_ready(database))
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
             traceback.print_exc()
 
+    def _on_database_ready(self, database):
+        """Make the database available once it has been set up in the background."""
+        self.database = database
+
+    def _on_boot_completed(self):
+        """Handle the end of background initialization."""
+        if self.config.startup_cache is not None:
+            self.config.startup_cache.flush()
+        # Pick up configuration pushed by other programs from now on
+        self.config.watch_file()
+        self.bootCompleted.emit()
+        self._check_startup_completed()
+
+    def _check_startup_completed(self):
+        """Finish startup once the first frame is painted and the boot tasks are done."""
+        if self._startup_completed or not self._first_frame_painted or self.boot.is_running():
+            return
+        self._startup_completed = True
+        if profiler.enabled:
+            profiler.write()
+        profiler.finish()
+        self.startupCompleted.emit()
+
     def show_theme_dialog(self):
         """Show the theme selection dialog."""
         try:
+            from modules.themes.theme_dialog import ThemeDialog
             dialog = ThemeDialog(self.theme_manager, self)
             dialog.exec()
         except Exception as e:
@@ -143,12 +245,27 @@ def show_theme_dialog(self):
     def show_about_dialog(self):
         """Show the about dialog."""
         try:
-            show_about_dialog(self)
+            from modules.about import show_about_dialog
+            show_about_dialog(self.config, self)
         except Exception as e:
             logger.error(f"Error showing about dialog: {str(e)}")
             traceback.print_exc()
 
+    def paintEvent(self, event):
+        """Paint the window and record the first painted frame for the startup profile."""
+        super().paintEvent(event)
+        if not self._first_frame_painted:
+            self._first_frame_painted = True
+            profiler.mark('MainWindow.first_frame')
+            self._check_startup_completed()
+
     def closeEvent(self, event):
         """Handle application shutdown."""
         logger.info("Application shutting down")
+        self.boot.wait()
+        if self.database is not None:
+            self.database.close()
+        self.config.flush()
+        if self.config.startup_cache is not None:
+            self.config.startup_cache.flush()
         event.accept()
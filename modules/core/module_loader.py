@@ -5,23 +5,111 @@
 import os
 import sys
 import importlib
+import importlib.abc
+import importlib.util
+import types
+import zipimport
 from loguru import logger
+from modules.core.plugin_bundle import BUNDLE_SUFFIX, BundleError, BundleModuleLoader, is_bundle_name, read_manifest
+from modules.core.plugin_worker import is_compute_plugin
+from modules.core.plugin_setup import read_declarations, run_plugin_setup
+from modules.core.startup_cache import StartupCache
+
+class _TrackingLoader(importlib.abc.Loader):
+    """Wraps a module loader and reports when a module body is actually executed."""
+
+    def __init__(self, loader, on_exec):
+        self.loader = loader
+        self.on_exec = on_exec
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.on_exec(module.__name__)
+        self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        # Delegate get_source, get_code, etc. to the wrapped loader
+        return getattr(self.loader, name)
 
 class ModuleLoader:
     """Module loader class for PyQt6ify Pro."""
 
-    def __init__(self, base_path):
-        """Initialize the module loader."""
+    def __init__(self, base_path, startup_cache=None, lazy=False):
+        """
+        Initialize the module loader.
+
+        Args:
+            base_path (str): Root that module names are relative to
+            startup_cache (StartupCache, optional): Cache holding the discovery manifest on disk.
+                Without one, the manifest is only kept in memory for the lifetime of the loader.
+            lazy (bool): If True, modules are registered as lazy proxies whose body only runs
+                on first attribute access. Errors in a lazy module surface on that first access.
+        """
         self.base_path = base_path
+        self.lazy = lazy
         self.loaded_modules = {}
+        self.touched_modules = set()
+        self.setup_results = {}
+        self.module_files = {}
+        self.reloader = None
+        self.startup_cache = startup_cache if startup_cache is not None else StartupCache(None)
+
+    def _is_module_name(self, file_name):
+        """Check if a file name is a valid Python module name."""
+        return file_name.endswith('.py') and not file_name.startswith('__')
 
     def _is_module_file(self, file_path):
         """Check if a file is a valid Python module file."""
-        return (
-            file_path.endswith('.py') and
-            not os.path.basename(file_path).startswith('__') and
-            os.path.isfile(file_path)
-        )
+        return self._is_module_name(os.path.basename(file_path)) and os.path.isfile(file_path)
+
+    def _scan_directory(self, directory):
+        """
+        List the module files and subdirectories of one directory.
+
+        Returns:
+            tuple: Sorted lists of module file and bundle paths, and of subdirectory paths
+        """
+        files = []
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__':
+                        subdirs.append(entry.path)
+                elif (self._is_module_name(entry.name) or is_bundle_name(entry.name)) and entry.is_file():
+                    files.append(entry.path)
+        return sorted(files), sorted(subdirs)
+
+    def discover_modules(self, directory):
+        """
+        Find all Python module files and plugin bundles in a directory and its subdirectories.
+
+        The listing of each directory is kept in the discovery manifest, keyed by
+        the directory's mtime. A later scan only stats each directory and lists
+        again the ones whose entries changed.
+
+        Args:
+            directory (str): Directory to search for modules
+
+        Returns:
+            list: Paths of the module files and bundles
+        """
+        module_files = []
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                files, subdirs = self.startup_cache.fetch(
+                    f'module_dir:{os.path.abspath(current)}', [current], lambda: self._scan_directory(current))
+            except OSError as e:
+                logger.warning(f"Error scanning module directory {current}: {str(e)}")
+                continue
+            module_files.extend(files)
+            # Reversed so that subdirectories are visited in sorted order
+            pending.extend(reversed(subdirs))
+        return module_files
 
     def _get_module_name(self, file_path):
         """Get the module name from a file path."""
@@ -59,17 +147,123 @@ def load_module(self, file_path):
                 logger.error(f"Failed to create module spec for: {file_path}")
                 return None
 
+            if self.lazy:
+                spec.loader = importlib.util.LazyLoader(_TrackingLoader(spec.loader, self._mark_touched))
+            else:
+                self._mark_touched(module_name)
+
             module = importlib.util.module_from_spec(spec)
             sys.modules[module_name] = module
+            self.module_files[module_name] = os.path.abspath(file_path)
             spec.loader.exec_module(module)
 
-            logger.info(f"Successfully loaded module: {module_name}")
+            logger.info(f"Successfully {'registered lazy' if self.lazy else 'loaded'} module: {module_name}")
             return module
 
         except Exception as e:
             logger.error(f"Error loading module {file_path}: {str(e)}")
             return None
 
+    def _bind_to_parent(self, module_name):
+        """Set a module as an attribute of its parent package, as the import system does."""
+        parent_name, _, leaf = module_name.rpartition('.')
+        parent = sys.modules.get(parent_name)
+        if parent is not None:
+            setattr(parent, leaf, sys.modules[module_name])
+
+    def load_bundle(self, bundle_path):
+        """
+        Load the modules of a plugin bundle.
+
+        Modules are named after the bundle's location, as if the bundle were a
+        directory: 'plugins/tools.plugin.zip' holding 'sub/task.pyc' gives
+        'plugins.tools.sub.task'. The bundle and its subdirectories are
+        registered as packages, so modules of a bundle can import each other.
+
+        Args:
+            bundle_path (str): Path to the bundle archive
+
+        Returns:
+            dict: The loaded modules of the bundle, or an empty dict if the bundle is invalid
+        """
+        try:
+            manifest = read_manifest(bundle_path)
+        except BundleError as e:
+            logger.error(f"Error loading bundle {bundle_path}: {str(e)}")
+            return {}
+
+        prefix = self._get_module_name(bundle_path[:-len(BUNDLE_SUFFIX)])
+        for package in [''] + manifest['packages']:
+            package_name = f"{prefix}.{package}" if package else prefix
+            if package_name not in sys.modules:
+                package_module = types.ModuleType(package_name)
+                package_module.__path__ = [os.path.join(bundle_path, *package.split('.')) if package else bundle_path]
+                sys.modules[package_name] = package_module
+                self._bind_to_parent(package_name)
+
+        modules = {}
+        importers = {}
+        for relative_name in manifest['modules']:
+            module_name = f"{prefix}.{relative_name}"
+            if module_name in sys.modules:
+                modules[module_name] = sys.modules[module_name]
+                continue
+            try:
+                package, _, leaf = relative_name.rpartition('.')
+                if package not in importers:
+                    # zipimport needs a trailing separator to root an importer inside the archive
+                    root = os.path.join(bundle_path, *package.split('.'), '') if package else bundle_path
+                    importers[package] = zipimport.zipimporter(root)
+                loader = BundleModuleLoader(importers[package], leaf)
+                origin = os.path.join(bundle_path, *relative_name.split('.')) + '.pyc'
+                spec = importlib.util.spec_from_loader(module_name, loader, origin=origin)
+                spec.has_location = True
+                if self.lazy:
+                    spec.loader = importlib.util.LazyLoader(_TrackingLoader(loader, self._mark_touched))
+                else:
+                    self._mark_touched(module_name)
+
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                self._bind_to_parent(module_name)
+                spec.loader.exec_module(module)
+                modules[module_name] = module
+            except Exception as e:
+                sys.modules.pop(module_name, None)
+                parent = sys.modules.get(module_name.rpartition('.')[0])
+                if parent is not None and hasattr(parent, leaf):
+                    delattr(parent, leaf)
+                logger.error(f"Error loading module {module_name} from bundle {bundle_path}: {str(e)}")
+
+        logger.info(f"Loaded {len(modules)} modules from bundle: {bundle_path}")
+        self.loaded_modules.update(modules)
+        return modules
+
+    def _mark_touched(self, module_name):
+        """Record that a module body has been executed."""
+        if module_name not in self.touched_modules:
+            self.touched_modules.add(module_name)
+            if self.lazy:
+                logger.debug(f"Lazy module touched: {module_name}")
+
+    def is_touched(self, module_name):
+        """Return True if the module body has been executed."""
+        return module_name in self.touched_modules
+
+    def get_usage_report(self):
+        """
+        Report which loaded modules were actually used.
+
+        Returns:
+            dict: Sorted module names under 'loaded', 'touched' and 'untouched'
+        """
+        loaded = set(self.loaded_modules)
+        return {
+            'loaded': sorted(loaded),
+            'touched': sorted(loaded & self.touched_modules),
+            'untouched': sorted(loaded - self.touched_modules),
+        }
+
     def load_all_modules(self, directory):
         """
         Load all Python modules from a directory and its subdirectories.
@@ -82,17 +276,15 @@ def load_all_modules(self, directory):
         """
         try:
             # Find all Python files in the directory
-            module_files = []
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if self._is_module_file(file_path):
-                        module_files.append(file_path)
+            module_files = self.discover_modules(directory)
 
             logger.debug(f"Found modules: {module_files}")
 
             # Load each module
             for file_path in module_files:
+                if is_bundle_name(os.path.basename(file_path)):
+                    self.load_bundle(file_path)
+                    continue
                 module = self.load_module(file_path)
                 if module is not None:
                     module_name = self._get_module_name(file_path)
@@ -104,5 +296,98 @@ def load_all_modules(self, directory):
             logger.error(f"Error loading modules from directory {directory}: {str(e)}")
             return {}
 
+    def setup_all_modules(self, max_workers=None):
+        """
+        Run the setup() hooks of the loaded modules in dependency order.
+
+        Hooks of independent plugins that declare SETUP_THREAD = 'worker' run in
+        parallel on a thread pool; all other hooks run on the calling thread.
+        See modules.core.plugin_setup for the declarations plugins can make.
+
+        With lazy loading, the declarations of untouched plugins are read from their
+        source files and kept in the startup cache, so plugins without a setup() hook
+        stay unloaded. Bundled plugins and those whose declarations are not literals
+        are loaded to read them.
+
+        Args:
+            max_workers (int, optional): Size of the thread pool for worker hooks
+
+        Returns:
+            dict: Setup status of each module
+
+        Raises:
+            PluginDependencyError: If a dependency is unknown or the graph has a cycle
+        """
+        self.setup_results = run_plugin_setup(self.loaded_modules, max_workers, self.get_declarations())
+        return self.setup_results
+
+    def get_declarations(self):
+        """
+        Read the declarations of the untouched lazy plugins from their source files.
+
+        Results are kept in the startup cache. See plugin_setup.read_declarations().
+
+        Returns:
+            dict: Declarations by module name; plugins that are touched, bundled or whose
+            declarations are not literals are left out
+        """
+        declarations = {}
+        if not self.lazy:
+            return declarations
+        for name in self.loaded_modules:
+            path = self.module_files.get(name)
+            if path is None or self.is_touched(name):
+                continue
+            declared = self.startup_cache.fetch(f'plugin_declarations:{path}', [path],
+                                                lambda path=path: self._read_declarations(path))
+            if declared is not None:
+                declarations[name] = declared
+        return declarations
+
+    @staticmethod
+    def _read_declarations(file_path):
+        """Read the setup declarations of a plugin file, or None if they must be read from the module."""
+        try:
+            with open(file_path, 'rb') as f:
+                return read_declarations(importlib.util.decode_source(f.read()))
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Cannot read the declarations of {file_path}: {str(e)}")
+            return None
+
+    def get_compute_plugins(self):
+        """
+        Get the loaded plugins that declare COMPUTE_PLUGIN = True.
+
+        Their functions are meant to be run through a PluginHost, in worker processes.
+        Untouched lazy plugins are recognized from their source and stay unloaded, unless
+        they are bundled or set COMPUTE_PLUGIN other than with a literal.
+
+        Returns:
+            dict: Compute plugin modules by name
+        """
+        declarations = self.get_declarations()
+        return {name: module for name, module in self.loaded_modules.items()
+                if (declarations[name]['compute'] if name in declarations else is_compute_plugin(module))}
+
+    def enable_hot_reload(self, debounce_ms=200, parent=None):
+        """
+        Watch the files of the loaded modules and reload them when they change.
+
+        Only the changed module and the loaded modules that import it are
+        reloaded. See modules.core.hot_reload for how plugins keep state.
+
+        Args:
+            debounce_ms (int): Delay that groups the change notifications of one save
+            parent: Optional parent object of the reloader
+
+        Returns:
+            ModuleReloader: The reloader, whose signals report each reload
+        """
+        from modules.core.hot_reload import ModuleReloader
+        if self.reloader is None:
+            self.reloader = ModuleReloader(self, debounce_ms, parent)
+        self.reloader.watch_loaded_modules()
+        return self.reloader
+
 import importlib
 # Defined the variable importlib to resolve undefined variable errors on lines 56 and 61.
@@ -0,0 +1,140 @@
+"""
+Plugin bundles for PyQt6ify Pro.
+
+A bundle is a single zip archive, named '<name>.plugin.zip', holding the
+precompiled bytecode of a plugin tree and a manifest. ModuleLoader reads it
+through zipimport, so loading a bundle opens one file instead of stat-ing and
+compiling every source file of the tree.
+
+Bytecode is specific to the interpreter version, so the manifest records the
+cache tag of the interpreter that built the bundle and bundles built by
+another version are rejected.
+"""
+
+import importlib.abc
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import time
+import zipfile
+import zipimport
+from typing import Dict, List
+
+BUNDLE_SUFFIX = '.plugin.zip'
+MANIFEST_NAME = 'manifest.json'
+BUNDLE_FORMAT_VERSION = 1
+
+
+class BundleError(Exception):
+    """Exception raised when a plugin bundle cannot be built or loaded."""
+
+
+def is_bundle_name(file_name: str) -> bool:
+    """Check if a file name is a plugin bundle name."""
+    return file_name.endswith(BUNDLE_SUFFIX)
+
+
+def _pyc_bytes(code, mtime: int, source_size: int) -> bytes:
+    """Serialize a code object in the timestamp-based .pyc layout read by zipimport."""
+    header = importlib.util.MAGIC_NUMBER
+    header += (0).to_bytes(4, 'little')
+    header += (mtime & 0xFFFFFFFF).to_bytes(4, 'little')
+    header += (source_size & 0xFFFFFFFF).to_bytes(4, 'little')
+    return header + marshal.dumps(code)
+
+
+def build_bundle(source_dir: str, bundle_path: str, optimize: int = -1) -> Dict:
+    """
+    Compile a plugin tree into a bundle.
+
+    Args:
+        source_dir (str): Directory holding the plugin modules
+        bundle_path (str): Path of the archive to write; should end with '.plugin.zip'
+        optimize (int): Optimization level passed to compile()
+
+    Returns:
+        Dict: The manifest written into the bundle
+
+    Raises:
+        BundleError: If a source file does not compile
+    """
+    modules: List[str] = []
+    packages: List[str] = []
+    entries = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        rel_dir = os.path.relpath(root, source_dir)
+        parts = [] if rel_dir == os.curdir else rel_dir.split(os.sep)
+        if parts:
+            packages.append('.'.join(parts))
+        for file_name in sorted(files):
+            if not file_name.endswith('.py') or file_name.startswith('__'):
+                continue
+            source_path = os.path.join(root, file_name)
+            arc_name = '/'.join(parts + [file_name[:-3] + '.pyc'])
+            with open(source_path, 'rb') as f:
+                source = f.read()
+            try:
+                code = compile(source, arc_name[:-1], 'exec', dont_inherit=True, optimize=optimize)
+            except SyntaxError as e:
+                raise BundleError(f"Cannot compile {source_path}: {str(e)}") from e
+            entries.append((arc_name, _pyc_bytes(code, int(os.stat(source_path).st_mtime), len(source))))
+            modules.append('.'.join(parts + [file_name[:-3]]))
+
+    manifest = {
+        'format': BUNDLE_FORMAT_VERSION,
+        'cache_tag': sys.implementation.cache_tag,
+        'built': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'packages': packages,
+        'modules': modules,
+    }
+    directory = os.path.dirname(bundle_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{bundle_path}.tmp"
+    with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_STORED) as bundle:
+        bundle.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        for arc_name, data in entries:
+            bundle.writestr(arc_name, data)
+    os.replace(temp_path, bundle_path)
+    return manifest
+
+
+def read_manifest(bundle_path: str) -> Dict:
+    """
+    Read and check the manifest of a bundle.
+
+    Raises:
+        BundleError: If the manifest is missing, malformed or built for another interpreter
+    """
+    try:
+        manifest = json.loads(zipimport.zipimporter(bundle_path).get_data(MANIFEST_NAME))
+    except (OSError, ValueError, zipimport.ZipImportError) as e:
+        raise BundleError(f"Cannot read manifest of bundle {bundle_path}: {str(e)}") from e
+    if manifest.get('format') != BUNDLE_FORMAT_VERSION:
+        raise BundleError(f"Bundle {bundle_path} has unsupported format {manifest.get('format')}")
+    if manifest.get('cache_tag') != sys.implementation.cache_tag:
+        raise BundleError(f"Bundle {bundle_path} was built for {manifest.get('cache_tag')}, "
+                          f"this interpreter needs {sys.implementation.cache_tag}")
+    return manifest
+
+
+class BundleModuleLoader(importlib.abc.Loader):
+    """Executes one module of a bundle from its precompiled bytecode."""
+
+    def __init__(self, importer: zipimport.zipimporter, name: str):
+        """
+        Args:
+            importer (zipimporter): Importer rooted at the directory of the module in the bundle
+            name (str): Module name relative to that directory
+        """
+        self.importer = importer
+        self.name = name
+
+    def exec_module(self, module):
+        exec(self.importer.get_code(self.name), module.__dict__)  # pylint: disable=exec-used
+
+    def get_code(self, fullname):
+        return self.importer.get_code(self.name)
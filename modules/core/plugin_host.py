@@ -0,0 +1,157 @@
+"""
+Out-of-process plugin host for PyQt6ify Pro.
+
+Runs the functions of CPU-heavy plugins in a pool of worker processes so they
+don't block the GUI. Plugins opt in by declaring:
+
+    COMPUTE_PLUGIN = True
+
+    def transform(factor, payload=None):   # payload: memoryview of the shared input buffer
+        ...
+
+Large inputs and bytes-like results are exchanged through shared memory
+blocks instead of being pickled. Results are delivered on the GUI thread
+through the resultReady and taskFailed signals. Compute plugin functions run
+in a fresh interpreter without Qt, so they must not touch widgets.
+"""
+
+import itertools
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+from loguru import logger
+from PyQt6.QtCore import QObject, pyqtSignal
+from modules.core.plugin_worker import RESULT_SHARED, is_compute_plugin, is_unexecuted, run_plugin_task
+
+# Bytes-like results smaller than this are simply pickled
+DEFAULT_SHARED_THRESHOLD = 64 * 1024
+
+
+class PluginHost(QObject):
+    """Pool of worker processes running compute plugins."""
+
+    resultReady = pyqtSignal(int, object)  # task id, result
+    taskFailed = pyqtSignal(int, str)  # task id, error message
+    _taskDone = pyqtSignal(int, object)  # emitted from the executor thread
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 shared_threshold: int = DEFAULT_SHARED_THRESHOLD, parent=None):
+        """
+        Initialize the plugin host. Worker processes are started on first use.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            shared_threshold (int): Size from which bytes-like results travel through shared memory
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.shared_threshold = shared_threshold
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._task_ids = itertools.count(1)
+        self._futures: Dict[int, Future] = {}
+        self._inputs: Dict[int, shared_memory.SharedMemory] = {}
+        self._taskDone.connect(self._on_task_done)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use."""
+        if self._executor is None:
+            # Forked children would inherit the Qt state of the GUI process
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+        return self._executor
+
+    def submit(self, module, function: str, *args, payload=None, **kwargs) -> int:
+        """
+        Run a function of a compute plugin in a worker process.
+
+        Args:
+            module: The plugin module, as loaded by ModuleLoader. A lazy module that has not
+                run yet stays unloaded here; the worker process checks that it is a compute plugin
+            function (str): Name of the function to call
+            payload: Optional bytes-like input, copied once into shared memory and
+                passed to the function as a memoryview in its 'payload' argument
+
+        Returns:
+            int: Task id used by resultReady and taskFailed
+
+        Raises:
+            ValueError: If the module is not a compute plugin loaded from a file
+        """
+        if is_unexecuted(module):
+            spec = object.__getattribute__(module, '__spec__')
+            name, path = spec.name, spec.origin
+        else:
+            if not is_compute_plugin(module):
+                raise ValueError(f"Module {module.__name__} is not a compute plugin")
+            name, path = module.__name__, getattr(module, '__file__', None)
+        if not path:
+            raise ValueError(f"Compute plugin {name} has no file to load in a worker process")
+
+        task_id = next(self._task_ids)
+        payload_ref = None
+        if payload is not None:
+            data = memoryview(payload).cast('B')
+            block = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+            block.buf[:data.nbytes] = data
+            self._inputs[task_id] = block
+            payload_ref = (block.name, data.nbytes)
+
+        try:
+            future = self._get_executor().submit(run_plugin_task, name, path, function, args, kwargs,
+                                                 payload_ref, self.shared_threshold)
+        except Exception:
+            self._release_input(task_id)
+            raise
+        self._futures[task_id] = future
+        future.add_done_callback(lambda done, task_id=task_id: self._taskDone.emit(task_id, done))
+        logger.debug(f"Submitted {name}.{function} to the plugin host as task {task_id}")
+        return task_id
+
+    def cancel(self, task_id: int) -> bool:
+        """Cancel a task that has not started yet."""
+        future = self._futures.get(task_id)
+        return future is not None and future.cancel()
+
+    def pending_tasks(self) -> int:
+        """Return the number of tasks whose result has not been delivered yet."""
+        return len(self._futures)
+
+    def _release_input(self, task_id: int) -> None:
+        """Free the shared input buffer of a task."""
+        block = self._inputs.pop(task_id, None)
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def _on_task_done(self, task_id: int, future: Future) -> None:
+        """Deliver a task result on the GUI thread."""
+        self._futures.pop(task_id, None)
+        self._release_input(task_id)
+        if future.cancelled():
+            self.taskFailed.emit(task_id, "cancelled")
+            return
+        try:
+            kind, value = future.result()
+            if kind == RESULT_SHARED:
+                block = shared_memory.SharedMemory(name=value[0])
+                try:
+                    value = bytes(block.buf[:value[1]])
+                finally:
+                    block.close()
+                    block.unlink()
+        except Exception as e:
+            logger.error(f"Plugin host task {task_id} failed: {str(e)}")
+            self.taskFailed.emit(task_id, str(e))
+            return
+        self.resultReady.emit(task_id, value)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, dropping tasks that have not started."""
+        if self._executor is not None:
+            for future in self._futures.values():
+                future.cancel()
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        for task_id in list(self._inputs):
+            self._release_input(task_id)
@@ -0,0 +1,248 @@
+"""
+Dependency-aware plugin setup for PyQt6ify Pro.
+
+Plugins loaded by ModuleLoader may declare:
+
+    DEPENDS = ('other_plugin',)   # plugins whose setup must finish first
+    SETUP_THREAD = 'worker'       # run setup() on the thread pool (default: 'gui')
+
+    def setup():
+        ...
+
+Hooks with SETUP_THREAD = 'worker' must not touch Qt widgets; they run in
+parallel with every other hook whose dependencies are satisfied. All other
+hooks run one at a time on the calling (GUI) thread.
+
+Reading these attributes runs the body of a lazily loaded plugin. To keep
+plugins without a setup() hook unloaded, the declarations can be read from the
+plugin sources instead with read_declarations(), provided they are literals.
+It also reads COMPUTE_PLUGIN, for the plugin host.
+"""
+
+import ast
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from modules.core.profiler import profiler
+
+GUI_THREAD = 'gui'
+WORKER_THREAD = 'worker'
+
+SETUP_OK = 'ok'
+SETUP_FAILED = 'failed'
+SETUP_SKIPPED = 'skipped'
+
+
+# Names read from a plugin by the setup
+_DECLARED_NAMES = {'DEPENDS', 'SETUP_THREAD', 'COMPUTE_PLUGIN', 'setup'}
+
+
+class PluginDependencyError(Exception):
+    """Exception raised when plugin dependencies are missing or form a cycle."""
+
+
+def read_declarations(source: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the setup declarations of a plugin from its source, without running it.
+
+    Args:
+        source (str): Source code of the plugin
+
+    Returns:
+        Optional[Dict[str, Any]]: 'depends', 'setup_thread', 'has_setup' and 'compute', or None if
+        the source does not parse or binds one of the names other than by a literal
+        assignment or a function definition at module level
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    declarations = {'depends': (), 'setup_thread': GUI_THREAD, 'has_setup': False, 'compute': False}
+    static = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == 'setup':
+            declarations['has_setup'] = True
+            static.add(node)
+        elif (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+              and node.targets[0].id in ('DEPENDS', 'SETUP_THREAD', 'COMPUTE_PLUGIN')):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                return None
+            if node.targets[0].id == 'DEPENDS':
+                if not isinstance(value, (tuple, list)) or not all(isinstance(item, str) for item in value):
+                    return None
+                declarations['depends'] = tuple(value)
+            elif node.targets[0].id == 'COMPUTE_PLUGIN':
+                declarations['compute'] = bool(value)
+            else:
+                declarations['setup_thread'] = value
+            static.add(node.targets[0])
+
+    # Any other binding, e.g. an import, a star import or a conditional assignment, needs the module to run
+    for node in ast.walk(tree):
+        if node in static:
+            continue
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store) and node.id in _DECLARED_NAMES:
+            return None
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name in _DECLARED_NAMES:
+            return None
+        if isinstance(node, ast.alias) and (node.name == '*' or (node.asname or node.name) in _DECLARED_NAMES):
+            return None
+    return declarations
+
+
+def _module_declarations(module) -> Dict[str, Any]:
+    """Read the setup declarations of a loaded plugin from its attributes."""
+    return {
+        'depends': getattr(module, 'DEPENDS', ()),
+        'setup_thread': getattr(module, 'SETUP_THREAD', GUI_THREAD),
+        'has_setup': callable(getattr(module, 'setup', None)),
+    }
+
+
+def _resolve_name(plugin: str, dependency: str, names: List[str]) -> str:
+    """
+    Match a declared dependency to a module name, either exactly or by its last component.
+
+    Raises:
+        PluginDependencyError: If no plugin matches, or several match the short name
+    """
+    if dependency in names:
+        return dependency
+    matches = [name for name in names if name.rsplit('.', 1)[-1] == dependency]
+    if not matches:
+        raise PluginDependencyError(f"Plugin {plugin} depends on unknown plugin {dependency}")
+    if len(matches) > 1:
+        raise PluginDependencyError(f"Plugin {plugin} has ambiguous dependency '{dependency}': {', '.join(matches)}")
+    return matches[0]
+
+
+def build_dependency_graph(modules: Dict[str, object],
+                           declarations: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, List[str]]:
+    """
+    Build the dependency graph of a set of plugins.
+
+    Args:
+        modules (Dict[str, object]): Loaded plugin modules by name
+        declarations (Dict[str, dict], optional): Results of read_declarations() by plugin name,
+            used instead of the attributes of those plugins
+
+    Returns:
+        Dict[str, List[str]]: The names each plugin depends on
+
+    Raises:
+        PluginDependencyError: If a dependency is unknown or the graph has a cycle
+    """
+    declarations = declarations or {}
+    names = sorted(modules)
+    graph = {}
+    for name in names:
+        dependencies = []
+        declared = declarations.get(name)
+        for dependency in declared['depends'] if declared is not None else getattr(modules[name], 'DEPENDS', ()):
+            dependencies.append(_resolve_name(name, dependency, names))
+        graph[name] = dependencies
+
+    # Depth-first search for cycles
+    visiting, visited = [], set()
+
+    def visit(name):
+        if name in visited:
+            return
+        if name in visiting:
+            cycle = visiting[visiting.index(name):] + [name]
+            raise PluginDependencyError(f"Plugin dependency cycle: {' -> '.join(cycle)}")
+        visiting.append(name)
+        for dependency in graph[name]:
+            visit(dependency)
+        visiting.pop()
+        visited.add(name)
+
+    for name in names:
+        visit(name)
+    return graph
+
+
+def _run_setup(name: str, module) -> str:
+    """Run one setup hook and return its status."""
+    try:
+        with profiler.span(f'plugin.setup:{name}'):
+            module.setup()
+        return SETUP_OK
+    except Exception as e:
+        logger.error(f"Error in setup of plugin {name}: {str(e)}")
+        return SETUP_FAILED
+
+
+def run_plugin_setup(modules: Dict[str, object], max_workers: Optional[int] = None,
+                     declarations: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, str]:
+    """
+    Run the setup hooks of a set of plugins in dependency order.
+
+    Args:
+        modules (Dict[str, object]): Loaded plugin modules by name
+        max_workers (int, optional): Size of the thread pool for worker hooks
+        declarations (Dict[str, dict], optional): Results of read_declarations() by plugin name;
+            those plugins are only accessed to run their setup() hook
+
+    Returns:
+        Dict[str, str]: SETUP_OK, SETUP_FAILED or SETUP_SKIPPED for each plugin. Plugins
+        without a setup() hook count as SETUP_OK; plugins whose dependencies did not
+        set up successfully are skipped.
+
+    Raises:
+        PluginDependencyError: If a dependency is unknown or the graph has a cycle
+    """
+    declarations = declarations or {}
+    graph = build_dependency_graph(modules, declarations)
+    waiting_on = {name: set(dependencies) for name, dependencies in graph.items()}
+    dependents = {name: [] for name in graph}
+    for name, dependencies in graph.items():
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+
+    results = {}
+    ready = [name for name in sorted(graph) if not waiting_on[name]]
+
+    def complete(name, status):
+        results[name] = status
+        for dependent in dependents[name]:
+            if status != SETUP_OK:
+                if dependent not in results:
+                    logger.warning(f"Skipping setup of plugin {dependent}: {name} did not set up")
+                    complete(dependent, SETUP_SKIPPED)
+                continue
+            waiting_on[dependent].discard(name)
+            if not waiting_on[dependent] and dependent not in results:
+                ready.append(dependent)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='plugin-setup') as executor:
+        running = {}
+        while ready or running:
+            gui_ready = []
+            for name in ready:
+                declared = declarations.get(name) or _module_declarations(modules[name])
+                if not declared['has_setup']:
+                    gui_ready.append((name, False))
+                elif declared['setup_thread'] == WORKER_THREAD:
+                    running[executor.submit(_run_setup, name, modules[name])] = name
+                else:
+                    gui_ready.append((name, True))
+            ready.clear()
+
+            # Worker hooks keep running while the GUI-thread hooks execute here
+            for name, has_setup in gui_ready:
+                if name in results:
+                    continue
+                complete(name, _run_setup(name, modules[name]) if has_setup else SETUP_OK)
+
+            if ready or not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                complete(running.pop(future), future.result())
+
+    logger.info(f"Plugin setup finished: {sum(status == SETUP_OK for status in results.values())}"
+                f" of {len(results)} plugins ready")
+    return results
@@ -0,0 +1,108 @@
+"""
+Worker side of the out-of-process plugin host for PyQt6ify Pro.
+
+Runs in the worker processes of PluginHost, so it must not import Qt. Each
+worker loads a compute plugin once and keeps it for the following tasks.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import zipimport
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+RESULT_VALUE = 'value'
+RESULT_SHARED = 'shared'
+
+_plugins: Dict[str, Any] = {}
+
+
+def is_compute_plugin(module) -> bool:
+    """Return True if a plugin module asks to run in the plugin host."""
+    return bool(getattr(module, 'COMPUTE_PLUGIN', False))
+
+
+def is_unexecuted(module) -> bool:
+    """Return True if a module registered by importlib.util.LazyLoader has not run yet.
+
+    Any attribute access would run it; its __spec__ can still be read with object.__getattribute__.
+    """
+    # LazyLoader turns the module into a plain module once it has run
+    return isinstance(module, types.ModuleType) and type(module) is not types.ModuleType
+
+
+def _load_plugin(name: str, path: str):
+    """Load a plugin module in this worker, from a source file or from a plugin bundle."""
+    module = _plugins.get(name)
+    if module is not None:
+        return module
+
+    bundle_path, separator, inner_path = path.partition('.plugin.zip' + os.sep)
+    if separator:
+        package, _, leaf = os.path.splitext(inner_path)[0].rpartition(os.sep)
+        importer = zipimport.zipimporter(os.path.join(bundle_path + '.plugin.zip', package, '')
+                                         if package else bundle_path + '.plugin.zip')
+        spec = importlib.util.spec_from_loader(name, loader=None, origin=path)
+        module = importlib.util.module_from_spec(spec)
+        module.__file__ = path
+        sys.modules[name] = module
+        exec(importer.get_code(leaf), module.__dict__)  # pylint: disable=exec-used
+    else:
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None:
+            raise ImportError(f"Cannot create module spec for {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    _plugins[name] = module
+    return module
+
+
+def run_plugin_task(name: str, path: str, function: str, args: tuple, kwargs: dict,
+                    payload: Optional[Tuple[str, int]], shared_threshold: int) -> Tuple[str, Any]:
+    """
+    Run one function of a compute plugin.
+
+    Args:
+        name (str): Module name of the plugin
+        path (str): File the plugin was loaded from
+        function (str): Name of the function to call
+        args (tuple): Positional arguments
+        kwargs (dict): Keyword arguments
+        payload (tuple, optional): Name and size of a shared memory block, passed to the
+            function as a memoryview in the 'payload' keyword argument
+        shared_threshold (int): Bytes-like results of at least this size are returned
+            through a new shared memory block instead of being pickled
+
+    Returns:
+        tuple: (RESULT_VALUE, value) or (RESULT_SHARED, (block name, size))
+    """
+    module = _load_plugin(name, path)
+    if not is_compute_plugin(module):
+        # Not checked by the host for plugins it has not loaded itself
+        raise ValueError(f"Module {name} is not a compute plugin")
+    func = getattr(module, function)
+    block = None
+    view = None
+    try:
+        if payload is not None:
+            block = shared_memory.SharedMemory(name=payload[0])
+            view = block.buf[:payload[1]]
+            kwargs = dict(kwargs, payload=view)
+        result = func(*args, **kwargs)
+        if isinstance(result, (bytes, bytearray, memoryview)):
+            result = memoryview(result).cast('B')
+            if result.nbytes >= shared_threshold > 0:
+                output = shared_memory.SharedMemory(create=True, size=max(result.nbytes, 1))
+                output.buf[:result.nbytes] = result
+                output.close()
+                return RESULT_SHARED, (output.name, result.nbytes)
+            result = result.tobytes()
+        return RESULT_VALUE, result
+    finally:
+        if view is not None:
+            view.release()
+        if block is not None:
+            block.close()
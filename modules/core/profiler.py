@@ -0,0 +1,193 @@
+"""
+Startup profiler for PyQt6ify Pro.
+
+Records timed spans for the startup phases and writes them as a Chrome trace
+(JSON) file that can be opened in chrome://tracing or https://ui.perfetto.dev.
+Recording stops once finish() is called at the end of startup, so decorated
+functions that keep running afterwards, such as Config.load, cost nothing more.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+
+class StartupProfiler:
+    """Collects startup spans and exports them in Chrome trace format."""
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.enabled = False
+        self.output_path = None
+        self.recording = True  # Until finish()
+        self._origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._marks = set()
+
+    def _timestamp(self, value: float) -> float:
+        """Convert a perf_counter value to microseconds since the profiler origin."""
+        return round((value - self._origin) * 1_000_000, 3)
+
+    def enable(self, output_path: str) -> None:
+        """
+        Enable writing the trace file.
+
+        Spans are recorded until finish() whether or not the profiler is enabled,
+        because it is enabled only once the command line has been read; the trace
+        is only written to disk once the profiler has been enabled.
+
+        Args:
+            output_path (str): Path of the JSON trace file to write
+        """
+        self.enabled = True
+        self.output_path = output_path
+
+    def finish(self) -> None:
+        """
+        Stop recording at the end of startup.
+
+        The events of an enabled profiler are kept for write(); those of a
+        disabled one are dropped, since nothing will ever write them.
+        """
+        with self._lock:
+            self.recording = False
+            if not self.enabled:
+                self._events = []
+                self._marks = set()
+
+    def record(self, name: str, start: float, end: float, **args) -> None:
+        """
+        Record a completed span.
+
+        Args:
+            name (str): Name of the span
+            start (float): time.perf_counter() value when the span started
+            end (float): time.perf_counter() value when the span ended
+            **args: Extra values shown with the span in the trace viewer
+        """
+        if not self.recording:
+            return
+        event = {
+            'name': name,
+            'ph': 'X',
+            'ts': self._timestamp(start),
+            'dur': round((end - start) * 1_000_000, 3),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            self._events.append(event)
+
+    def mark(self, name: str, once: bool = False, **args) -> None:
+        """
+        Record an instant event, such as the first painted frame.
+
+        Args:
+            name (str): Name of the event
+            once (bool): If True, only the first mark with this name is recorded
+            **args: Extra values shown with the event in the trace viewer
+        """
+        with self._lock:
+            if not self.recording or (once and name in self._marks):
+                return
+            self._marks.add(name)
+            event = {
+                'name': name,
+                'ph': 'i',
+                's': 'g',
+                'ts': self._timestamp(time.perf_counter()),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            }
+            if args:
+                event['args'] = args
+            self._events.append(event)
+
+    def has_mark(self, name: str) -> bool:
+        """Return True if an instant event with this name was recorded."""
+        with self._lock:
+            return name in self._marks
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """Context manager that records the duration of its body as a span."""
+        if not self.recording:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), **args)
+
+    def profile(self, name: Optional[str] = None):
+        """Decorator that records every call of the wrapped function as a span."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.recording:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Get a copy of the recorded events."""
+        with self._lock:
+            return list(self._events)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Get the recorded events as a Chrome trace document."""
+        return {
+            'traceEvents': sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+        }
+
+    def write(self, output_path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the trace file.
+
+        Args:
+            output_path (str, optional): Overrides the path given to enable()
+
+        Returns:
+            Optional[str]: Path of the written file, or None if nothing was written
+        """
+        path = output_path or self.output_path
+        if not path:
+            return None
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_chrome_trace(), f, indent=1)
+            logger.info(f"Startup profile written to {path}")
+            return path
+        except OSError as e:
+            logger.error(f"Error writing startup profile: {str(e)}")
+            return None
+
+    def reset(self) -> None:
+        """Discard all recorded events, restart the clock and resume recording."""
+        with self._lock:
+            self.recording = True
+            self._events = []
+            self._marks = set()
+            self._origin = time.perf_counter()
+
+
+# Shared profiler used by the startup code
+profiler = StartupProfiler()
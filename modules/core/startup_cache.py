@@ -0,0 +1,164 @@
+"""
+Warm-start cache for PyQt6ify Pro.
+
+Stores data derived from files read at startup (the parsed configuration, the
+theme palettes, the icon table) in one binary file. Each entry is keyed by the
+modification time and size of its source files, so it is rebuilt
+automatically as soon as one of them changes.
+"""
+
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from loguru import logger
+
+# Bump when the layout of cached values changes
+CACHE_FORMAT_VERSION = 2
+
+# Relative to the working directory, like config/config.ini whose parsed content it holds
+DEFAULT_CACHE_PATH = os.path.join('cache', 'startup.cache')
+
+Fingerprint = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+class StartupCache:
+    """Binary snapshot of startup data keyed by source file fingerprints."""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH):
+        """
+        Initialize the cache. The cache file is read on first use.
+
+        Args:
+            path (str, optional): Path of the cache file, or None for a cache kept only in memory
+        """
+        self.path = path
+        self._entries: Optional[Dict[str, Tuple[Fingerprint, Any]]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(sources: Iterable[str]) -> Fingerprint:
+        """
+        Get the fingerprint of a set of source files.
+
+        Missing files are part of the fingerprint, so creating them invalidates the entry.
+        """
+        result = []
+        for source in sources:
+            try:
+                stat = os.stat(source)
+                result.append((source, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                result.append((source, None, None))
+        return tuple(result)
+
+    def _load(self) -> Dict[str, Tuple[Fingerprint, Any]]:
+        """Read the cache file, discarding it if it is unreadable or from another format version."""
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self.path is None:
+            return self._entries
+        try:
+            with open(self.path, 'rb') as f:
+                version, entries = pickle.load(f)
+            if version == CACHE_FORMAT_VERSION and isinstance(entries, dict):
+                self._entries = entries
+            else:
+                logger.debug(f"Ignoring startup cache with format version {version}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable startup cache {self.path}: {str(e)}")
+        return self._entries
+
+    def get(self, key: str, sources: Iterable[str], default: Any = None) -> Any:
+        """
+        Get a cached value if its source files have not changed.
+
+        Args:
+            key (str): Name of the entry
+            sources (Iterable[str]): Files the value was built from
+            default (Any): Returned when the entry is missing or stale
+
+        Returns:
+            Any: The cached value or the default
+        """
+        fingerprint = self.fingerprint(sources)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return default
+
+    def put(self, key: str, sources: Iterable[str], value: Any) -> None:
+        """
+        Store a value built from the given source files.
+
+        Call this after the sources have been read, so that the fingerprint
+        matches the contents the value was built from.
+        """
+        fingerprint = self.fingerprint(sources)
+        with self._lock:
+            self._load()[key] = (fingerprint, value)
+            self._dirty = True
+
+    def fetch(self, key: str, sources: Iterable[str], builder: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, building and storing it when it is missing or stale.
+
+        Args:
+            key (str): Name of the entry
+            sources (Iterable[str]): Files the value is built from
+            builder (Callable[[], Any]): Builds the value from the sources
+
+        Returns:
+            Any: The cached or freshly built value
+        """
+        sources = list(sources)
+        missing = object()
+        value = self.get(key, sources, missing)
+        if value is missing:
+            value = builder()
+            self.put(key, sources, value)
+        return value
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        with self._lock:
+            entries = self._load()
+            if key is None:
+                entries.clear()
+            else:
+                entries.pop(key, None)
+            self._dirty = True
+
+    def flush(self) -> bool:
+        """
+        Write the cache file if any entry changed.
+
+        Returns:
+            bool: True if the file was written
+        """
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return False
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, 'wb') as f:
+                    pickle.dump((CACHE_FORMAT_VERSION, self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+                logger.debug(f"Startup cache written to {self.path}")
+                return True
+            except Exception as e:
+                logger.warning(f"Error writing startup cache: {str(e)}")
+                return False
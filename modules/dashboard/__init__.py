@@ -1,6 +1,10 @@
 """
 Dashboard module initialization.
 """
-from modules.dashboard.dashboard import Dashboard
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Dashboard': '.dashboard',
+})
 
 __all__ = ['Dashboard']
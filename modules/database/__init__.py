@@ -1,6 +1,17 @@
 """
 Database module initialization.
 """
-from modules.database.database import Database
+from modules import lazy_exports
 
-__all__ = ['Database']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Database': '.database',
+    'ConnectionPool': '.pool',
+    'AsyncDatabase': '.async_db',
+    'GroupCommitWriter': '.writer',
+    'QueryCache': '.query_cache',
+    'migrate': '.migrations',
+    'MigrationError': '.migrations',
+})
+
+__all__ = ['Database', 'ConnectionPool', 'AsyncDatabase', 'GroupCommitWriter', 'QueryCache', 'migrate',
+           'MigrationError']
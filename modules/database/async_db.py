@@ -0,0 +1,184 @@
+"""
+Non-blocking database access for PyQt6ify Pro.
+
+Queries run on a dedicated worker thread with its own pooled connection, in
+the order they were submitted, so a slow query never freezes the window.
+Each call returns a Future; the result is also delivered on the GUI thread
+through the queryFinished and queryFailed signals:
+
+    future = database.async_db.fetch_all("SELECT name FROM themes")
+    database.async_db.queryFinished.connect(on_rows)
+"""
+
+import queue
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Iterable, Optional, Sequence, Set
+from loguru import logger
+from PyQt6.QtCore import QObject, pyqtSignal
+from modules.database.pool import ConnectionPool
+from modules.database.query_cache import QueryCache
+
+
+class AsyncDatabase(QObject):
+    """Runs database calls on one worker thread and reports their results as Qt signals."""
+
+    queryFinished = pyqtSignal(object, object)  # future, result
+    queryFailed = pyqtSignal(object, str)  # future, error message
+    _queryDone = pyqtSignal(object)  # emitted from the worker thread
+
+    def __init__(self, pool: ConnectionPool, cache: Optional[QueryCache] = None, parent=None, writer=None):
+        """
+        Initialize the worker. Its thread starts on the first call.
+
+        Create it on the GUI thread: the signals are delivered on the thread that owns it.
+
+        Args:
+            pool (ConnectionPool): Pool providing the worker's connection
+            cache (QueryCache, optional): Cache serving fetch_all() and invalidated by writes
+            parent: Optional parent object
+            writer (GroupCommitWriter, optional): Writer committing execute() and executemany();
+                without one they commit on the worker's connection
+        """
+        super().__init__(parent)
+        self.pool = pool
+        self.cache = cache
+        self.writer = writer
+        self._queue: 'queue.Queue[Optional[tuple]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._connection = None  # Connection of the worker thread, for interrupt()
+        self._running: Optional[Future] = None
+        self._interrupted: Set[Future] = set()
+        self._queryDone.connect(self._on_query_done)
+
+    def submit(self, func: Callable, *args) -> Future:
+        """
+        Run a function on the worker thread.
+
+        Args:
+            func (Callable): Called as func(connection, *args) with the worker's connection;
+                it can run several statements, e.g. a transaction
+
+        Returns:
+            Future: Resolves to the return value of func
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                # Each worker gets its own queue, so one still finishing after close() never runs new calls
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name='database-worker',
+                                                daemon=True)
+                self._thread.start()
+            self._queue.put((future, func, args))
+        future.add_done_callback(self._queryDone.emit)
+        return future
+
+    def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        """Run a query; the future resolves to the list of rows, cached if a QueryCache was given."""
+        if self.cache is not None:
+            return self.submit(self.cache.fetch_all, sql, params)
+        return self.submit(lambda connection: connection.execute(sql, params).fetchall())
+
+    def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        """Run a query; the future resolves to the first row, or None."""
+        return self.submit(lambda connection: connection.execute(sql, params).fetchone())
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        """Run a statement in its own transaction; the future resolves to the number of changed rows."""
+        return self.submit(self._write, sql, params, False)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> Future:
+        """Run a statement for each row in one transaction; the future resolves to the number of changed rows."""
+        return self.submit(self._write, sql, rows, True)
+
+    def _write(self, connection, sql: str, params: Any, many: bool) -> int:
+        """Run a write in its own transaction, then drop the cached results it made stale."""
+        if self.writer is not None:
+            # Waiting here keeps the calls in submission order; the writer drops the stale results
+            return (self.writer.executemany if many else self.writer.execute)(sql, params).result()
+        if self.cache is None:
+            with connection:
+                return (connection.executemany(sql, params) if many else connection.execute(sql, params)).rowcount
+        with connection:
+            cursor, info = self.cache.run(connection, sql, params, many)
+        self.cache.invalidate(info.writes)
+        return cursor.rowcount
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a call. A queued call is dropped; a running query is interrupted.
+
+        Returns:
+            bool: False if the call had already finished
+        """
+        if future.cancel():
+            return True
+        with self._lock:
+            if self._running is not future:
+                return False
+            self._interrupted.add(future)
+            self._connection.interrupt()
+        return True
+
+    def pending_queries(self) -> int:
+        """Return the number of calls waiting for the worker, not counting the running one."""
+        return self._queue.qsize()
+
+    def _run(self, calls: 'queue.Queue[Optional[tuple]]') -> None:
+        """Run queued calls in order until close() is called."""
+        connection = self.pool.connection()
+        with self._lock:
+            self._connection = connection
+        while True:
+            item = calls.get()
+            if item is None:
+                break
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._running = future
+            try:
+                result = func(connection, *args)
+            except Exception as e:
+                with self._lock:
+                    interrupted = future in self._interrupted
+                    self._interrupted.discard(future)
+                    self._running = None
+                future.set_exception(CancelledError() if interrupted else e)
+            else:
+                with self._lock:
+                    # An interrupt that arrived after the query ended has nothing to stop
+                    self._interrupted.discard(future)
+                    self._running = None
+                future.set_result(result)
+        self.pool.close_connection()
+
+    def _on_query_done(self, future: Future) -> None:
+        """Deliver a result on the GUI thread."""
+        if future.cancelled():
+            self.queryFailed.emit(future, "cancelled")
+            return
+        error = future.exception()
+        if isinstance(error, CancelledError):
+            # Interrupted while running
+            self.queryFailed.emit(future, "cancelled")
+            return
+        if error is not None:
+            logger.error(f"Database query failed: {str(error)}")
+            self.queryFailed.emit(future, str(error))
+            return
+        self.queryFinished.emit(future, future.result())
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the worker after the calls already queued."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            if thread is None:
+                return
+            self._queue.put(None)
+        if wait:
+            thread.join()
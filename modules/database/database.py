@@ -2,63 +2,218 @@
 Database module for PyQt6ify Pro.
 """
 
+import itertools
+import json
 import os
 import sqlite3
+import threading
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from loguru import logger
+from modules.config.backends import DEFAULT_DATABASE_PATH, SqliteBackend
 from modules.config.config import Config
+from modules.database.migrations import MigrationError, migrate
+from modules.database.pool import ConnectionPool
+from modules.database.query_cache import QueryCache
+
+# Rows written per executemany() call by bulk_insert()
+DEFAULT_CHUNK_SIZE = 5000
+
+# Conflict clauses accepted by bulk_insert()
+CONFLICT_CLAUSES = {None: 'INSERT', 'replace': 'INSERT OR REPLACE', 'ignore': 'INSERT OR IGNORE'}
+
 
 class Database:
     """Database class for PyQt6ify Pro."""
 
-    def __init__(self, config: Config):
-        """Initialize the database."""
+    def __init__(self, config: Config, auto_init: bool = True, db_path: Optional[str] = None):
+        """
+        Initialize the database.
+
+        Args:
+            config (Config): Configuration manager instance
+            auto_init (bool): If False, init_db() must be called before use, e.g. from a boot task
+            db_path (str, optional): Database file; defaults to the application database
+        """
         self.config = config
-        self.db_path = os.path.join(os.path.dirname(__file__), 'pyqt6ify.db')
-        self.connection = None
-        self.cursor = None
+        self.db_path = db_path or DEFAULT_DATABASE_PATH
+        self.pool: Optional[ConnectionPool] = None
+        # Results of read-only queries, shared by every thread
+        self.query_cache = QueryCache(config.value('Database', 'query_cache_size'))
+        self._async_db = None  # Created by the first use of async_db
+        self._writer = None  # Created by the first use of writer
 
         # Initialize database
-        self.init_db()
+        if auto_init:
+            self.init_db()
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Connection of the calling thread, tuned by the [Database] section; None before init_db()."""
+        return self.pool.connection() if self.pool is not None else None
+
+    @property
+    def async_db(self):
+        """AsyncDatabase running queries on a worker thread, created on first use from the GUI thread."""
+        if self._async_db is None:
+            from modules.database.async_db import AsyncDatabase
+            self._async_db = AsyncDatabase(self.pool, cache=self.query_cache, writer=self.writer)
+        return self._async_db
+
+    @property
+    def writer(self):
+        """
+        GroupCommitWriter through which components should send their writes, created on first use.
+
+        execute() and the writes of async_db go through it too. bulk_insert() and the save_*
+        methods write on the connection of the calling thread instead, in one transaction of
+        their own, so that a large import streams its rows without holding up the writes of
+        other components. A configuration kept in the settings table by a SqliteBackend is
+        written on the backend's own connection, which waits for the lock up to busy_timeout.
+        """
+        if self._writer is None:
+            from modules.database.writer import GroupCommitWriter
+            self._writer = GroupCommitWriter(self.pool, self.config.value('Database', 'commit_window_ms') / 1000,
+                                             cache=self.query_cache)
+        return self._writer
 
     def init_db(self):
-        """Initialize the database connection and tables."""
+        """Initialize the connection pool and tables."""
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.cursor = self.connection.cursor()
+            # Each thread gets its own connection, so the boot task and the GUI thread never share one
+            self.pool = ConnectionPool.from_config(self.db_path, self.config)
 
-            # Create tables if they don't exist
+            # Create or upgrade the tables
             self.create_tables()
 
+            backend = self.config.backend
+            if isinstance(backend, SqliteBackend) and os.path.abspath(backend.path) == os.path.abspath(self.db_path):
+                # The configuration writes its table on a connection of its own; keep cached queries of it fresh
+                backend.add_commit_listener(self._on_settings_committed)
+
+            if threading.current_thread() is not threading.main_thread():
+                # A boot task runs on a QThreadPool thread, which the pool cannot tell has ended
+                self.pool.close_connection()
+
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
 
+    def _on_settings_committed(self, table: str) -> None:
+        """Drop the cached results of a table written by the configuration backend."""
+        self.query_cache.invalidate([table])
+
     def create_tables(self):
-        """Create database tables."""
+        """Bring the database schema up to date; a single pragma read when it already is."""
         try:
-            # Create settings table
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            ''')
-
-            # Create themes table
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS themes (
-                    name TEXT PRIMARY KEY,
-                    data TEXT
-                )
-            ''')
-
-            self.connection.commit()
-            logger.info("Database tables created successfully")
-        except Exception as e:
+            if migrate(self.connection):
+                # Tables may have changed under cached results
+                self.query_cache.clear()
+        except MigrationError as e:
             logger.error(f"Error creating tables: {str(e)}")
 
+    def query(self, sql: str, params: Any = ()) -> List[tuple]:
+        """
+        Run a read-only query, reusing its cached rows until a write touches one of its tables.
+
+        Use the connection directly for queries whose result changes without a write, e.g.
+        calls to random().
+
+        Returns:
+            List[tuple]: The rows
+        """
+        return self.query_cache.fetch_all(self.connection, sql, params)
+
+    def execute(self, sql: str, params: Any = ()) -> int:
+        """
+        Run a statement through the writer and wait until it is committed.
+
+        The writer drops the cached results the statement made stale before returning.
+        Don't call it from a function running on the writer thread.
+
+        Returns:
+            int: Number of changed rows
+        """
+        return self.writer.execute(sql, params).result()
+
+    def bulk_insert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, conflict: Optional[str] = None,
+                    progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Insert many rows in one transaction.
+
+        Rows are consumed lazily, so generators are never held in memory as a whole,
+        and written with executemany() in chunks. Nothing is written if a row fails.
+        The insert runs on the connection of the calling thread, not through the writer.
+
+        Args:
+            table (str): Table to insert into
+            columns (Sequence[str]): Column names, in the order of the row values
+            rows (Iterable): Rows of values; any iterable, including a generator
+            chunk_size (int): Rows per executemany() call
+            conflict (str, optional): 'replace' or 'ignore' to upsert or skip rows whose key exists
+            progress (Callable, optional): Called with the number of rows written so far after each chunk
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ValueError: If a name is not a plain identifier or the conflict mode is unknown
+            sqlite3.Error: If the insert fails; the transaction is rolled back
+        """
+        if conflict not in CONFLICT_CLAUSES:
+            raise ValueError(f"Unknown conflict mode: {conflict!r}")
+        for name in [table, *columns]:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid identifier: {name!r}")
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+
+        sql = (f"{CONFLICT_CLAUSES[conflict]} INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        connection = self.connection
+        iterator = iter(rows)
+        written = 0
+        with connection:
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                connection.executemany(sql, chunk)
+                written += len(chunk)
+                if progress is not None:
+                    progress(written)
+        self.query_cache.invalidate([table])
+        logger.debug(f"Inserted {written} rows into {table}")
+        return written
+
+    def save_settings(self, settings: Union[Mapping[str, str], Iterable[Tuple[str, str]]], **kwargs) -> int:
+        """Insert or replace rows of the settings table, from a mapping or (key, value) pairs.
+
+        Keyword arguments are passed to bulk_insert().
+        """
+        items = settings.items() if isinstance(settings, Mapping) else settings
+        return self.bulk_insert('settings', ('key', 'value'), items, conflict='replace', **kwargs)
+
+    def save_themes(self, themes: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]], **kwargs) -> int:
+        """Insert or replace rows of the themes table, from a mapping or (name, data) pairs.
+
+        Data that isn't a string is stored as JSON. Keyword arguments are passed to bulk_insert().
+        """
+        items = themes.items() if isinstance(themes, Mapping) else themes
+        rows = ((name, data if isinstance(data, str) else json.dumps(data)) for name, data in items)
+        return self.bulk_insert('themes', ('name', 'data'), rows, conflict='replace', **kwargs)
+
     def close(self):
-        """Close the database connection."""
-        if self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
+        """Close the connections of every thread."""
+        if isinstance(self.config.backend, SqliteBackend):
+            self.config.backend.remove_commit_listener(self._on_settings_committed)
+        if self._async_db is not None:
+            self._async_db.close()
+            self._async_db = None
+        if self._writer is not None:
+            # Commits the writes still queued
+            self._writer.close()
+            self._writer = None
+        if self.pool is not None:
+            self.pool.close_all()
+            logger.info("Database connections closed")
@@ -0,0 +1,134 @@
+"""
+Schema migrations for the database of PyQt6ify Pro.
+
+The schema version is kept in PRAGMA user_version. Each migration brings the
+schema from the previous version to its own; new migrations are appended to
+MIGRATIONS with the next version number and never edited once released.
+Checking a current database costs a single pragma read. Pending migrations run
+in one transaction, so a failed upgrade leaves the database as it was.
+"""
+
+import sqlite3
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+from loguru import logger
+
+# Rows read and written per step by rewrite_rows()
+DEFAULT_REWRITE_CHUNK = 5000
+
+
+class MigrationError(Exception):
+    """Raised when the database schema cannot be brought up to date."""
+
+
+class Migration(NamedTuple):
+    """One step of the schema history."""
+
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]  # Runs inside the upgrade transaction; must not commit
+
+
+def _create_base_tables(connection: sqlite3.Connection) -> None:
+    """Create the settings and themes tables; databases from before migrations already have them."""
+    connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+    connection.execute("CREATE TABLE IF NOT EXISTS themes (name TEXT PRIMARY KEY, data TEXT)")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Create settings and themes tables", _create_base_tables),
+]
+
+
+def schema_version(connection: sqlite3.Connection) -> int:
+    """Get the schema version of a database; 0 for a new one."""
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(connection: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS) -> int:
+    """
+    Apply the migrations the database has not had yet.
+
+    Args:
+        connection (sqlite3.Connection): Connection with no open transaction
+        migrations (Sequence[Migration]): Schema history, in version order
+
+    Returns:
+        int: Number of migrations applied
+
+    Raises:
+        MigrationError: If a migration fails, or the database is newer than the application
+    """
+    latest = migrations[-1].version if migrations else 0
+    current = schema_version(connection)
+    if current == latest:
+        return 0
+    if current > latest:
+        raise MigrationError(f"Database schema version {current} is newer than this application ({latest})")
+
+    try:
+        # Take the write lock first, so that another process can't migrate at the same time
+        connection.execute("BEGIN IMMEDIATE")
+        current = schema_version(connection)
+        pending = [migration for migration in migrations if migration.version > current]
+        for migration in pending:
+            logger.info(f"Migrating database to version {migration.version}: {migration.description}")
+            migration.apply(connection)
+        if pending:
+            connection.execute(f"PRAGMA user_version = {int(latest)}")
+        connection.commit()
+    except Exception as e:
+        if connection.in_transaction:
+            connection.rollback()
+        logger.error(f"Database migration failed: {str(e)}")
+        raise MigrationError(f"Database migration failed: {str(e)}") from e
+    logger.info(f"Database schema migrated from version {current} to {latest}")
+    return len(pending)
+
+
+def rewrite_rows(connection: sqlite3.Connection, table: str, columns: Sequence[str],
+                 transform: Callable[[tuple], Optional[Sequence[Any]]],
+                 chunk_size: int = DEFAULT_REWRITE_CHUNK,
+                 progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Rewrite the rows of a table in chunks, for data migrations on large databases.
+
+    Rows are read in rowid order a chunk at a time and updated with executemany(),
+    so memory use stays bounded however large the table is. Call it from a
+    migration: the changes are committed with the rest of the upgrade.
+
+    Args:
+        connection (sqlite3.Connection): Connection of the migration
+        table (str): Table to rewrite; it must have a rowid
+        columns (Sequence[str]): Columns read and written
+        transform (Callable): Called with the values of the columns of a row; returns the new
+            values, or None to leave the row unchanged
+        chunk_size (int): Rows per step
+        progress (Callable, optional): Called with the number of rows read so far after each chunk
+
+    Returns:
+        int: Number of rows changed
+    """
+    for name in [table, *columns]:
+        if not name.isidentifier():
+            raise ValueError(f"Invalid identifier: {name!r}")
+    select = f"SELECT rowid, {', '.join(columns)} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT {int(chunk_size)}"
+    update = f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in columns)} WHERE rowid = ?"
+
+    last_rowid = -1 << 63
+    read = changed = 0
+    while True:
+        rows = connection.execute(select, (last_rowid,)).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            values = transform(row[1:])
+            if values is not None:
+                updates.append((*values, row[0]))
+        connection.executemany(update, updates)
+        last_rowid = rows[-1][0]
+        read += len(rows)
+        changed += len(updates)
+        if progress is not None:
+            progress(read)
+    return changed
@@ -0,0 +1,110 @@
+"""
+SQLite connection pool for PyQt6ify Pro.
+
+SQLite connections must not be shared between threads, so the pool opens one
+connection per thread on first use and keeps it for that thread. Connections
+are tuned with the pragmas of the [Database] configuration section; with WAL
+journaling, readers on worker threads never block writes from the GUI thread.
+"""
+
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+from loguru import logger
+
+# Pragmas applied to every connection, in this order, and their [Database] option names
+CONNECTION_PRAGMAS = ('busy_timeout', 'synchronous', 'cache_size', 'mmap_size')
+
+# Prepared statements kept by each connection for reuse
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+def pragmas_from_config(config) -> Dict[str, Any]:
+    """Get the journal mode and connection pragmas of the [Database] section."""
+    return {name: config.value('Database', name) for name in ('journal_mode',) + CONNECTION_PRAGMAS}
+
+
+class ConnectionPool:
+    """Hands each thread its own connection to one database file."""
+
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, Any]] = None,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
+        """
+        Initialize the pool. Connections are opened by the threads that ask for them.
+
+        Args:
+            db_path (str): Database file
+            pragmas (Dict[str, Any], optional): journal_mode and the values of CONNECTION_PRAGMAS;
+                missing ones keep the SQLite defaults
+            cached_statements (int): Prepared statements each connection keeps, so that repeated
+                SQL is not compiled again
+        """
+        self.db_path = db_path
+        self.pragmas = dict(pragmas or {})
+        self.cached_statements = cached_statements
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._journal_checked = False
+
+    @classmethod
+    def from_config(cls, db_path: str, config) -> 'ConnectionPool':
+        """Create a pool tuned by the [Database] section of a Config."""
+        return cls(db_path, pragmas_from_config(config), config.value('Database', 'statement_cache'))
+
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._open()
+            self._local.connection = connection
+        return connection
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and tune a connection for the calling thread."""
+        # Only used by this thread; close_all() may close it from another one
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=self.cached_statements)
+        for name in CONNECTION_PRAGMAS:
+            if self.pragmas.get(name) is not None:
+                connection.execute(f"PRAGMA {name} = {self.pragmas[name]}")
+
+        with self._lock:
+            if not self._journal_checked and self.pragmas.get('journal_mode'):
+                # The journal mode is stored in the file, so setting it once is enough
+                requested = str(self.pragmas['journal_mode']).lower()
+                mode = connection.execute(f"PRAGMA journal_mode = {requested}").fetchone()[0]
+                if mode.lower() != requested:
+                    logger.warning(f"Database journal mode is {mode}, not {requested}: {self.db_path}")
+                self._journal_checked = True
+            # Drop the connections of threads that have ended; threads not started by the threading
+            # module, such as those of a QThreadPool, always look alive and must call close_connection()
+            for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                self._connections.pop(thread).close()
+            self._connections[threading.current_thread()] = connection
+        logger.debug(f"Opened database connection for thread {threading.current_thread().name}")
+        return connection
+
+    def connection_count(self) -> int:
+        """Get the number of open connections."""
+        with self._lock:
+            return len(self._connections)
+
+    def close_connection(self) -> None:
+        """Close the connection of the calling thread, if it has one."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            return
+        self._local.connection = None
+        with self._lock:
+            self._connections.pop(threading.current_thread(), None)
+        connection.close()
+
+    def close_all(self) -> None:
+        """Close every connection. Threads asking again get a new one."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            # Other threads still hold closed connections in their local storage; replace it
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,164 @@
+"""
+Query result cache for PyQt6ify Pro.
+
+Results of read-only queries are kept in an LRU cache keyed by SQL text and
+parameters. The tables a statement reads or writes are found with the SQLite
+authorizer the first time its SQL is seen and remembered afterwards, so later
+runs reuse the connection's prepared statement. A write drops the cached
+results of every query reading one of the tables it touched.
+
+Queries calling non-deterministic functions (random(), datetime('now')) must
+not go through the cache.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+# Default number of cached results
+DEFAULT_MAX_ENTRIES = 256
+
+_READ_ACTIONS = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION, sqlite3.SQLITE_RECURSIVE}
+_WRITE_ACTIONS = {sqlite3.SQLITE_INSERT, sqlite3.SQLITE_UPDATE, sqlite3.SQLITE_DELETE}
+# Actions that neither read cacheable data nor change tables
+_NEUTRAL_ACTIONS = {sqlite3.SQLITE_PRAGMA, sqlite3.SQLITE_TRANSACTION, sqlite3.SQLITE_SAVEPOINT}
+
+
+class StatementInfo(NamedTuple):
+    """Tables used by a statement."""
+
+    reads: FrozenSet[str]
+    writes: Optional[FrozenSet[str]]  # None if it may change anything, e.g. DDL
+    read_only: bool
+
+
+class QueryCache:
+    """LRU cache of query results with table-level invalidation. Safe to share between threads."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries (int): Number of results kept; 0 disables caching but still tracks statements
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, tuple], List[tuple]]' = OrderedDict()
+        self._by_table: Dict[str, Set[Tuple[str, tuple]]] = {}
+        self._statements: Dict[str, StatementInfo] = {}
+        self._generation = 0  # Incremented by every invalidation
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def run(self, connection: sqlite3.Connection, sql: str, params: Any = (), many: bool = False
+            ) -> Tuple[sqlite3.Cursor, StatementInfo]:
+        """
+        Execute a statement without caching and tell which tables it uses.
+
+        The caller invalidates the written tables once its transaction is committed.
+
+        Args:
+            connection (sqlite3.Connection): Connection of the calling thread
+            sql (str): Statement
+            params: Parameters, or a sequence of parameter rows if many is True
+            many (bool): Use executemany()
+        """
+        info = self._statements.get(sql)
+        if info is not None:
+            return (connection.executemany(sql, params) if many else connection.execute(sql, params)), info
+
+        actions = []
+        # Called while the statement is prepared; installing it also re-prepares a cached statement
+        connection.set_authorizer(lambda action, arg1, *_: actions.append((action, arg1)) or sqlite3.SQLITE_OK)
+        try:
+            cursor = connection.executemany(sql, params) if many else connection.execute(sql, params)
+        finally:
+            connection.set_authorizer(None)
+
+        reads = frozenset(table.lower() for action, table in actions if action == sqlite3.SQLITE_READ)
+        writes: Optional[Set[str]] = set()
+        for action, table in actions:
+            if action in _WRITE_ACTIONS:
+                writes.add(table.lower())
+            elif action not in _READ_ACTIONS and action not in _NEUTRAL_ACTIONS:
+                writes = None
+                break
+        read_only = writes == set() and all(action in _READ_ACTIONS for action, _ in actions)
+        info = StatementInfo(reads, frozenset(writes) if writes is not None else None, read_only)
+        with self._lock:
+            self._statements[sql] = info
+        return cursor, info
+
+    def fetch_all(self, connection: sqlite3.Connection, sql: str, params: Any = ()) -> List[tuple]:
+        """
+        Get the rows of a query, from the cache if a write hasn't touched its tables since.
+
+        Args:
+            connection (sqlite3.Connection): Connection of the calling thread
+            sql (str): Query
+            params: Positional or named parameters, with hashable values
+
+        Returns:
+            List[tuple]: The rows; a new list on each call
+        """
+        key = (sql, tuple(sorted(params.items())) if isinstance(params, Mapping) else tuple(params))
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(rows)
+            self.misses += 1
+            generation = self._generation
+
+        cursor, info = self.run(connection, sql, params)
+        rows = cursor.fetchall()
+        if info.read_only and self.max_entries > 0 and not connection.in_transaction:
+            with self._lock:
+                # A write committed while the query ran may not be in these rows
+                if generation == self._generation:
+                    self._store(key, rows, info.reads)
+        return list(rows)
+
+    def _store(self, key: Tuple[str, tuple], rows: List[tuple], tables: FrozenSet[str]) -> None:
+        """Add a result and evict the least recently used ones; the caller holds the lock."""
+        self._entries[key] = rows
+        for table in tables:
+            self._by_table.setdefault(table, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self._unindex(old_key)
+
+    def _unindex(self, key: Tuple[str, tuple]) -> None:
+        """Remove a key from the table index; the caller holds the lock."""
+        for table in self._statements[key[0]].reads:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def invalidate(self, tables: Optional[Iterable[str]]) -> None:
+        """
+        Drop the results of queries reading some tables.
+
+        Args:
+            tables (Iterable[str], optional): Tables changed by a committed write; None drops everything
+        """
+        with self._lock:
+            self._generation += 1
+            if tables is None:
+                self._entries.clear()
+                self._by_table.clear()
+                return
+            for table in tables:
+                for key in self._by_table.pop(table.lower(), ()):
+                    if self._entries.pop(key, None) is not None:
+                        self._unindex(key)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self.invalidate(None)
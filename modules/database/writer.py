@@ -0,0 +1,196 @@
+"""
+Group-commit database writer for PyQt6ify Pro.
+
+Writes go through one thread with its own connection, so components never
+compete for the write lock. Database.bulk_insert() and a SqliteBackend storing
+the configuration are the exceptions: they commit on connections of their own. Writes arriving within a short window are
+committed together in one transaction, which costs one sync instead of one
+per write. Each write runs in its own savepoint, so a failing write is rolled
+back alone and the others still commit. Futures are resolved only once the
+transaction is committed, after the cached query results the group made stale
+have been dropped.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+from loguru import logger
+from modules.database.pool import ConnectionPool
+from modules.database.query_cache import QueryCache
+
+# Seconds to wait for more writes after the first one of a group
+DEFAULT_COMMIT_WINDOW = 0.002
+
+# Writes committed together at most
+DEFAULT_MAX_GROUP = 1000
+
+
+class GroupCommitWriter:
+    """Single writer thread committing queued writes in groups."""
+
+    def __init__(self, pool: ConnectionPool, window: float = DEFAULT_COMMIT_WINDOW,
+                 max_group: int = DEFAULT_MAX_GROUP, cache: Optional[QueryCache] = None):
+        """
+        Initialize the writer. Its thread starts on the first write.
+
+        Args:
+            pool (ConnectionPool): Pool providing the writer's connection
+            window (float): Seconds to wait for more writes before committing; 0 commits
+                whatever is queued at the time
+            max_group (int): Writes committed together at most
+            cache (QueryCache, optional): Query cache to invalidate after each commit
+        """
+        self.pool = pool
+        self.window = window
+        self.max_group = max_group
+        self.cache = cache
+        self._queue: 'queue.Queue[Optional[tuple]]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._unfinished = 0
+        self._idle = threading.Condition(self._lock)
+        self.commits = 0
+
+    def submit(self, func: Callable, *args) -> Future:
+        """
+        Queue a write.
+
+        Args:
+            func (Callable): Called as func(connection, *args) inside the group transaction;
+                it must not commit or roll back
+
+        Returns:
+            Future: Resolves to the return value of func once it is committed
+        """
+        # The tables func writes are unknown, so its commit drops the whole query cache
+        return self._submit(func, args, tracked=False)
+
+    def _submit(self, func: Callable, args: tuple, tracked: bool) -> Future:
+        """Queue a write; tracked functions return their result and the tables they wrote."""
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name='database-writer',
+                                                daemon=True)
+                self._thread.start()
+            self._unfinished += 1
+            self._queue.put((future, func, args, tracked))
+        return future
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        """Queue a statement; the future resolves to the number of changed rows."""
+        return self._submit(self._statement, (sql, params, False), tracked=True)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> Future:
+        """Queue a statement for each row; the future resolves to the number of changed rows."""
+        return self._submit(self._statement, (sql, rows, True), tracked=True)
+
+    def _statement(self, connection, sql: str, params: Any, many: bool) -> Tuple[int, Optional[FrozenSet[str]]]:
+        """Run a statement and return its row count and the tables it wrote."""
+        if self.cache is None:
+            cursor = connection.executemany(sql, params) if many else connection.execute(sql, params)
+            return cursor.rowcount, frozenset()
+        cursor, info = self.cache.run(connection, sql, params, many)
+        return cursor.rowcount, info.writes
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write is committed.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._unfinished, timeout)
+
+    def _collect(self, calls: queue.Queue) -> Tuple[List[tuple], bool]:
+        """Wait for a write, then gather those arriving within the window.
+
+        Returns:
+            tuple: The writes of the group and whether close() was requested
+        """
+        first = calls.get()
+        if first is None:
+            return [], True
+        group = [first]
+        deadline = time.monotonic() + self.window
+        while len(group) < self.max_group:
+            remaining = deadline - time.monotonic()
+            try:
+                item = calls.get(timeout=remaining) if remaining > 0 else calls.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return group, True
+            group.append(item)
+        return group, False
+
+    def _run(self, calls: queue.Queue) -> None:
+        """Commit groups of writes until close() is called."""
+        connection = self.pool.connection()
+        stop = False
+        while not stop:
+            group, stop = self._collect(calls)
+            if group:
+                self._commit(connection, group)
+        self.pool.close_connection()
+
+    def _commit(self, connection, group: List[tuple]) -> None:
+        """Run a group of writes in one transaction and resolve their futures."""
+        # From here on the futures can no longer be cancelled
+        active = [item for item in group if item[0].set_running_or_notify_cancel()]
+        outcomes = []
+        written: Optional[Set[str]] = set()  # None if any table may have changed
+        try:
+            if active:
+                connection.execute("BEGIN IMMEDIATE")
+                for future, func, args, tracked in active:
+                    connection.execute("SAVEPOINT write")
+                    try:
+                        result = func(connection, *args)
+                        if tracked:
+                            result, tables = result
+                            written = written | tables if written is not None and tables is not None else None
+                        else:
+                            written = None
+                        outcomes.append((future, result, None))
+                    except Exception as e:
+                        # Undo this write only; the rest of the group still commits
+                        connection.execute("ROLLBACK TO write")
+                        outcomes.append((future, None, e))
+                    connection.execute("RELEASE write")
+                connection.commit()
+                self.commits += 1
+        except Exception as e:
+            logger.error(f"Database group commit failed: {str(e)}")
+            if connection.in_transaction:
+                connection.rollback()
+            # Nothing of the group was committed
+            outcomes = [(item[0], None, e) for item in active]
+            written = set()
+
+        if self.cache is not None and written != set():
+            # Before the futures resolve, so that acknowledged writes are visible to cached queries
+            self.cache.invalidate(written)
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        with self._idle:
+            self._unfinished -= len(group)
+            self._idle.notify_all()
+
+    def close(self, wait: bool = True) -> None:
+        """Commit the writes already queued, then stop the thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            if thread is None:
+                return
+            self._queue.put(None)
+        if wait:
+            thread.join()
@@ -1,6 +1,10 @@
 """
 Error handling module initialization.
 """
-from modules.error_handling.error_handling import show_error_dialog
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'show_error_dialog': '.error_handling',
+})
 
 __all__ = ['show_error_dialog']
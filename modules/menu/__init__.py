@@ -1,6 +1,10 @@
 """
 Menu module initialization.
 """
-from modules.menu.menu import MenuBar
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'MenuBar': '.menu',
+})
 
 __all__ = ['MenuBar']
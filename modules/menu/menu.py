@@ -4,7 +4,7 @@
 import os
 from PyQt6.QtWidgets import QMenuBar
 from PyQt6.QtGui import QAction, QIcon
-from modules.about import show_about_dialog
+from modules.resources.resources import get_icon_table
 
 class MenuBar(QMenuBar):
     """Main menu bar class for the application."""
@@ -13,6 +13,7 @@ def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'resources', 'icons')
+        self.icon_table = get_icon_table(self.icon_path, getattr(getattr(parent, 'config', None), 'startup_cache', None))
         self.init_menus()
 
     def init_menus(self):
@@ -24,8 +25,8 @@ def init_menus(self):
 
     def get_icon(self, icon_name: str) -> QIcon:
         """Get icon from resources."""
-        icon_path = os.path.join(self.icon_path, f"{icon_name}.png")
-        if os.path.exists(icon_path):
+        icon_path = self.icon_table.get(icon_name)
+        if icon_path:
             return QIcon(icon_path)
         return QIcon()
 
@@ -105,21 +106,25 @@ def create_view_menu(self):
         theme_action.triggered.connect(self.parent.show_theme_dialog)
         view_menu.addAction(theme_action)
 
+        modules = self.parent.config.get_modules_enabled()
+
         # Toolbar
-        toolbar_action = QAction('&Toolbar', self)
-        toolbar_action.setCheckable(True)
-        toolbar_action.setChecked(True)
-        toolbar_action.setStatusTip('Toggle toolbar visibility')
-        toolbar_action.triggered.connect(self.toggle_toolbar)
-        view_menu.addAction(toolbar_action)
+        if modules.get('toolbar', True):
+            toolbar_action = QAction('&Toolbar', self)
+            toolbar_action.setCheckable(True)
+            toolbar_action.setChecked(self.parent.config.value('Window', 'show_toolbar'))
+            toolbar_action.setStatusTip('Toggle toolbar visibility')
+            toolbar_action.triggered.connect(self.toggle_toolbar)
+            view_menu.addAction(toolbar_action)
 
         # Status Bar
-        statusbar_action = QAction('&Status Bar', self)
-        statusbar_action.setCheckable(True)
-        statusbar_action.setChecked(True)
-        statusbar_action.setStatusTip('Toggle status bar visibility')
-        statusbar_action.triggered.connect(self.toggle_statusbar)
-        view_menu.addAction(statusbar_action)
+        if modules.get('status_bar', True):
+            statusbar_action = QAction('&Status Bar', self)
+            statusbar_action.setCheckable(True)
+            statusbar_action.setChecked(self.parent.config.value('Window', 'show_status_bar'))
+            statusbar_action.setStatusTip('Toggle status bar visibility')
+            statusbar_action.triggered.connect(self.toggle_statusbar)
+            view_menu.addAction(statusbar_action)
 
     def create_help_menu(self):
         """Create the Help menu."""
@@ -128,7 +133,7 @@ def create_help_menu(self):
         # About
         about_action = QAction(self.get_icon('about'), '&About', self)
         about_action.setStatusTip('About PyQt6ify Pro')
-        about_action.triggered.connect(lambda: show_about_dialog(self.parent.config))
+        about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
         # Documentation
@@ -136,23 +141,26 @@ def create_help_menu(self):
         docs_action.setStatusTip('View documentation')
         help_menu.addAction(docs_action)
 
+    def show_about(self):
+        """Show the About dialog, importing it on first use."""
+        from modules.about import show_about_dialog
+        show_about_dialog(self.parent.config)
+
     def toggle_toolbar(self, checked):
-        """Toggle toolbar visibility."""
-        if hasattr(self.parent, 'tool_bar'):
+        """Toggle toolbar visibility, building the toolbar the first time it is shown."""
+        if checked and hasattr(self.parent, 'ensure_tool_bar'):
+            self.parent.ensure_tool_bar()
+        if getattr(self.parent, 'tool_bar', None) is not None:
             self.parent.tool_bar.setVisible(checked)
-            # Update config
-            if not self.parent.config.config.has_section('Modules'):
-                self.parent.config.config.add_section('Modules')
-            self.parent.config.config.set('Modules', 'toolbar', str(checked))
-            self.parent.config.save()
+            # Update config; the file is written once the changes settle
+            self.parent.config.set('Window', 'show_toolbar', checked)
 
 
     def toggle_statusbar(self, checked):
-        """Toggle status bar visibility."""
-        if hasattr(self.parent, 'status_bar'):
+        """Toggle status bar visibility, building the status bar the first time it is shown."""
+        if checked and hasattr(self.parent, 'ensure_status_bar'):
+            self.parent.ensure_status_bar()
+        if getattr(self.parent, 'status_bar', None) is not None:
             self.parent.status_bar.setVisible(checked)
-            # Update config
-            if not self.parent.config.config.has_section('Modules'):
-                self.parent.config.config.add_section('Modules')
-            self.parent.config.config.set('Modules', 'status_bar', str(checked))
-            self.parent.config.save()
+            # Update config; the file is written once the changes settle
+            self.parent.config.set('Window', 'show_status_bar', checked)
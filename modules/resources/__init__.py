@@ -1,6 +1,10 @@
 """
 Resources module initialization.
 """
-from modules.resources.resources import create_resources
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'create_resources': '.resources',
+})
 
 __all__ = ['create_resources']
@@ -4,8 +4,9 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from loguru import logger
+from modules.core.startup_cache import StartupCache
 
 class ResourceError(Exception):
     """Exception raised for resource-related errors."""
@@ -35,6 +36,37 @@ def get_resource_path(resource_name: str) -> str:
     except Exception as e:
         raise ResourceError(f'Error accessing resource: {str(e)}') from e
 
+def get_icon_table(icon_dir: str, startup_cache: Optional[StartupCache] = None) -> Dict[str, str]:
+    """
+    Get the paths of the icons in a directory by icon name.
+
+    The table is rebuilt only when the directory's entries change, so looking up
+    an icon does not need to check whether its file exists.
+
+    Args:
+        icon_dir (str): Directory containing the .png icons
+        startup_cache (StartupCache, optional): Warm-start cache holding the table
+
+    Returns:
+        Dict[str, str]: Icon file path by icon name (file name without extension)
+    """
+    def build():
+        table = {}
+        try:
+            with os.scandir(icon_dir) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext.lower() == '.png' and entry.is_file():
+                        table[name] = entry.path
+        except OSError as e:
+            logger.warning(f"Error reading icon directory {icon_dir}: {str(e)}")
+        return table
+
+    if startup_cache is None:
+        return build()
+    # A directory's mtime changes whenever an entry is added, removed or renamed
+    return startup_cache.fetch(f'icons:{icon_dir}', [icon_dir], build)
+
 def create_resources(base_dir: str) -> Optional[str]:
     """
     Create necessary resource directories.
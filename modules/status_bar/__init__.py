@@ -1,6 +1,10 @@
 """
 Status bar module initialization.
 """
-from modules.status_bar.status_bar import StatusBar
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'StatusBar': '.status_bar',
+})
 
 __all__ = ['StatusBar']
@@ -31,6 +31,14 @@ def create_permanent_widgets(self):
             self.message_label = QLabel("Ready")
             self.message_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
             self.addWidget(self.message_label)
+
+            config = getattr(self.parent, 'config', None)
+            if config is not None and hasattr(config, 'subscribe'):
+                self.theme_label = QLabel()
+                self.addPermanentWidget(self.theme_label)
+                self.update_theme_label(config.get('window', 'theme', 'light'))
+                # Follow theme changes without being called by the theme code
+                config.subscribe('window', 'theme', self.update_theme_label, owner=self)
         except Exception as e:
             logger.error(f"Error creating permanent widgets: {str(e)}")
 
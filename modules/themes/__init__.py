@@ -2,3 +2,11 @@
 PyQt6ify Pro Theme System
 Provides theme management and customization capabilities.
 """
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ThemeManager': '.theme_manager',
+    'ThemeDialog': '.theme_dialog',
+})
+
+__all__ = ['ThemeManager', 'ThemeDialog']
@@ -6,26 +6,46 @@
 import os
 import json
 import ctypes
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
 from loguru import logger
 from modules.config.config import Config
+from modules.core.profiler import profiler
+from modules.core.startup_cache import StartupCache
+
+# Map theme keys to palette role names
+PALETTE_ROLES = {
+    "window": "Window",
+    "windowText": "WindowText",
+    "base": "Base",
+    "alternateBase": "AlternateBase",
+    "text": "Text",
+    "button": "Button",
+    "buttonText": "ButtonText",
+    "brightText": "BrightText",
+    "highlight": "Highlight",
+    "highlightedText": "HighlightedText",
+}
 
 
 class ThemeManager:
     """Manages application themes."""
 
-    def __init__(self, app: QApplication, config: Config):
+    @profiler.profile('ThemeManager.__init__')
+    def __init__(self, app: QApplication, config: Config, defer_loading: bool = False):
         """Initialize the theme manager.
 
         Args:
             app (QApplication): The main application instance.
             config (Config): Configuration manager instance.
+            defer_loading (bool): If True, only the built-in themes are available until
+                add_themes() is called with the contents of the themes file.
         """
         self.app = app
         self.config = config
         self.themes = {}
+        self.palettes = {}  # Resolved palette colors by theme name, see build_palette_table()
         self.current_theme = None
         self.default_theme = "dark"
 
@@ -39,38 +59,115 @@ def __init__(self, app: QApplication, config: Config):
 
         # Load themes
         self.themes_file = os.path.join(os.path.dirname(__file__), 'themes.json')
-        self.load_themes()
-        logger.info(f"Loaded {len(self.themes)} themes from {self.themes_file}")
+        if defer_loading:
+            self.themes = self._get_default_themes()
+        else:
+            with profiler.span('ThemeManager.load_themes'):
+                self.load_themes()
 
         # Set default application style
         self.app.setStyle('Fusion')
 
         # Apply the last used theme or default
         theme_name = self.config.get('window', 'theme', self.default_theme)
-        if not self.apply_theme(theme_name):
-            logger.warning(f"Failed to apply theme '{theme_name}'. Falling back to default.")
-            self.apply_theme(self.default_theme)
+        if defer_loading and theme_name not in self.themes:
+            # The theme may come from the themes file; show the default until it is loaded
+            theme_name = self.default_theme
+        with profiler.span('ThemeManager.apply_theme', theme=theme_name):
+            if not self.apply_theme(theme_name):
+                logger.warning(f"Failed to apply theme '{theme_name}'. Falling back to default.")
+                self.apply_theme(self.default_theme)
 
         logger.info("ThemeManager initialized successfully")
 
     def load_themes(self) -> None:
         """Load themes from JSON file."""
-        # Default themes
-        self.themes = {
-            "light": self._get_default_light_theme(),
-            "dark": self._get_default_dark_theme(),
+        self.themes = self._get_default_themes()
+        self.palettes = {}
+        self.add_themes(**self.load_theme_data(self.themes_file, self.config.startup_cache), apply=False)
+
+    @staticmethod
+    def read_themes_file(themes_file: str) -> Dict[str, Dict[str, str]]:
+        """Read custom themes from a JSON file.
+
+        This does not touch Qt and may be called from a worker thread.
+
+        Args:
+            themes_file (str): Path to the themes JSON file.
+
+        Returns:
+            Dict[str, Dict[str, str]]: Themes by name, empty if the file is missing or invalid.
+        """
+        if not os.path.exists(themes_file):
+            logger.warning(f"Themes file not found: {themes_file}")
+            return {}
+        try:
+            with open(themes_file, encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to load themes from {themes_file}: {e}")
+            return {}
+
+    @staticmethod
+    def build_palette_table(theme: Dict[str, str]) -> Dict[str, Any]:
+        """Resolve the colors of a theme so that applying it needs no color parsing.
+
+        Args:
+            theme (Dict[str, str]): Theme definition.
+
+        Returns:
+            Dict[str, Any]: 'colors' as (palette role name, RGBA value) pairs and 'is_dark'.
+        """
+        colors = [(PALETTE_ROLES[key], QColor(color).rgba()) for key, color in theme.items() if key in PALETTE_ROLES]
+        return {
+            'colors': colors,
+            'is_dark': QColor(theme.get("window", "#FFFFFF")).lightness() < 128,
         }
 
-        # Load custom themes from file
-        if os.path.exists(self.themes_file):
-            try:
-                with open(self.themes_file, encoding='utf-8') as f:
-                    custom_themes = json.load(f)
-                    self.themes.update(custom_themes)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to load themes from {self.themes_file}: {e}")
-        else:
-            logger.warning(f"Themes file not found: {self.themes_file}")
+    @classmethod
+    def load_theme_data(cls, themes_file: str, startup_cache: Optional[StartupCache] = None) -> Dict[str, Any]:
+        """Read the themes file and build its palettes, using the startup cache when it is current.
+
+        This may be called from a worker thread.
+
+        Args:
+            themes_file (str): Path to the themes JSON file.
+            startup_cache (StartupCache, optional): Warm-start cache.
+
+        Returns:
+            Dict[str, Any]: 'custom_themes' and their 'palettes', as accepted by add_themes().
+        """
+        def build():
+            themes = cls.read_themes_file(themes_file)
+            return {
+                'custom_themes': themes,
+                'palettes': {name: cls.build_palette_table(theme) for name, theme in themes.items()},
+            }
+
+        if startup_cache is None:
+            return build()
+        # This file is a source too, so that changes to the palette layout invalidate the entry
+        return startup_cache.fetch('themes', [themes_file, __file__], build)
+
+    def add_themes(self, custom_themes: Dict[str, Dict[str, str]],
+                   palettes: Optional[Dict[str, Dict[str, Any]]] = None, apply: bool = True) -> None:
+        """Add themes loaded in the background and apply the configured theme if it was waiting.
+
+        Args:
+            custom_themes (Dict[str, Dict[str, str]]): Themes read by read_themes_file().
+            palettes (Dict[str, Dict[str, Any]], optional): Prebuilt palettes for the themes.
+            apply (bool): If True, apply the configured theme when it is one of the new themes.
+        """
+        self.themes.update(custom_themes)
+        for name in custom_themes:
+            self.palettes.pop(name, None)
+        self.palettes.update(palettes or {})
+        logger.info(f"Loaded {len(self.themes)} themes from {self.themes_file}")
+
+        theme_name = self.config.get('window', 'theme', self.default_theme)
+        if apply and theme_name in custom_themes:
+            # Apply the configured theme now that its colors are known
+            self.apply_theme(theme_name)
 
     def apply_theme(self, theme_name: str, preview_only: bool = False) -> bool:
         """Apply a theme to the application.
@@ -87,39 +184,25 @@ def apply_theme(self, theme_name: str, preview_only: bool = False) -> bool:
             return False
 
         try:
-            theme = self.themes[theme_name]
-            palette = QPalette()
-
-            # Map theme keys to palette roles
-            role_map = {
-                "window": QPalette.ColorRole.Window,
-                "windowText": QPalette.ColorRole.WindowText,
-                "base": QPalette.ColorRole.Base,
-                "alternateBase": QPalette.ColorRole.AlternateBase,
-                "text": QPalette.ColorRole.Text,
-                "button": QPalette.ColorRole.Button,
-                "buttonText": QPalette.ColorRole.ButtonText,
-                "brightText": QPalette.ColorRole.BrightText,
-                "highlight": QPalette.ColorRole.Highlight,
-                "highlightedText": QPalette.ColorRole.HighlightedText,
-            }
+            table = self.palettes.get(theme_name)
+            if table is None:
+                table = self.palettes[theme_name] = self.build_palette_table(self.themes[theme_name])
 
             # Apply theme colors
-            for key, color in theme.items():
-                if key in role_map:
-                    palette.setColor(QPalette.ColorGroup.All, role_map[key], QColor(color))
+            palette = QPalette()
+            for role_name, rgba in table['colors']:
+                palette.setColor(QPalette.ColorGroup.All, getattr(QPalette.ColorRole, role_name), QColor.fromRgba(rgba))
 
             self.app.setPalette(palette)
 
             # Update dark mode based on the window color brightness
-            is_dark = QColor(theme.get("window", "#FFFFFF")).lightness() < 128
+            is_dark = table['is_dark']
             for window in self.app.topLevelWindows():
                 self.set_window_dark_mode(window, is_dark)  # Update the title bar appearance
 
             if not preview_only:
                 self.current_theme = theme_name
                 self.config.set('window', 'theme', theme_name)
-                self.config.save()
                 logger.info(f"Applied theme '{theme_name}' successfully.")
             else:
                 logger.debug(f"Previewed theme '{theme_name}'.")
@@ -169,6 +252,13 @@ def set_window_dark_mode(self, window, is_dark: bool) -> None:
         except Exception as e:
             logger.warning(f"Failed to set dark mode for window: {e}")
 
+    def _get_default_themes(self) -> Dict[str, Dict[str, str]]:
+        """Return the built-in themes."""
+        return {
+            "light": self._get_default_light_theme(),
+            "dark": self._get_default_dark_theme(),
+        }
+
     def _get_default_light_theme(self) -> Dict[str, str]:
         """Return the default light theme."""
         return {
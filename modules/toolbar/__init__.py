@@ -1,6 +1,10 @@
 """
 Toolbar module initialization.
 """
-from modules.toolbar.toolbar import ToolBar
+from modules import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ToolBar': '.toolbar',
+})
 
 __all__ = ['ToolBar']
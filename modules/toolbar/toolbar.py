@@ -5,6 +5,7 @@
 from PyQt6.QtWidgets import QToolBar
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtCore import Qt, QSize
+from modules.resources.resources import get_icon_table
 
 class ToolBar(QToolBar):
     """Main toolbar class."""
@@ -14,6 +15,7 @@ def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'resources', 'icons')
+        self.icon_table = get_icon_table(self.icon_path, getattr(getattr(parent, 'config', None), 'startup_cache', None))
         self.init_toolbar()
 
     def init_toolbar(self):
@@ -27,8 +29,8 @@ def init_toolbar(self):
 
     def get_icon(self, icon_name: str) -> QIcon:
         """Get icon from resources."""
-        icon_path = os.path.join(self.icon_path, f"{icon_name}.png")
-        if os.path.exists(icon_path):
+        icon_path = self.icon_table.get(icon_name)
+        if icon_path:
             return QIcon(icon_path)
         return QIcon()
 
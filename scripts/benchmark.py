@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Headless startup and interaction benchmarks for PyQt6ify Pro
+
+Runs under QT_QPA_PLATFORM=offscreen, stores the results as JSON and compares
+them with a saved baseline. Exits with status 1 when a benchmark regresses by
+more than the allowed threshold.
+
+Usage:
+    python scripts/benchmark.py                    # run and compare with the baseline
+    python scripts/benchmark.py --save-baseline    # run and store the results as the new baseline
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_PATH not in sys.path:
+    sys.path.insert(0, BASE_PATH)
+
+DEFAULT_OUTPUT = os.path.join('logs', 'benchmark_results.json')
+DEFAULT_BASELINE = os.path.join(BASE_PATH, 'scripts', 'benchmark_baseline.json')
+
+BENCHMARKS = {}
+
+def benchmark(name, unit, better='lower'):
+    """Register a benchmark function returning a list of samples."""
+    def decorator(func):
+        BENCHMARKS[name] = {'func': func, 'unit': unit, 'better': better}
+        return func
+    return decorator
+
+def _elapsed_ms(start):
+    """Milliseconds since a time.perf_counter() value."""
+    return (time.perf_counter() - start) * 1000
+
+def _quiet_logging():
+    """Keep benchmark output readable by only showing warnings."""
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+def _application():
+    """Get the shared QApplication, creating it on first use."""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([''])
+
+@benchmark('main.first_frame', 'ms')
+def bench_main_first_frame(repeat, workdir):
+    """Time from main.py starting its imports to the first painted frame, in a fresh process."""
+    samples = []
+    for i in range(repeat):
+        trace_path = os.path.join(workdir, f'startup_{i}.json')
+        subprocess.run([sys.executable, os.path.join(BASE_PATH, 'main.py'),
+                        '--profile-startup', trace_path, '--quit-after-startup',
+                        '--database', os.path.join(workdir, 'first_frame.db')],
+                       cwd=workdir, capture_output=True, check=True, timeout=60)
+        with open(trace_path, encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+        first_frame = next(event for event in events if event['name'] == 'MainWindow.first_frame')
+        samples.append(first_frame['ts'] / 1000)
+    return samples
+
+@benchmark('main_window.construction', 'ms')
+def bench_main_window(repeat, workdir):
+    """Time to construct a MainWindow, including theme setup and component creation."""
+    from modules.config.config import Config
+    from modules.core.main_window import MainWindow
+    app = _application()
+    config = Config(os.path.join(workdir, 'main_window.ini'))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window = MainWindow(config, database_path=os.path.join(workdir, 'main_window.db'))
+        samples.append(_elapsed_ms(start))
+        window.boot.wait()
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return samples
+
+@benchmark('theme.switch', 'ms')
+def bench_theme_switch(repeat, workdir):
+    """Latency of ThemeManager.apply_theme when switching between light and dark."""
+    from modules.config.config import Config
+    from modules.themes.theme_manager import ThemeManager
+    app = _application()
+    manager = ThemeManager(app, Config(os.path.join(workdir, 'theme.ini')))
+    samples = []
+    for i in range(repeat * 10):
+        start = time.perf_counter()
+        manager.apply_theme('light' if i % 2 else 'dark')
+        samples.append(_elapsed_ms(start))
+    return samples
+
+@benchmark('config.set_save', 'ops/s', better='higher')
+def bench_config_set(repeat, workdir):
+    """Throughput of Config.set followed by a final Config.flush, which waits for the file to be written."""
+    from modules.config.config import Config
+    config = Config(os.path.join(workdir, 'throughput.ini'))
+    samples = []
+    for run in range(repeat):
+        count = 200
+        start = time.perf_counter()
+        for i in range(count):
+            config.set('Benchmark', f'key_{i}', f'{run}-{i}')
+        if not config.flush():
+            raise RuntimeError("Configuration was not written")
+        samples.append(count / (time.perf_counter() - start))
+    return samples
+
+@benchmark('config.noop_save', 'ms')
+def bench_config_noop_save(repeat, workdir):
+    """Latency of Config.save when nothing changed, on a large generated configuration."""
+    from modules.config.config import Config
+    config = Config(os.path.join(workdir, 'large.ini'), save_delay=0)
+    with config.batch():
+        for section in range(50):
+            for i in range(100):
+                config.set(f'Generated{section}', f'key_{i}', i)
+    samples = []
+    for _ in range(repeat * 10):
+        start = time.perf_counter()
+        config.save()
+        samples.append(_elapsed_ms(start))
+    return samples
+
+@benchmark('database.open', 'ms')
+def bench_database_open(repeat, workdir):
+    """Time to open the database and create its tables."""
+    from modules.config.config import Config
+    from modules.database.database import Database
+    config = Config(os.path.join(workdir, 'database.ini'))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # Opened in the work directory, never the application database of the source tree
+        database = Database(config, db_path=os.path.join(workdir, 'open.db'))
+        samples.append(_elapsed_ms(start))
+        database.close()
+    return samples
+
+@benchmark('database.bulk_insert', 'rows/s', better='higher')
+def bench_database_bulk_insert(repeat, workdir):
+    """Throughput of Database.bulk_insert on 100k generated rows."""
+    from modules.config.config import Config
+    from modules.database.database import Database
+    database = Database(Config(os.path.join(workdir, 'database.ini')), db_path=os.path.join(workdir, 'bulk.db'))
+    samples = []
+    for run in range(repeat):
+        count = 100000
+        start = time.perf_counter()
+        database.save_settings((f'Bulk.key_{i}', f'{run}-{i}') for i in range(count))
+        samples.append(count / (time.perf_counter() - start))
+    database.close()
+    return samples
+
+def run_benchmarks(names, repeat):
+    """Run the selected benchmarks and return their results."""
+    _quiet_logging()
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names:
+            spec = BENCHMARKS[name]
+            print(f"Running {name}...", flush=True)
+            samples = spec['func'](repeat, workdir)
+            results[name] = {
+                'value': statistics.median(samples),
+                'min': min(samples),
+                'max': max(samples),
+                'samples': len(samples),
+                'unit': spec['unit'],
+                'better': spec['better'],
+            }
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline.
+
+    Returns:
+        list: A description of every benchmark that regressed by more than the threshold
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base['value']:
+            continue
+        change = (result['value'] - base['value']) / base['value']
+        if result['better'] == 'higher':
+            change = -change
+        status = 'REGRESSION' if change > threshold else 'ok'
+        print(f"  {name:28} {result['value']:12.3f} {result['unit']:6} baseline {base['value']:12.3f}  "
+              f"{change:+.1%} {status}")
+        if change > threshold:
+            regressions.append(f"{name} is {change:.1%} worse than the baseline")
+    return regressions
+
+def write_json(path, data):
+    """Write a JSON file, creating its directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+def main():
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="PyQt6ify Pro benchmarks")
+    parser.add_argument('--repeat', type=int, default=5, help="samples per benchmark (default: 5)")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"results file (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline file to compare with")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed relative regression before failing (default: 0.2 = 20%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.only or list(BENCHMARKS), args.repeat)
+    write_json(args.output, results)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\nComparison with {args.baseline} (threshold {args.threshold:.0%}):")
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"FAILED: {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
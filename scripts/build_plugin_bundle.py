@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Build a plugin bundle for PyQt6ify Pro
+
+Compiles a plugin tree into a single '<name>.plugin.zip' archive that
+ModuleLoader loads without reading or compiling the sources. Build bundles
+with the same Python version that runs the application.
+
+Usage:
+    python scripts/build_plugin_bundle.py plugins/tools dist/tools.plugin.zip
+"""
+import argparse
+import os
+import sys
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_PATH not in sys.path:
+    sys.path.insert(0, BASE_PATH)
+
+from modules.core.plugin_bundle import BUNDLE_SUFFIX, BundleError, build_bundle  # noqa: E402
+
+def main():
+    """Build a bundle from the command line."""
+    parser = argparse.ArgumentParser(description="Build a PyQt6ify Pro plugin bundle")
+    parser.add_argument('source', help="directory holding the plugin modules")
+    parser.add_argument('bundle', help=f"archive to write (should end with {BUNDLE_SUFFIX})")
+    parser.add_argument('--optimize', type=int, default=-1, choices=[-1, 0, 1, 2],
+                        help="bytecode optimization level (default: that of the interpreter)")
+    args = parser.parse_args()
+
+    if not args.bundle.endswith(BUNDLE_SUFFIX):
+        print(f"Warning: ModuleLoader only discovers bundles ending with {BUNDLE_SUFFIX}")
+    try:
+        manifest = build_bundle(args.source, args.bundle, args.optimize)
+    except BundleError as e:
+        print(f"FAILED: {e}")
+        return 1
+    print(f"Bundled {len(manifest['modules'])} modules for {manifest['cache_tag']} into {args.bundle}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Unit tests for the configuration storage backends.
+"""
+
+import sqlite3
+import pytest
+from modules.config import Config
+from modules.config.backends import ConfigBackend, SqliteBackend
+
+
+def _rows(db_path):
+    """Read the settings table as a dict."""
+    with sqlite3.connect(db_path) as connection:
+        return dict(connection.execute("SELECT key, value FROM settings"))
+
+
+def test_sqlite_backend_round_trip(tmp_path):
+    """Test that a new store gets the defaults and that values survive a reload."""
+    db_path = str(tmp_path / "settings.db")
+    config = Config(backend=SqliteBackend(db_path), save_delay=0)
+    config.flush()
+    assert config.created
+    assert _rows(db_path)['Window.screen_width'] == '1024'
+
+    config.set('Window', 'screen_width', 1280)
+    config.flush()
+    config.backend.close()
+
+    reloaded = Config(backend=SqliteBackend(db_path))
+    assert not reloaded.created
+    assert reloaded.value('Window', 'screen_width') == 1280
+    reloaded.backend.close()
+
+
+def test_sqlite_backend_writes_only_changed_keys(tmp_path):
+    """Test that a batch upserts its keys in one write and leaves the other rows alone."""
+    db_path = str(tmp_path / "settings.db")
+    config = Config(backend=SqliteBackend(db_path), save_delay=60)
+    config.flush()
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE settings SET value = 'external' WHERE key = 'About.author'")
+    writes = config.writer.writes
+
+    with config.batch():
+        config.set('Window', 'screen_width', 1280)
+        config.set('Window', 'screen_height', 720)
+    config.flush()
+
+    assert config.writer.writes == writes + 1
+    rows = _rows(db_path)
+    assert (rows['Window.screen_width'], rows['Window.screen_height']) == ('1280', '720')
+    assert rows['About.author'] == 'external'
+    config.backend.close()
+
+
+def test_sqlite_backend_reload(tmp_path):
+    """Test that changes committed by another connection are picked up, and our own are not."""
+    db_path = str(tmp_path / "settings.db")
+    config = Config(backend=SqliteBackend(db_path), save_delay=0)
+    config.flush()
+    assert config.reload_from_file() == set()
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE settings SET value = 'dark' WHERE key = 'Window.theme'")
+    assert config.reload_from_file() == {('Window', 'theme')}
+    assert config.get('Window', 'theme') == 'dark'
+    assert not config.is_dirty()
+    config.backend.close()
+
+
+def test_ini_import_export(tmp_path):
+    """Test moving an INI configuration to the database and back."""
+    ini_file = tmp_path / "config.ini"
+    ini_file.write_text("[Window]\nscreen_width = 1600\n\n[Plugins]\nsearch = off\n")
+    db_path = str(tmp_path / "settings.db")
+
+    config = Config(backend=SqliteBackend(db_path), save_delay=60)
+    config.import_ini(str(ini_file))
+    config.flush()
+    assert _rows(db_path)['Plugins.search'] == 'off'
+    assert config.value('Window', 'screen_width') == 1600
+
+    exported = tmp_path / "exported.ini"
+    config.export_ini(str(exported))
+    assert Config(str(exported)).get('Plugins', 'search') == 'off'
+    config.backend.close()
+
+
+def test_incomplete_backend_is_refused():
+    """Test that a backend missing part of the interface fails when created."""
+    class ReadOnlyBackend(ConfigBackend):
+        def load(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        ReadOnlyBackend('settings.ini')
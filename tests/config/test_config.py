@@ -2,7 +2,9 @@
 Unit tests for the configuration module.
 """
 
-from modules.config import Config
+import pytest
+from modules.config import Config, ConfigError
+from modules.config.config import DEFAULT_SAVE_DELAY, MAX_SAVE_RETRIES
 
 
 def test_about_info(tmp_path):
@@ -51,3 +53,179 @@ def test_window_settings(tmp_path):
     loaded = config.get_window_settings()
     assert loaded['screen_width'] == '1280'
     assert loaded['screen_height'] == '720'
+
+
+def test_validate_snapshot(tmp_path):
+    """Test validating a configuration snapshot."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file))
+    assert Config.validate(config.snapshot()) == []
+
+    config.set('Window', 'size', 'wide')
+    config.set('Modules', 'menu', 'maybe')
+    problems = Config.validate(config.snapshot())
+    assert len(problems) == 2
+
+
+def test_delayed_save(tmp_path):
+    """Test that changes are written once, after the save delay or on flush."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=60)
+    config.flush()  # The new file is written in the background
+    written = config_file.stat().st_mtime_ns
+
+    for i in range(100):
+        config.set('Automation', f'key_{i}', i)
+    assert config.has_pending_save()
+    assert config_file.stat().st_mtime_ns == written
+
+    config.flush()
+    assert not config.has_pending_save()
+    assert Config(str(config_file)).get('Automation', 'key_99') == '99'
+
+
+def test_batch(tmp_path):
+    """Test that a batch is saved once and rolled back when it fails."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=0)
+
+    with config.batch():
+        config.set('Window', 'screen_width', 1280)
+        config.set('Window', 'screen_height', 720)
+        assert Config(str(config_file)).get('Window', 'screen_width') == '1024'
+    config.flush()
+    assert Config(str(config_file)).get('Window', 'screen_width') == '1280'
+
+    try:
+        with config.batch():
+            config.set('Window', 'screen_width', 1600)
+            raise RuntimeError("script failed")
+    except RuntimeError:
+        pass
+    assert config.get('Window', 'screen_width') == '1280'
+
+
+def test_dirty_tracking(tmp_path):
+    """Test that only real changes mark keys dirty and bump the version."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=60)
+    assert not config.is_dirty()
+    version = config.version
+
+    config.set('Window', 'theme', config.get('Window', 'theme'))
+    assert not config.is_dirty()
+    assert not config.has_pending_save()
+    assert config.version == version
+
+    config.set('Window', 'theme', 'dark')
+    config.set('Automation', 'runs', 3)
+    assert config.dirty_keys() == {('Window', 'theme'), ('Automation', 'runs')}
+    assert config.dirty_sections() == {'Window', 'Automation'}
+    assert config.version == version + 2
+
+    config.flush()
+    assert not config.is_dirty()
+    assert Config(str(config_file)).get('Automation', 'runs') == '3'
+
+
+def test_failed_write_keeps_keys_dirty(tmp_path):
+    """Test that keys stay dirty when the background write fails and that flush() writes them."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=0)
+    config.flush()
+    config.config_file = str(config_file / "unwritable.ini")
+
+    config.set('Window', 'theme', 'dark')
+    assert not config.flush()
+    assert config.last_write_error is not None
+    assert config.dirty_keys() == {('Window', 'theme')}
+    assert config.has_pending_save()
+
+    config.config_file = str(config_file)
+    assert config.flush()
+    assert config.last_write_error is None
+    assert not config.is_dirty()
+    assert not config.has_pending_save()
+    assert Config(str(config_file)).get('Window', 'theme') == 'dark'
+
+
+def test_failed_write_retries_are_limited(tmp_path):
+    """Test that retries of a failing write back off and stop after MAX_SAVE_RETRIES."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=0)
+    config.flush()
+    config.config_file = str(config_file / "unwritable.ini")
+    config.set('Window', 'theme', 'dark')
+    config.flush()
+    delays = [config._save_timer.interval]
+
+    for _ in range(MAX_SAVE_RETRIES):
+        config.flush()
+        if config.has_pending_save():
+            delays.append(config._save_timer.interval)
+    assert delays == [DEFAULT_SAVE_DELAY * 2 ** attempt for attempt in range(MAX_SAVE_RETRIES)]
+    assert not config.has_pending_save()
+    assert config.is_dirty()
+
+
+def test_typed_values(tmp_path):
+    """Test that typed values follow the schema, fall back on bad data and refresh on set."""
+    config_file = tmp_path / "test_config.ini"
+    config_file.write_text("[Window]\nscreen_width = wide\n\n[window]\nsize = 1280x720\n")
+    config = Config(str(config_file))
+
+    assert config.value('window', 'size') == (1280, 720)
+    assert config.value('Window', 'show_toolbar') is True
+    assert config.value('Window', 'screen_width') == 1024
+    assert config.problems == ["Window.screen_width is not an integer: 'wide'"]
+
+    config.set('window', 'size', '640x480')
+    assert config.value('window', 'size') == (640, 480)
+    config.set('Modules', 'plugins', 'no')
+    assert config.value('Modules', 'plugins') is False
+    assert config.getboolean('Modules', 'plugins') is False
+
+
+def test_invalid_values_read_as_defaults(tmp_path):
+    """Test that the legacy getters and the module switches fall back to the schema default."""
+    config_file = tmp_path / "test_config.ini"
+    config_file.write_text("[Modules]\nmenu = maybe\n\n[Window]\nscreen_width = wide\n\n[Custom]\nflag = maybe\n")
+    config = Config(str(config_file))
+
+    assert config.get_modules_enabled()['menu'] is True
+    assert config.getboolean('Modules', 'menu') is True
+    assert config.getint('Window', 'screen_width') == 1024
+    with pytest.raises(ConfigError):
+        config.getboolean('Custom', 'flag')
+
+
+def test_value_requires_schema(tmp_path):
+    """Test that typed access to an undeclared option is refused."""
+    config = Config(str(tmp_path / "test_config.ini"))
+    with pytest.raises(ConfigError):
+        config.value('Automation', 'runs')
+
+
+def test_reload_from_file(tmp_path):
+    """Test that external edits are applied key by key and local unsaved changes win."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=60)
+    config.set('Window', 'theme', 'dark')
+    config.set('Automation', 'runs', 1)
+    config.flush()
+    assert config.reload_from_file() == set()  # Our own write
+
+    config.set('Window', 'screen_width', 1600)  # Not saved yet
+    text = config_file.read_text()
+    text = text.replace('theme = dark', 'theme = light').replace('runs = 1', 'runs = 2')
+    text = text.replace('screen_width = 1024', 'screen_width = 640')
+    config_file.write_text(text.replace('start_maximized = True\n', ''))
+
+    version = config.version
+    changed = config.reload_from_file()
+    assert changed == {('Window', 'theme'), ('Automation', 'runs')}
+    assert config.get('Window', 'theme') == 'light'
+    assert config.value('Window', 'screen_width') == 1600
+    assert config.value('Window', 'start_maximized') is True  # Removed key falls back to its default
+    assert config.version == version + 2
+    assert config.dirty_keys() == {('Window', 'screen_width')}
@@ -0,0 +1,41 @@
+"""
+Unit tests for configuration change notifications.
+"""
+
+from modules.config import Config
+
+
+def test_burst_is_coalesced(qtbot, tmp_path):
+    """Test that many sets deliver one notification per subscriber with the final value."""
+    config = Config(str(tmp_path / "test_config.ini"), save_delay=60)
+    widths, windows = [], []
+    config.subscribe('Window', 'screen_width', widths.append)
+    config.subscribe('Window', None, windows.append)
+
+    for width in range(800, 1000):
+        config.set('Window', 'screen_width', width)
+    config.set('Window', 'theme', 'dark')
+    assert widths == []  # Delivered on the next event-loop turn
+
+    qtbot.waitUntil(lambda: bool(widths))
+    assert widths == [999]
+    assert windows == [{'screen_width', 'theme'}]
+
+
+def test_signals_and_unsubscribe(qtbot, tmp_path):
+    """Test the notifier signals and that unchanged values and ended subscriptions are silent."""
+    config = Config(str(tmp_path / "test_config.ini"), save_delay=60)
+    calls = []
+    handle = config.subscribe('Application', 'debug', calls.append)
+
+    with qtbot.waitSignal(config.notifier.keyChanged) as blocker:
+        config.set('Application', 'debug', True)
+    assert blocker.args == ['Application', 'debug', True]
+    assert calls == [True]
+
+    config.unsubscribe(handle)
+    with qtbot.waitSignal(config.notifier.sectionChanged) as blocker:
+        config.set('Application', 'debug', False)
+        config.set('Application', 'debug', False)
+    assert blocker.args == ['Application', {'debug'}]
+    assert calls == [True]
@@ -0,0 +1,52 @@
+"""
+Unit tests for configuration file watching.
+"""
+
+import os
+import sqlite3
+from modules.config import Config
+from modules.config.backends import SqliteBackend
+
+
+def test_external_change_is_reloaded(qtbot, tmp_path):
+    """Test that a replaced file is reloaded and announced, and watched again afterwards."""
+    config_file = tmp_path / "test_config.ini"
+    config = Config(str(config_file), save_delay=60)
+    config.flush()
+    watcher = config.watch_file(debounce_ms=10)
+    seen = []
+    config.subscribe('Window', 'theme', seen.append)
+
+    for theme in ('dark', 'blue'):
+        replacement = tmp_path / "replacement.ini"
+        replacement.write_text(config_file.read_text().replace(f"theme = {config.get('Window', 'theme')}",
+                                                               f"theme = {theme}"))
+        with qtbot.waitSignal(watcher.reloaded, timeout=5000) as blocker:
+            os.replace(replacement, config_file)
+        assert blocker.args == [{('Window', 'theme')}]
+        qtbot.waitUntil(lambda theme=theme: seen[-1:] == [theme])
+    watcher.stop()
+
+
+def test_external_commit_in_wal_mode_is_reloaded(qtbot, tmp_path):
+    """Test that a commit that only reaches the -wal file of the database is reloaded."""
+    db_path = str(tmp_path / "settings.db")
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("PRAGMA journal_mode = wal")
+    config = Config(backend=SqliteBackend(db_path), save_delay=60)
+    config.flush()
+    watcher = config.watch_file(debounce_ms=10)
+    # Directory notifications don't report changes to the files inside it on every platform
+    assert os.path.abspath(db_path + '-wal') in watcher.watcher.files()
+
+    other = sqlite3.connect(db_path)
+    try:
+        with qtbot.waitSignal(watcher.reloaded, timeout=5000) as blocker:
+            with other:
+                other.execute("UPDATE settings SET value = 'blue' WHERE key = 'Window.theme'")
+        assert blocker.args == [{('Window', 'theme')}]
+        assert config.get('Window', 'theme') == 'blue'
+    finally:
+        other.close()
+        watcher.stop()
+        config.backend.close()
@@ -0,0 +1,53 @@
+"""
+Unit tests for the background configuration writer.
+"""
+
+import os
+import pytest
+from modules.config.writer import ConfigWriter, write_atomic
+
+
+@pytest.mark.parametrize('durability', ['none', 'normal', 'full'])
+def test_write_atomic(tmp_path, durability):
+    """Test that a file is replaced without leaving a temporary file behind."""
+    path = tmp_path / "settings.ini"
+    path.write_text("old")
+    write_atomic(str(path), "new", durability)
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["settings.ini"]
+
+
+def test_write_atomic_rejects_unknown_level(tmp_path):
+    """Test that an unknown durability level leaves the file untouched."""
+    path = tmp_path / "settings.ini"
+    path.write_text("old")
+    with pytest.raises(ValueError):
+        write_atomic(str(path), "new", "paranoid")
+    assert path.read_text() == "old"
+
+
+def test_writer_merges_and_reports(tmp_path):
+    """Test that queued writes of one file are merged and every callback runs."""
+    path = str(tmp_path / "settings.ini")
+    writer = ConfigWriter()
+    results = []
+    with writer._condition:  # Hold the writer so that both writes are queued together
+        writer.submit(path, "first", callback=lambda error: results.append(('first', error)))
+        writer.submit(path, "second", callback=lambda error: results.append(('second', error)))
+    assert writer.flush(timeout=10)
+    assert not writer.has_pending_writes()
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "second"
+    assert results == [('first', None), ('second', None)]
+    assert writer.writes == 1
+
+
+def test_writer_reports_errors(tmp_path):
+    """Test that a failed write is passed to its callback."""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    writer = ConfigWriter()
+    errors = []
+    writer.submit(str(blocker / "settings.ini"), "data", callback=errors.append)
+    assert writer.flush(timeout=10)
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
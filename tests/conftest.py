@@ -4,6 +4,7 @@
 import os
 import pytest
 from PyQt6.QtWidgets import QApplication
+from modules.config.config import flush_pending_saves
 
 # Use minimal platform for testing
 os.environ['QT_QPA_PLATFORM'] = 'minimal'
@@ -22,3 +23,9 @@ def qapp():
         widget.hide()
         widget.deleteLater()
     app.processEvents()
+
+@pytest.fixture(autouse=True)
+def flush_config_saves():
+    """Write delayed configuration saves before the test's log capture is closed."""
+    yield
+    flush_pending_saves()
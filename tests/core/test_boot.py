@@ -0,0 +1,43 @@
+"""Tests for the background boot sequence."""
+import threading
+from modules.core.boot import BootSequence
+
+def test_boot_results_delivered_on_gui_thread(qtbot):
+    """Test that task callbacks run on the GUI thread while the work runs elsewhere."""
+    gui_thread = threading.get_ident()
+    worker_threads = []
+    callback_threads = []
+
+    def work(value):
+        worker_threads.append(threading.get_ident())
+        return value * 2
+
+    sequence = BootSequence()
+    sequence.add('double', work, 21, on_finished=lambda result: callback_threads.append(threading.get_ident()))
+    with qtbot.waitSignal(sequence.completed, timeout=5000):
+        sequence.start()
+
+    assert sequence.results == {'double': 42}
+    assert worker_threads != [gui_thread]
+    assert callback_threads == [gui_thread]
+
+def test_boot_task_failure(qtbot):
+    """Test that a failing task is reported and does not block completion."""
+    def fail():
+        raise ValueError("broken")
+
+    sequence = BootSequence()
+    sequence.add('broken', fail)
+    sequence.add('ok', lambda: 'done')
+    with qtbot.waitSignal(sequence.completed, timeout=5000):
+        sequence.start()
+
+    assert sequence.errors == {'broken': 'broken'}
+    assert sequence.results == {'ok': 'done'}
+
+def test_empty_boot_sequence(qtbot):
+    """Test that a sequence without tasks completes immediately."""
+    sequence = BootSequence()
+    with qtbot.waitSignal(sequence.completed, timeout=1000):
+        sequence.start()
+    assert not sequence.is_running()
@@ -0,0 +1,80 @@
+"""Test module for plugin hot reload."""
+import sys
+import pytest
+from modules.core.module_loader import ModuleLoader
+
+@pytest.fixture
+def plugins(tmp_path):
+    """Create a base plugin, a plugin importing it and an unrelated plugin."""
+    plugin_dir = tmp_path / "hot_plugins"
+    plugin_dir.mkdir()
+    (plugin_dir / "base.py").write_text("VALUE = 1\nKEEP_ON_RELOAD = ('calls',)\ncalls = []\n")
+    (plugin_dir / "user.py").write_text(
+        "import sys\nbase = sys.modules['hot_plugins.base']\nDOUBLED = base.VALUE * 2\n")
+    (plugin_dir / "other.py").write_text("LOADS = 1\n")
+    loader = ModuleLoader(str(tmp_path))
+    loader.load_all_modules(str(plugin_dir))
+    yield loader, plugin_dir
+    for name in list(sys.modules):
+        if name.startswith('hot_plugins.'):
+            del sys.modules[name]
+
+def test_reload_changed_module_and_dependents(qapp, plugins):
+    """Only the changed module and the modules importing it are reloaded, keeping declared state."""
+    loader, plugin_dir = plugins
+    reloader = loader.enable_hot_reload()
+    base = loader.loaded_modules['hot_plugins.base']
+    other = loader.loaded_modules['hot_plugins.other']
+    base.calls.append('kept')
+    other.LOADS = 5
+
+    assert reloader.get_dependents('hot_plugins.base') == {'hot_plugins.user'}
+
+    (plugin_dir / "base.py").write_text("VALUE = 21\nKEEP_ON_RELOAD = ('calls',)\ncalls = []\n")
+    results = reloader.reload_modules(['hot_plugins.base'])
+
+    assert list(results) == ['hot_plugins.base', 'hot_plugins.user']
+    assert all(results.values())
+    assert loader.loaded_modules['hot_plugins.base'] is base
+    assert base.VALUE == 21
+    assert base.calls == ['kept']
+    assert loader.loaded_modules['hot_plugins.user'].DOUBLED == 42
+    assert other.LOADS == 5
+
+def test_from_import_of_constant_is_a_dependency(qapp, plugins, monkeypatch):
+    """A module importing a plain value from another module is reloaded with it."""
+    loader, plugin_dir = plugins
+    monkeypatch.syspath_prepend(str(plugin_dir.parent))
+    (plugin_dir / "constant_user.py").write_text("from hot_plugins.base import VALUE\nTRIPLED = VALUE * 3\n")
+    try:
+        loader.load_all_modules(str(plugin_dir))
+        reloader = loader.enable_hot_reload()
+        assert 'hot_plugins.constant_user' in reloader.get_dependents('hot_plugins.base')
+
+        (plugin_dir / "base.py").write_text("VALUE = 5\nKEEP_ON_RELOAD = ('calls',)\ncalls = []\n")
+        results = reloader.reload_modules(['hot_plugins.base'])
+        assert results['hot_plugins.constant_user']
+        assert loader.loaded_modules['hot_plugins.constant_user'].TRIPLED == 15
+    finally:
+        sys.modules.pop('hot_plugins', None)
+
+def test_failed_reload_keeps_previous_code(qapp, plugins):
+    """A module whose new code fails keeps its old namespace and its dependents are not reloaded."""
+    loader, plugin_dir = plugins
+    reloader = loader.enable_hot_reload()
+    (plugin_dir / "base.py").write_text("VALUE = \n")
+
+    results = reloader.reload_modules(['hot_plugins.base'])
+
+    assert results == {'hot_plugins.base': False, 'hot_plugins.user': False}
+    assert loader.loaded_modules['hot_plugins.base'].VALUE == 1
+    assert loader.loaded_modules['hot_plugins.user'].DOUBLED == 2
+
+def test_file_change_triggers_reload(qtbot, plugins):
+    """Editing a watched file reloads the module after the debounce delay."""
+    loader, plugin_dir = plugins
+    reloader = loader.enable_hot_reload(debounce_ms=10)
+    with qtbot.waitSignal(reloader.moduleReloaded, timeout=5000,
+                          check_params_cb=lambda name: name == 'hot_plugins.other'):
+        (plugin_dir / "other.py").write_text("LOADS = 2\n")
+    assert loader.loaded_modules['hot_plugins.other'].LOADS == 2
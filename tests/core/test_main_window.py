@@ -5,11 +5,48 @@
 from modules.core.main_window import MainWindow
 from modules.config.config import Config
 
-def test_main_window_creation(qapp):
+def test_main_window_creation(qapp, tmp_path):
     """Test that MainWindow can be created"""
     config = Config()
     config.set('Application', 'Name', 'PyQt6ify Pro')
     config.set('Application', 'Version', '1.0.0')
-    window = MainWindow(config)
+    window = MainWindow(config, database_path=str(tmp_path / "app.db"))
     assert isinstance(window, QMainWindow)
     assert window.windowTitle() == "PyQt6ify Pro 1.0.0"
+
+def test_disabled_components_are_not_built(qapp, tmp_path):
+    """Test that components disabled in the configuration are never created"""
+    config = Config(str(tmp_path / "config.ini"))
+    config.set_modules_enabled({'toolbar': False, 'status_bar': False, 'database': False})
+    window = MainWindow(config)
+    assert window.tool_bar is None
+    assert window.status_bar is None
+    assert window.database is None
+    assert window.ensure_tool_bar() is None
+
+def test_hidden_toolbar_is_built_on_first_show(qapp, tmp_path):
+    """Test that an enabled but hidden toolbar is created when first shown"""
+    config = Config(str(tmp_path / "config.ini"))
+    config.set_modules_enabled({'database': False})
+    config.set('Window', 'show_toolbar', False)
+    window = MainWindow(config)
+    assert window.tool_bar is None
+
+    window.menu_bar.toggle_toolbar(True)
+    assert window.tool_bar is not None
+    assert window.tool_bar.isVisible()
+    assert config.get('Window', 'show_toolbar') == 'True'
+
+def test_background_initialization(qtbot, tmp_path):
+    """Test that the database and theme file are set up after the window is shown"""
+    config = Config(str(tmp_path / "config.ini"))
+    window = MainWindow(config, database_path=str(tmp_path / "app.db"))
+    assert window.isVisible()
+
+    with qtbot.waitSignal(window.bootCompleted, timeout=5000):
+        pass
+    assert window.database is not None
+    assert window.database.connection is not None
+    assert window.database.db_path == str(tmp_path / "app.db")
+    assert 'custom' in window.theme_manager.get_available_themes()
+    window.database.close()
@@ -117,3 +117,156 @@ def test_skip_already_loaded_module(module_loader):
         # Test with sys.modules
         sys.modules[module_name] = mock_module
         module_loader.load_module(test_path)
+
+def test_discover_modules(module_loader, tmp_path):
+    """Test discovering module files in nested directories."""
+    (tmp_path / "plugin_a.py").write_text("")
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "plugin_b.py").write_text("")
+    (tmp_path / "__pycache__").mkdir()
+
+    found = module_loader.discover_modules(str(tmp_path))
+    assert found == [str(tmp_path / "plugin_a.py"), str(tmp_path / "sub" / "plugin_b.py")]
+
+def test_discover_modules_rescans_changed_directories_only(module_loader, tmp_path):
+    """Test that a repeated discovery only lists directories whose entries changed."""
+    (tmp_path / "plugin_a.py").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "plugin_b.py").write_text("")
+    module_loader.discover_modules(str(tmp_path))
+
+    with patch.object(module_loader, '_scan_directory', wraps=module_loader._scan_directory) as mock_scan:
+        module_loader.discover_modules(str(tmp_path))
+        assert mock_scan.call_count == 0
+
+        sub = tmp_path / "sub"
+        (sub / "plugin_c.py").write_text("")
+        stat = os.stat(sub)
+        os.utime(sub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        found = module_loader.discover_modules(str(tmp_path))
+
+        mock_scan.assert_called_once_with(str(sub))
+        assert str(sub / "plugin_c.py") in found
+
+def test_discovery_manifest_on_disk(tmp_path):
+    """Test that the discovery manifest is reused by a new loader through the startup cache."""
+    from modules.core.startup_cache import StartupCache
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "plugin_a.py").write_text("")
+    cache_file = str(tmp_path / "startup.cache")
+
+    loader = ModuleLoader(str(tmp_path), StartupCache(cache_file))
+    loader.discover_modules(str(plugins))
+    loader.startup_cache.flush()
+
+    warm_loader = ModuleLoader(str(tmp_path), StartupCache(cache_file))
+    with patch.object(warm_loader, '_scan_directory') as mock_scan:
+        assert warm_loader.discover_modules(str(plugins)) == [str(plugins / "plugin_a.py")]
+        mock_scan.assert_not_called()
+
+def test_lazy_loading_tracks_touched_modules(tmp_path):
+    """Test that lazy modules only run on first attribute access and are reported as touched."""
+    plugins = tmp_path / "lazy_plugins"
+    plugins.mkdir()
+    (plugins / "used_plugin.py").write_text("import sys\nsys.used_plugin_ran = True\nVALUE = 42\n")
+    (plugins / "unused_plugin.py").write_text("raise RuntimeError('must not run')\n")
+
+    loader = ModuleLoader(str(tmp_path), lazy=True)
+    try:
+        loaded = loader.load_all_modules(str(plugins))
+        assert set(loaded) == {'lazy_plugins.used_plugin', 'lazy_plugins.unused_plugin'}
+        assert not hasattr(sys, 'used_plugin_ran')
+        assert loader.get_usage_report()['touched'] == []
+
+        assert loaded['lazy_plugins.used_plugin'].VALUE == 42
+        assert sys.used_plugin_ran
+        report = loader.get_usage_report()
+        assert report['touched'] == ['lazy_plugins.used_plugin']
+        assert report['untouched'] == ['lazy_plugins.unused_plugin']
+    finally:
+        for name in list(sys.modules):
+            if name.startswith('lazy_plugins.'):
+                del sys.modules[name]
+        if hasattr(sys, 'used_plugin_ran'):
+            del sys.used_plugin_ran
+
+def test_lazy_setup_reads_declarations_from_source(tmp_path):
+    """Test that running setup hooks leaves lazy plugins without a hook unloaded."""
+    plugins = tmp_path / "declared_plugins"
+    plugins.mkdir()
+    (plugins / "storage.py").write_text("raise RuntimeError('must not run')\n")
+    (plugins / "sync.py").write_text("import sys\nDEPENDS = ('storage',)\n\n"
+                                     "def setup():\n    sys.sync_setup_ran = True\n")
+
+    loader = ModuleLoader(str(tmp_path), lazy=True)
+    try:
+        loader.load_all_modules(str(plugins))
+        assert loader.setup_all_modules() == {'declared_plugins.storage': 'ok', 'declared_plugins.sync': 'ok'}
+        assert sys.sync_setup_ran
+        assert loader.get_usage_report()['untouched'] == ['declared_plugins.storage']
+    finally:
+        for name in list(sys.modules):
+            if name.startswith('declared_plugins.'):
+                del sys.modules[name]
+        if hasattr(sys, 'sync_setup_ran'):
+            del sys.sync_setup_ran
+
+def _write_plugin_tree(root):
+    """Create a small plugin tree with a subpackage importing a sibling module."""
+    (root / "sub").mkdir(parents=True)
+    (root / "base.py").write_text("VALUE = 7\n")
+    (root / "sub" / "task.py").write_text("from .. import base\nRESULT = base.VALUE * 6\n")
+
+def test_load_bundle(tmp_path):
+    """Modules of a bundle load from bytecode, named after the bundle location."""
+    from modules.core.plugin_bundle import build_bundle
+    source = tmp_path / "src"
+    _write_plugin_tree(source)
+    plugin_dir = tmp_path / "bundled"
+    manifest = build_bundle(str(source), str(plugin_dir / "tools.plugin.zip"))
+    assert manifest['modules'] == ['base', 'sub.task']
+
+    loader = ModuleLoader(str(tmp_path))
+    try:
+        modules = loader.load_all_modules(str(plugin_dir))
+        assert sorted(modules) == ['bundled.tools.base', 'bundled.tools.sub.task']
+        assert modules['bundled.tools.sub.task'].RESULT == 42
+        assert modules['bundled.tools.base'].__file__.endswith('base.pyc')
+    finally:
+        for name in list(sys.modules):
+            if name.startswith('bundled.'):
+                del sys.modules[name]
+
+def test_load_bundle_lazy(tmp_path):
+    """Bundle modules in lazy mode only run on first access."""
+    from modules.core.plugin_bundle import build_bundle
+    source = tmp_path / "src"
+    _write_plugin_tree(source)
+    build_bundle(str(source), str(tmp_path / "lazybundle" / "tools.plugin.zip"))
+
+    loader = ModuleLoader(str(tmp_path), lazy=True)
+    try:
+        modules = loader.load_all_modules(str(tmp_path / "lazybundle"))
+        assert loader.get_usage_report()['touched'] == []
+        assert modules['lazybundle.tools.base'].VALUE == 7
+        assert loader.get_usage_report()['touched'] == ['lazybundle.tools.base']
+    finally:
+        for name in list(sys.modules):
+            if name.startswith('lazybundle.'):
+                del sys.modules[name]
+
+def test_load_bundle_rejects_other_interpreter(tmp_path):
+    """A bundle built for another interpreter version is not loaded."""
+    import json
+    import zipfile
+    from modules.core.plugin_bundle import MANIFEST_NAME
+    plugin_dir = tmp_path / "foreign"
+    plugin_dir.mkdir()
+    with zipfile.ZipFile(plugin_dir / "old.plugin.zip", 'w') as bundle:
+        bundle.writestr(MANIFEST_NAME, json.dumps({'format': 1, 'cache_tag': 'cpython-27',
+                                                   'packages': [], 'modules': ['base']}))
+    loader = ModuleLoader(str(tmp_path))
+    assert loader.load_all_modules(str(plugin_dir)) == {}
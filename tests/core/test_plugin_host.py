@@ -0,0 +1,95 @@
+"""Test module for the out-of-process plugin host."""
+import sys
+import pytest
+from modules.core.module_loader import ModuleLoader
+from modules.core.plugin_host import PluginHost
+
+PLUGIN_SOURCE = '''
+import os
+COMPUTE_PLUGIN = True
+
+def reverse(payload=None):
+    return bytes(payload)[::-1]
+
+def total(values, payload=None):
+    return sum(values), os.getpid()
+
+def fail():
+    raise ValueError("bad input")
+'''
+
+@pytest.fixture
+def compute_plugin(tmp_path):
+    """Load a compute plugin and a regular plugin."""
+    plugin_dir = tmp_path / "compute_plugins"
+    plugin_dir.mkdir()
+    (plugin_dir / "heavy.py").write_text(PLUGIN_SOURCE)
+    (plugin_dir / "light.py").write_text("VALUE = 1\n")
+    loader = ModuleLoader(str(tmp_path))
+    loader.load_all_modules(str(plugin_dir))
+    yield loader
+    for name in list(sys.modules):
+        if name.startswith('compute_plugins.'):
+            del sys.modules[name]
+
+@pytest.fixture
+def host(qapp):
+    """Create a plugin host with one worker process."""
+    plugin_host = PluginHost(max_workers=1, shared_threshold=1024)
+    yield plugin_host
+    plugin_host.shutdown()
+
+def test_get_compute_plugins(compute_plugin):
+    """Only plugins declaring COMPUTE_PLUGIN are compute plugins."""
+    assert list(compute_plugin.get_compute_plugins()) == ['compute_plugins.heavy']
+
+def test_lazy_compute_plugin_stays_unloaded(qtbot, tmp_path, host):
+    """A lazy compute plugin is found from its source and runs in a worker without loading here."""
+    plugin_dir = tmp_path / "lazy_compute"
+    plugin_dir.mkdir()
+    (plugin_dir / "heavy.py").write_text(PLUGIN_SOURCE)
+    (plugin_dir / "light.py").write_text("VALUE = 1\n")
+    loader = ModuleLoader(str(tmp_path), lazy=True)
+    try:
+        loader.load_all_modules(str(plugin_dir))
+        plugins = loader.get_compute_plugins()
+        assert list(plugins) == ['lazy_compute.heavy']
+
+        with qtbot.waitSignal(host.resultReady, timeout=30000) as blocker:
+            host.submit(plugins['lazy_compute.heavy'], 'total', [1, 2])
+        assert blocker.args[1][0] == 3
+        assert loader.get_usage_report()['touched'] == []
+
+        with qtbot.waitSignal(host.taskFailed, timeout=30000) as blocker:
+            host.submit(loader.loaded_modules['lazy_compute.light'], 'anything')
+        assert "not a compute plugin" in blocker.args[1]
+    finally:
+        for name in list(sys.modules):
+            if name.startswith('lazy_compute.'):
+                del sys.modules[name]
+
+def test_results_arrive_as_signals(qtbot, compute_plugin, host):
+    """Tasks run in another process and deliver small and shared-memory results."""
+    import os
+    module = compute_plugin.loaded_modules['compute_plugins.heavy']
+
+    with qtbot.waitSignal(host.resultReady, timeout=30000) as blocker:
+        task_id = host.submit(module, 'total', [1, 2, 3])
+    assert blocker.args[0] == task_id
+    assert blocker.args[1][0] == 6
+    assert blocker.args[1][1] != os.getpid()
+
+    data = bytes(range(256)) * 64
+    with qtbot.waitSignal(host.resultReady, timeout=30000) as blocker:
+        host.submit(module, 'reverse', payload=data)
+    assert blocker.args[1] == data[::-1]
+    assert host.pending_tasks() == 0
+
+def test_failure_and_validation(qtbot, compute_plugin, host):
+    """Errors raised by plugins arrive as taskFailed; regular plugins are refused."""
+    with qtbot.waitSignal(host.taskFailed, timeout=30000) as blocker:
+        host.submit(compute_plugin.loaded_modules['compute_plugins.heavy'], 'fail')
+    assert "bad input" in blocker.args[1]
+
+    with pytest.raises(ValueError):
+        host.submit(compute_plugin.loaded_modules['compute_plugins.light'], 'anything')
@@ -0,0 +1,121 @@
+"""Tests for dependency-aware plugin setup."""
+import threading
+import time
+import types
+import pytest
+from modules.core.plugin_setup import (
+    PluginDependencyError, build_dependency_graph, read_declarations, run_plugin_setup,
+    SETUP_OK, SETUP_FAILED, SETUP_SKIPPED
+)
+
+def make_plugin(name, depends=(), thread=None, setup=None):
+    """Create a plugin module with the given declarations."""
+    module = types.ModuleType(name)
+    module.DEPENDS = depends
+    if thread:
+        module.SETUP_THREAD = thread
+    if setup:
+        module.setup = setup
+    return module
+
+def test_dependency_graph_resolves_short_names():
+    """Test that dependencies may be given by full or short module name."""
+    modules = {
+        'plugins.storage': make_plugin('plugins.storage'),
+        'plugins.sync': make_plugin('plugins.sync', depends=('storage',)),
+    }
+    assert build_dependency_graph(modules) == {'plugins.storage': [], 'plugins.sync': ['plugins.storage']}
+
+def test_unknown_dependency_rejected():
+    """Test that a dependency on a missing plugin is rejected."""
+    with pytest.raises(PluginDependencyError):
+        build_dependency_graph({'a': make_plugin('a', depends=('missing',))})
+
+def test_ambiguous_dependency_rejected():
+    """Test that a short name matching several plugins is reported as ambiguous."""
+    modules = {
+        'a.storage': make_plugin('a.storage'),
+        'b.storage': make_plugin('b.storage'),
+        'sync': make_plugin('sync', depends=('storage',)),
+    }
+    with pytest.raises(PluginDependencyError, match="ambiguous dependency 'storage': a.storage, b.storage"):
+        build_dependency_graph(modules)
+
+def test_cycle_rejected():
+    """Test that a dependency cycle is rejected before any hook runs."""
+    calls = []
+    modules = {
+        'a': make_plugin('a', depends=('b',), setup=lambda: calls.append('a')),
+        'b': make_plugin('b', depends=('a',), setup=lambda: calls.append('b')),
+    }
+    with pytest.raises(PluginDependencyError, match='cycle'):
+        run_plugin_setup(modules)
+    assert not calls
+
+def test_setup_order_and_threads():
+    """Test that worker hooks run in parallel and GUI hooks run on the calling thread."""
+    gui_thread = threading.get_ident()
+    barrier = threading.Barrier(2, timeout=5)
+    events = []
+
+    def io_hook(name):
+        def setup():
+            barrier.wait()  # Only passes if both worker hooks run at the same time
+            events.append((name, threading.get_ident() != gui_thread))
+        return setup
+
+    def gui_hook():
+        events.append(('ui', threading.get_ident() == gui_thread))
+
+    modules = {
+        'db': make_plugin('db', thread='worker', setup=io_hook('db')),
+        'files': make_plugin('files', thread='worker', setup=io_hook('files')),
+        'ui': make_plugin('ui', depends=('db', 'files'), setup=gui_hook),
+    }
+    results = run_plugin_setup(modules, max_workers=2)
+
+    assert results == {'db': SETUP_OK, 'files': SETUP_OK, 'ui': SETUP_OK}
+    assert events[-1] == ('ui', True)
+    assert all(on_expected_thread for _, on_expected_thread in events)
+
+def test_failed_setup_skips_dependents():
+    """Test that plugins depending on a failed plugin are skipped."""
+    def broken():
+        raise RuntimeError("no database")
+
+    modules = {
+        'db': make_plugin('db', thread='worker', setup=broken),
+        'cache': make_plugin('cache', depends=('db',), setup=lambda: None),
+        'report': make_plugin('report', depends=('cache',), setup=lambda: None),
+        'other': make_plugin('other', setup=lambda: time.sleep(0)),
+    }
+    results = run_plugin_setup(modules)
+    assert results == {'db': SETUP_FAILED, 'cache': SETUP_SKIPPED, 'report': SETUP_SKIPPED, 'other': SETUP_OK}
+
+def test_read_declarations():
+    """Test that literal declarations are read from the source and anything else is refused."""
+    source = "DEPENDS = ('storage',)\nSETUP_THREAD = 'worker'\n\ndef setup():\n    pass\n"
+    assert read_declarations(source) == {'depends': ('storage',), 'setup_thread': 'worker', 'has_setup': True,
+                                         'compute': False}
+    assert read_declarations("COMPUTE_PLUGIN = True\n") == {'depends': (), 'setup_thread': 'gui', 'has_setup': False,
+                                                             'compute': True}
+    assert read_declarations("DEPENDS = tuple(['storage'])\n") is None
+    assert read_declarations("from helpers import setup\n") is None
+    assert read_declarations("from helpers import *\n") is None
+    assert read_declarations("if True:\n    DEPENDS = ('storage',)\n") is None
+
+def test_declared_plugins_are_not_accessed():
+    """Test that a plugin with declarations and no setup() hook is never accessed."""
+    class Untouchable(types.ModuleType):
+        def __getattribute__(self, name):
+            raise AssertionError(f"plugin accessed for {name}")
+
+    calls = []
+    modules = {
+        'plugins.storage': Untouchable('plugins.storage'),
+        'plugins.sync': make_plugin('plugins.sync', depends=('storage',), setup=lambda: calls.append('sync')),
+    }
+    declarations = {'plugins.storage': {'depends': (), 'setup_thread': 'gui', 'has_setup': False}}
+    results = run_plugin_setup(modules, declarations=declarations)
+    assert results == {'plugins.storage': SETUP_OK, 'plugins.sync': SETUP_OK}
+    assert calls == ['sync']
@@ -0,0 +1,72 @@
+"""Tests for the startup profiler."""
+import json
+from modules.core.profiler import StartupProfiler
+
+def test_span_records_complete_event():
+    """Test that a span is recorded as a Chrome trace complete event."""
+    profiler = StartupProfiler()
+    with profiler.span('Config.load', source='test'):
+        pass
+
+    event = profiler.events[0]
+    assert event['name'] == 'Config.load'
+    assert event['ph'] == 'X'
+    assert event['dur'] >= 0
+    assert event['args'] == {'source': 'test'}
+
+def test_profile_decorator():
+    """Test that the decorator records each call and keeps the return value."""
+    profiler = StartupProfiler()
+
+    @profiler.profile('MainWindow.init_ui')
+    def init_ui():
+        return 42
+
+    assert init_ui() == 42
+    assert [event['name'] for event in profiler.events] == ['MainWindow.init_ui']
+
+def test_mark_once():
+    """Test that a mark recorded with once=True is kept only the first time."""
+    profiler = StartupProfiler()
+    profiler.mark('first_frame', once=True)
+    profiler.mark('first_frame', once=True)
+    assert profiler.has_mark('first_frame')
+    assert len(profiler.events) == 1
+
+def test_write_trace(tmp_path):
+    """Test that the trace is written only to the enabled output path."""
+    profiler = StartupProfiler()
+    with profiler.span('main.setup_logging'):
+        pass
+    assert profiler.write() is None
+
+    output = tmp_path / "profile.json"
+    profiler.enable(str(output))
+    assert profiler.write() == str(output)
+
+    trace = json.loads(output.read_text(encoding='utf-8'))
+    assert trace['traceEvents'][0]['name'] == 'main.setup_logging'
+
+def test_finish_stops_recording():
+    """Test that a disabled profiler drops its events at the end of startup and records no more."""
+    profiler = StartupProfiler()
+    with profiler.span('Config.load'):
+        pass
+    profiler.finish()
+    assert profiler.events == []
+
+    with profiler.span('Config.load'):
+        pass
+    profiler.mark('first_frame')
+    assert profiler.events == []
+
+def test_finish_keeps_enabled_trace(tmp_path):
+    """Test that an enabled profiler keeps the startup events for the trace file."""
+    profiler = StartupProfiler()
+    profiler.enable(str(tmp_path / "profile.json"))
+    with profiler.span('main.setup_logging'):
+        pass
+    profiler.finish()
+    with profiler.span('Config.load'):
+        pass
+    assert [event['name'] for event in profiler.events] == ['main.setup_logging']
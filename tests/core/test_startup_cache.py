@@ -0,0 +1,78 @@
+"""Tests for the warm-start cache."""
+import os
+from modules.core.startup_cache import StartupCache
+from modules.config.config import Config
+from modules.resources.resources import get_icon_table
+
+def _touch_later(path):
+    """Move a file's modification time forward so its fingerprint changes."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_fetch_reuses_value_until_source_changes(tmp_path):
+    """Test that a cached value is rebuilt only when a source file changes."""
+    source = tmp_path / "source.txt"
+    source.write_text("one")
+    cache = StartupCache(str(tmp_path / "startup.cache"))
+    calls = []
+
+    def build():
+        calls.append(1)
+        return source.read_text()
+
+    assert cache.fetch('value', [str(source)], build) == "one"
+    assert cache.fetch('value', [str(source)], build) == "one"
+    assert len(calls) == 1
+
+    source.write_text("two!")
+    assert cache.fetch('value', [str(source)], build) == "two!"
+    assert len(calls) == 2
+
+def test_flush_and_reload(tmp_path):
+    """Test that entries survive a round trip through the cache file."""
+    source = tmp_path / "source.txt"
+    source.write_text("data")
+    path = str(tmp_path / "startup.cache")
+
+    cache = StartupCache(path)
+    cache.put('value', [str(source)], {'a': 1})
+    assert cache.flush()
+    assert not cache.flush()
+
+    reloaded = StartupCache(path)
+    assert reloaded.get('value', [str(source)]) == {'a': 1}
+    _touch_later(source)
+    assert reloaded.get('value', [str(source)]) is None
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    """Test that an unreadable cache file behaves like an empty cache."""
+    path = tmp_path / "startup.cache"
+    path.write_bytes(b"not a pickle")
+    cache = StartupCache(str(path))
+    assert cache.get('value', []) is None
+
+def test_config_warm_start(tmp_path):
+    """Test that a warm start reads the configuration from the cache."""
+    config_file = str(tmp_path / "config.ini")
+    cache_file = str(tmp_path / "startup.cache")
+    config = Config(config_file, startup_cache=StartupCache(cache_file))
+    config.set('Application', 'name', 'Cached App')
+    config.flush()
+    config.startup_cache.flush()
+
+    cache = StartupCache(cache_file)
+    warm = Config(config_file, startup_cache=cache)
+    assert cache.hits == 1
+    assert warm.get('Application', 'name') == 'Cached App'
+
+def test_icon_table(tmp_path):
+    """Test that the icon table follows files added to the icon directory."""
+    (tmp_path / "new.png").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("")
+    cache = StartupCache(str(tmp_path / "startup.cache"))
+
+    assert get_icon_table(str(tmp_path), cache) == {'new': str(tmp_path / "new.png")}
+
+    (tmp_path / "open.png").write_bytes(b"")
+    _touch_later(tmp_path)
+    assert set(get_icon_table(str(tmp_path), cache)) == {'new', 'open'}
@@ -0,0 +1,56 @@
+"""
+Guard tests for the modules imported at startup.
+"""
+import json
+import os
+import subprocess
+import sys
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# Modules from the modules package that importing main.py is allowed to load
+STARTUP_MODULES = {
+    'modules',
+    'modules.config',
+    'modules.config.config',
+    'modules.config.schema',
+    'modules.config.backends',
+    'modules.config.writer',
+    'modules.core',
+    'modules.core.boot',
+    'modules.core.main_window',
+    'modules.core.profiler',
+    'modules.core.startup_cache',
+    'modules.themes',
+    'modules.themes.theme_manager',
+}
+
+def _imported_modules(statement):
+    """Run an import statement in a fresh interpreter and return the loaded module names."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=BASE_PATH, capture_output=True,
+                            text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+def test_startup_import_set():
+    """Test that importing the entry point loads no subsystem beyond the allowed set."""
+    imported = _imported_modules('import main')
+    loaded = {name for name in imported if name == 'modules' or name.startswith('modules.')}
+    assert loaded == STARTUP_MODULES
+    assert 'sqlite3' not in imported
+
+def test_package_exports_are_lazy():
+    """Test that importing a subsystem package does not load its implementation."""
+    imported = _imported_modules('import modules.menu, modules.database')
+    assert 'modules.menu.menu' not in imported
+    assert 'modules.database.database' not in imported
+
+def test_lazy_export_access():
+    """Test that exported names and subpackages resolve on first access."""
+    import modules
+    from modules.config import Config
+    from modules.config.config import Config as ConfigClass
+
+    assert Config is ConfigClass
+    assert modules.config.Config is ConfigClass
+    assert 'Config' in dir(modules.config)
@@ -0,0 +1,59 @@
+"""
+Unit tests for the non-blocking database API.
+"""
+
+import time
+from concurrent.futures import CancelledError
+import pytest
+from modules.database.async_db import AsyncDatabase
+from modules.database.pool import ConnectionPool
+
+SLOW_QUERY = ("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000000) "
+              "SELECT COUNT(*) FROM n")
+
+
+@pytest.fixture
+def async_db(qapp, tmp_path):
+    """Create an AsyncDatabase on a new database file."""
+    pool = ConnectionPool(str(tmp_path / "test.db"), {'journal_mode': 'wal'})
+    database = AsyncDatabase(pool)
+    yield database
+    database.close()
+    pool.close_all()
+
+
+def test_results_in_order(qtbot, async_db):
+    """Test that calls run in submission order and report through signals."""
+    async_db.execute("CREATE TABLE items (value INTEGER)")
+    async_db.executemany("INSERT INTO items VALUES (?)", [(i,) for i in range(10)])
+    future = async_db.fetch_one("SELECT COUNT(*), SUM(value) FROM items")
+    with qtbot.waitSignal(async_db.queryFinished, timeout=5000,
+                          check_params_cb=lambda done, _: done is future) as blocker:
+        pass
+    assert blocker.args == [future, (10, 45)]
+
+
+def test_failure_signal(qtbot, async_db):
+    """Test that a failing query reports its error."""
+    with qtbot.waitSignal(async_db.queryFailed, timeout=5000) as blocker:
+        future = async_db.fetch_all("SELECT * FROM missing")
+    assert 'no such table' in blocker.args[1]
+    assert future.exception() is not None
+
+
+def test_cancel_running_query(qtbot, async_db):
+    """Test that a running query is interrupted and a queued one is dropped."""
+    slow = async_db.fetch_one(SLOW_QUERY)
+    queued = async_db.fetch_one("SELECT 1")
+    assert async_db.cancel(queued)
+    deadline = time.monotonic() + 5
+    while not slow.running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with qtbot.waitSignal(async_db.queryFailed, timeout=5000,
+                          check_params_cb=lambda future, _: future is slow) as blocker:
+        assert async_db.cancel(slow)
+    assert blocker.args[1] == "cancelled"
+    with pytest.raises(CancelledError):
+        slow.result()
+    assert async_db.fetch_one("SELECT 2").result(timeout=5) == (2,)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the database module.
+"""
+
+import sqlite3
+import threading
+import pytest
+from modules.config.backends import SqliteBackend
+from modules.config.config import Config
+from modules.database.database import Database
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a database in a temporary directory."""
+    db = Database(Config(str(tmp_path / "config.ini")), auto_init=False)
+    db.db_path = str(tmp_path / "test.db")
+    db.init_db()
+    yield db
+    db.close()
+
+
+def test_init_db_on_worker_thread_closes_its_connection(tmp_path):
+    """Test that setting up the database from a boot task leaves no connection behind."""
+    db = Database(Config(str(tmp_path / "config.ini")), auto_init=False, db_path=str(tmp_path / "test.db"))
+    thread = threading.Thread(target=db.init_db)
+    thread.start()
+    thread.join()
+    assert db.pool.connection_count() == 0
+    assert db.connection.execute("SELECT COUNT(*) FROM settings").fetchone()[0] == 0
+    db.close()
+
+
+def test_bulk_insert_streams_in_chunks(database):
+    """Test that a generator is written in chunks with progress reports."""
+    database.connection.execute("CREATE TABLE samples (id INTEGER PRIMARY KEY, value TEXT)")
+    reports = []
+    rows = ((i, f"value {i}") for i in range(2500))
+    written = database.bulk_insert('samples', ('id', 'value'), rows, chunk_size=1000, progress=reports.append)
+
+    assert written == 2500
+    assert reports == [1000, 2000, 2500]
+    assert database.connection.execute("SELECT COUNT(*) FROM samples").fetchone()[0] == 2500
+
+
+def test_bulk_insert_is_one_transaction(database):
+    """Test that a failing row rolls back the rows before it."""
+    database.connection.execute("CREATE TABLE samples (id INTEGER PRIMARY KEY)")
+    with pytest.raises(sqlite3.IntegrityError):
+        database.bulk_insert('samples', ('id',), [(1,), (2,), (1,)], chunk_size=2)
+    assert database.connection.execute("SELECT COUNT(*) FROM samples").fetchone()[0] == 0
+    with pytest.raises(ValueError):
+        database.bulk_insert('samples; DROP TABLE samples', ('id',), [(1,)])
+
+
+def test_settings_and_themes(database):
+    """Test the upsert helpers of the built-in tables."""
+    database.save_settings({'Window.theme': 'light', 'Window.size': '800x600'})
+    database.save_settings([('Window.theme', 'dark')])
+    database.save_themes({'ocean': {'background': '#003366'}})
+
+    assert dict(database.connection.execute("SELECT key, value FROM settings")) == {
+        'Window.theme': 'dark', 'Window.size': '800x600'}
+    assert database.connection.execute("SELECT data FROM themes").fetchone()[0] == '{"background": "#003366"}'
+
+
+def test_query_cache(database):
+    """Test that query() reuses results until execute() or bulk_insert() change the table."""
+    database.save_settings({'Window.theme': 'light'})
+    sql = "SELECT value FROM settings WHERE key = ?"
+    assert database.query(sql, ('Window.theme',)) == [('light',)]
+    assert database.query(sql, ('Window.theme',)) == [('light',)]
+    assert database.query_cache.hits == 1
+
+    database.execute("UPDATE settings SET value = ? WHERE key = ?", ('dark', 'Window.theme'))
+    assert database.writer.commits == 1
+    assert database.query(sql, ('Window.theme',)) == [('dark',)]
+    database.save_settings({'Window.theme': 'blue'})
+    assert database.query(sql, ('Window.theme',)) == [('blue',)]
+
+
+def test_query_cache_sees_config_saves(tmp_path):
+    """Test that a configuration stored in the database drops the cached queries of its table."""
+    db_path = str(tmp_path / "app.db")
+    config = Config(backend=SqliteBackend(db_path), save_delay=0)
+    config.flush()
+    db = Database(config, db_path=db_path)
+    sql = "SELECT value FROM settings WHERE key = ?"
+    assert db.query(sql, ('window.theme',)) == []
+
+    config.set('window', 'theme', 'light')
+    assert config.flush()
+    assert db.query(sql, ('window.theme',)) == [('light',)]
+    db.close()
+    config.backend.close()
+
+
+def test_async_writes_use_the_writer(qapp, database):
+    """Test that writes of async_db are committed by the group-commit writer, in submission order."""
+    database.async_db.execute("CREATE TABLE items (value INTEGER)")
+    database.async_db.executemany("INSERT INTO items VALUES (?)", [(i,) for i in range(10)])
+    assert database.async_db.fetch_one("SELECT COUNT(*) FROM items").result(timeout=5) == (10,)
+    assert database.writer.commits == 2
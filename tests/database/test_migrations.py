@@ -0,0 +1,64 @@
+"""
+Unit tests for the schema migrations.
+"""
+
+import sqlite3
+import pytest
+from modules.database.migrations import (MIGRATIONS, Migration, MigrationError, migrate, rewrite_rows,
+                                         schema_version)
+
+
+@pytest.fixture
+def connection(tmp_path):
+    """Open a new database file."""
+    db = sqlite3.connect(str(tmp_path / "test.db"))
+    yield db
+    db.close()
+
+
+def test_current_schema_is_a_single_pragma_read(connection):
+    """Test that a migrated database runs nothing but the version check."""
+    assert migrate(connection) == len(MIGRATIONS)
+    assert schema_version(connection) == MIGRATIONS[-1].version
+
+    statements = []
+    connection.set_trace_callback(statements.append)
+    assert migrate(connection) == 0
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_pending_migrations_run_in_one_transaction(connection):
+    """Test that a failing migration rolls back the ones before it."""
+    migrate(connection)
+
+    def fail(db):
+        raise sqlite3.OperationalError("broken migration")
+
+    migrations = MIGRATIONS + [
+        Migration(2, "Add a table", lambda db: db.execute("CREATE TABLE extra (id INTEGER)")),
+        Migration(3, "Fail", fail),
+    ]
+    with pytest.raises(MigrationError):
+        migrate(connection, migrations)
+    assert schema_version(connection) == 1
+    assert connection.execute("SELECT name FROM sqlite_master WHERE name = 'extra'").fetchone() is None
+
+    # A database upgraded by a newer release is not touched
+    with pytest.raises(MigrationError):
+        migrate(connection, [])
+
+
+def test_chunked_rewrite(connection):
+    """Test that a data migration rewrites rows in chunks."""
+    migrate(connection)
+    connection.executemany("INSERT INTO themes VALUES (?, ?)", [(f"theme{i}", "old") for i in range(25)])
+    connection.commit()
+    reports = []
+
+    def upgrade(db):
+        rewrite_rows(db, 'themes', ('data',), lambda row: ('new',) if row[0] == 'old' else None,
+                     chunk_size=10, progress=reports.append)
+
+    assert migrate(connection, MIGRATIONS + [Migration(2, "Rewrite theme data", upgrade)]) == 1
+    assert reports == [10, 20, 25]
+    assert connection.execute("SELECT DISTINCT data FROM themes").fetchall() == [('new',)]
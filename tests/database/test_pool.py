@@ -0,0 +1,74 @@
+"""
+Unit tests for the SQLite connection pool.
+"""
+
+import threading
+from modules.config.config import Config
+from modules.database.pool import ConnectionPool
+
+
+def test_connection_per_thread(tmp_path):
+    """Test that each thread gets its own connection and keeps it."""
+    pool = ConnectionPool(str(tmp_path / "test.db"))
+    main_connection = pool.connection()
+    assert pool.connection() is main_connection
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not main_connection
+    assert pool.connection_count() == 2
+
+    pool.close_all()
+    assert pool.connection_count() == 0
+    assert pool.connection() is not main_connection
+    pool.close_all()
+
+
+def test_pragmas_from_config(tmp_path):
+    """Test that the [Database] section tunes every connection."""
+    config = Config(str(tmp_path / "config.ini"))
+    config.set('Database', 'busy_timeout', 1234)
+    config.set('Database', 'synchronous', 'full')
+    pool = ConnectionPool.from_config(str(tmp_path / "test.db"), config)
+    connection = pool.connection()
+
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 2
+    pool.close_all()
+
+
+def test_reader_does_not_block_writer(tmp_path):
+    """Test that an open read transaction on a worker thread doesn't block writes."""
+    pool = ConnectionPool(str(tmp_path / "test.db"), {'journal_mode': 'wal', 'busy_timeout': 0})
+    writer = pool.connection()
+    writer.execute("CREATE TABLE items (value INTEGER)")
+    writer.execute("INSERT INTO items VALUES (1)")
+    writer.commit()
+
+    reading = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def read():
+        reader = pool.connection()
+        reader.execute("BEGIN")
+        seen.append(reader.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+        reading.set()
+        release.wait(5)
+        seen.append(reader.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+        reader.execute("COMMIT")
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    reading.wait(5)
+    writer.execute("INSERT INTO items VALUES (2)")
+    writer.commit()
+    release.set()
+    thread.join()
+
+    # The reader kept its snapshot while the write went through
+    assert seen == [1, 1]
+    pool.close_all()
@@ -0,0 +1,75 @@
+"""
+Unit tests for the query result cache.
+"""
+
+import sqlite3
+import pytest
+from modules.database.pool import ConnectionPool
+from modules.database.query_cache import QueryCache
+from modules.database.writer import GroupCommitWriter
+
+
+@pytest.fixture
+def connection():
+    """Create an in-memory database with two tables."""
+    db = sqlite3.connect(':memory:')
+    db.executescript("""
+        CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE themes (name TEXT PRIMARY KEY, data TEXT);
+        INSERT INTO settings VALUES ('a', '1');
+        INSERT INTO themes VALUES ('light', '{}');
+    """)
+    yield db
+    db.close()
+
+
+def test_hits_and_table_invalidation(connection):
+    """Test that a write drops only the results of queries reading the written table."""
+    cache = QueryCache()
+    settings_sql = "SELECT value FROM settings WHERE key = ?"
+    assert cache.fetch_all(connection, settings_sql, ('a',)) == [('1',)]
+    assert cache.fetch_all(connection, "SELECT name FROM themes") == [('light',)]
+    assert cache.fetch_all(connection, settings_sql, ('a',)) == [('1',)]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    with connection:
+        _, info = cache.run(connection, "UPDATE settings SET value = ? WHERE key = ?", ('2', 'a'))
+    assert info.writes == {'settings'} and not info.read_only
+    cache.invalidate(info.writes)
+
+    assert len(cache) == 1
+    assert cache.fetch_all(connection, settings_sql, ('a',)) == [('2',)]
+    assert cache.fetch_all(connection, "SELECT name FROM themes") == [('light',)]
+    assert cache.hits == 2
+
+
+def test_lru_eviction_and_uncacheable_statements(connection):
+    """Test the size limit and that only read-only queries are cached."""
+    cache = QueryCache(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.fetch_all(connection, "SELECT value FROM settings WHERE key = ?", (key,))
+    assert len(cache) == 2
+    cache.fetch_all(connection, "PRAGMA user_version")
+    assert len(cache) == 2
+
+    _, info = cache.run(connection, "CREATE TABLE extra (id INTEGER)")
+    assert info.writes is None
+    cache.invalidate(info.writes)
+    assert len(cache) == 0
+
+
+def test_group_commit_invalidates(tmp_path):
+    """Test that writes committed by the writer are visible to cached queries once acknowledged."""
+    pool = ConnectionPool(str(tmp_path / "test.db"), {'journal_mode': 'wal'})
+    pool.connection().execute("CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT)")
+    cache = QueryCache()
+    writer = GroupCommitWriter(pool, cache=cache)
+    query = "SELECT COUNT(*) FROM settings"
+    assert cache.fetch_all(pool.connection(), query) == [(0,)]
+
+    writer.execute("INSERT INTO settings VALUES ('a', '1')").result(timeout=5)
+    assert cache.fetch_all(pool.connection(), query) == [(1,)]
+    writer.submit(lambda db: db.execute("INSERT INTO settings VALUES ('b', '2')")).result(timeout=5)
+    assert cache.fetch_all(pool.connection(), query) == [(2,)]
+    writer.close()
+    pool.close_all()
@@ -0,0 +1,61 @@
+"""
+Unit tests for the group-commit database writer.
+"""
+
+import sqlite3
+import threading
+import pytest
+from modules.database.pool import ConnectionPool
+from modules.database.writer import GroupCommitWriter
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Create a pool on a database with one table."""
+    connection_pool = ConnectionPool(str(tmp_path / "test.db"), {'journal_mode': 'wal', 'busy_timeout': 5000})
+    connection = connection_pool.connection()
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, thread TEXT)")
+    connection.commit()
+    yield connection_pool
+    connection_pool.close_all()
+
+
+def test_concurrent_writes_are_grouped(pool):
+    """Test that writes from several threads share commits and are visible once acknowledged."""
+    writer = GroupCommitWriter(pool, window=0.02)
+    futures = []
+    lock = threading.Lock()
+
+    def write(name):
+        for i in range(50):
+            future = writer.execute("INSERT INTO items (thread) VALUES (?)", (f"{name}-{i}",))
+            with lock:
+                futures.append(future)
+
+    threads = [threading.Thread(target=write, args=(f"t{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(future.result(timeout=5) == 1 for future in futures)
+
+    with sqlite3.connect(pool.db_path) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 200
+    assert writer.commits < 200
+    writer.close()
+
+
+def test_failed_write_is_isolated(pool):
+    """Test that a failing write is rolled back alone and the rest of its group commits."""
+    writer = GroupCommitWriter(pool, window=0.05)
+    first = writer.execute("INSERT INTO items (id, thread) VALUES (1, 'a')")
+    duplicate = writer.executemany("INSERT INTO items (id, thread) VALUES (?, ?)", [(2, 'b'), (1, 'c')])
+    last = writer.execute("INSERT INTO items (id, thread) VALUES (3, 'd')")
+    assert writer.flush(timeout=5)
+
+    assert first.result() == 1 and last.result() == 1
+    assert isinstance(duplicate.exception(), sqlite3.IntegrityError)
+    assert writer.commits == 1
+    with sqlite3.connect(pool.db_path) as reader:
+        assert [row[0] for row in reader.execute("SELECT id FROM items ORDER BY id")] == [1, 3]
+    writer.close()
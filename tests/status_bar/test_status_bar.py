@@ -0,0 +1,16 @@
+"""Test module for the status bar."""
+from PyQt6.QtWidgets import QMainWindow
+from modules.config.config import Config
+from modules.status_bar.status_bar import StatusBar
+
+def test_theme_label_follows_config(qtbot, tmp_path):
+    """Test that the theme label updates when the theme is changed in the configuration."""
+    window = QMainWindow()
+    window.config = Config(str(tmp_path / "config.ini"), save_delay=60)
+    window.config.set('window', 'theme', 'light')
+    status_bar = StatusBar(window)
+    qtbot.addWidget(window)
+    assert status_bar.theme_label.text() == "Theme: Light"
+
+    window.config.set('window', 'theme', 'dark')
+    qtbot.waitUntil(lambda: status_bar.theme_label.text() == "Theme: Dark")